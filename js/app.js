@@ -99,7 +99,7 @@ document.addEventListener('DOMContentLoaded', ()=>{
   // Load entries (teams + drivers) and render
   const driversGrid = document.getElementById('driversGrid');
   const teamsGrid = document.getElementById('teamsGrid');
-  fetch(sitePath('/data/entries-2026.json'))
+  if(driversGrid || teamsGrid) fetch(sitePath('/data/entries-2026.json'))
     .then(r=>r.ok ? r.json() : Promise.reject('Failed to load entries'))
     .then(data=>{
       // Render teams
@@ -138,9 +138,40 @@ document.addEventListener('DOMContentLoaded', ()=>{
       if(driversGrid) driversGrid.innerHTML = '<div class="card">Kon rijders niet laden.</div>';
     });
 
-  // Load stats and fill Top-5 and provide helpers for team/driver pages
-  fetch(sitePath('/data/stats.json'))
-    .then(r=>r.ok ? r.json() : Promise.reject('Failed to load stats'))
+  // stats.json is versioned (scripts/stats_versions.py): a copy cached in localStorage is brought up to date
+  // with a small patch from data/patches/ when one exists; the full file is only fetched for cold or stale caches.
+  const applyPatch = (doc, ops)=>{
+    ops.forEach(op=>{
+      const tokens = op.path.split('/').slice(1).map(t=>t.replace(/~1/g,'/').replace(/~0/g,'~'));
+      if(tokens.length===0){ doc = op.value; return; }
+      let parent = doc;
+      tokens.slice(0,-1).forEach(t=>{ parent = parent[t]; });
+      const last = tokens[tokens.length-1];
+      if(op.op === 'remove'){ if(Array.isArray(parent)) parent.splice(Number(last),1); else delete parent[last]; }
+      else parent[last] = op.value;
+    });
+    return doc;
+  };
+  const fetchFullStats = ()=>fetch(sitePath('/data/stats.json')).then(r=>r.ok ? r.json() : Promise.reject('Failed to load stats'));
+  const loadStats = ()=>{
+    let cached = null;
+    try{ cached = JSON.parse(localStorage.getItem('APP_STATS') || 'null'); }catch(e){}
+    if(!cached || cached.version == null) return fetchFullStats();
+    return fetch(sitePath('/data/stats-version.json'), {cache: 'no-cache'})
+      .then(r=>r.ok ? r.json() : Promise.reject('no stats version'))
+      .then(manifest=>{
+        if(cached.version === manifest.version) return cached;
+        const patch = manifest.patches && manifest.patches[cached.version];
+        if(!patch) return fetchFullStats();
+        return fetch(sitePath('/' + patch)).then(r=>r.ok ? r.json() : Promise.reject('no patch')).then(ops=>applyPatch(cached, ops));
+      })
+      .catch(()=>fetchFullStats());
+  };
+
+  // Load stats and fill Top-5 and provide helpers for team/driver pages.
+  // Generated team/driver pages (scripts/build_pages.py) carry their tables in the HTML (data-prerendered) and skip the fetch.
+  const needsStats = ['topDrivers','topTeams','teamSeasons','driverStats'].some(id=>{ const el = document.getElementById(id); return el && !el.dataset.prerendered; });
+  if(needsStats) loadStats()
     .then(stats=>{
       // Expose full stats to window for pages/tools and add a debug log
       try{
@@ -157,48 +188,52 @@ document.addEventListener('DOMContentLoaded', ()=>{
         const topKeys = Object.keys(stats).length;
         console.debug('Loaded stats:', driverCount, 'drivers,', teamCount, 'teams,', seasonCount, 'seasons — top-level keys:', topKeys);
       }catch(e){ console.debug('Could not attach APP_STATS', e); }
-      // Top 5 drivers by allTime.points
-      const topDriversEl = document.getElementById('topDrivers');
-      if(topDriversEl){
-        topDriversEl.innerHTML = '';
-        const drivers = Object.entries(stats.driverStats).map(([slug, d])=>({slug, name: slug.replace(/-/g,' '), points: d.allTime && d.allTime.points ? d.allTime.points : 0}));
-        drivers.sort((a,b)=>b.points-a.points);
-        // fetch entries once to map nicer display names and team slugs
-        fetch(sitePath('/data/entries-2026.json')).then(r=>r.ok? r.json(): Promise.resolve(null)).then(entries=>{
-          const nameMap = {};
-          if(entries){
-            entries.teams.forEach(t=>{ t.drivers.forEach(dr=>{ const s = dr.name.toLowerCase().replace(/[^a-z0-9]+/g,'-'); nameMap[s] = {display: dr.name, teamSlug: t.slug || t.name.toLowerCase().replace(/[^a-z0-9]+/g,'-')}; }); });
-          }
-          drivers.slice(0,10).forEach(d=>{
-            const li = document.createElement('li');
-            const driverSlug = d.slug;
-            let display = d.slug.split('-').map(s=>s.charAt(0).toUpperCase()+s.slice(1)).join(' ');
-            const map = nameMap[driverSlug];
-            if(map){ display = map.display; const teamSlug = map.teamSlug; li.innerHTML = `<a href="${sitePath(`/teams/${teamSlug}/drivers/${driverSlug}.html`)}">${display}</a> — ${d.points} p`; }
-            else { li.textContent = `${display} — ${d.points} p`; }
-            topDriversEl.appendChild(li);
+      // Top lists; rendered again when live updates arrive
+      const renderTop = ()=>{
+        // Top 5 drivers by allTime.points
+        const topDriversEl = document.getElementById('topDrivers');
+        if(topDriversEl){
+          topDriversEl.innerHTML = '';
+          const drivers = Object.entries(stats.driverStats).map(([slug, d])=>({slug, name: slug.replace(/-/g,' '), points: d.allTime && d.allTime.points ? d.allTime.points : 0}));
+          drivers.sort((a,b)=>b.points-a.points);
+          // fetch entries once to map nicer display names and team slugs
+          fetch(sitePath('/data/entries-2026.json')).then(r=>r.ok? r.json(): Promise.resolve(null)).then(entries=>{
+            const nameMap = {};
+            if(entries){
+              entries.teams.forEach(t=>{ t.drivers.forEach(dr=>{ const s = dr.name.toLowerCase().replace(/[^a-z0-9]+/g,'-'); nameMap[s] = {display: dr.name, teamSlug: t.slug || t.name.toLowerCase().replace(/[^a-z0-9]+/g,'-')}; }); });
+            }
+            drivers.slice(0,10).forEach(d=>{
+              const li = document.createElement('li');
+              const driverSlug = d.slug;
+              let display = d.slug.split('-').map(s=>s.charAt(0).toUpperCase()+s.slice(1)).join(' ');
+              const map = nameMap[driverSlug];
+              if(map){ display = map.display; const teamSlug = map.teamSlug; li.innerHTML = `<a href="${sitePath(`/teams/${teamSlug}/drivers/${driverSlug}.html`)}">${display}</a> — ${d.points} p`; }
+              else { li.textContent = `${display} — ${d.points} p`; }
+              topDriversEl.appendChild(li);
+            });
+          }).catch(()=>{
+            drivers.slice(0,10).forEach(d=>{ const li=document.createElement('li'); const display = d.slug.split('-').map(s=>s.charAt(0).toUpperCase()+s.slice(1)).join(' '); li.textContent = `${display} — ${d.points} p`; topDriversEl.appendChild(li); });
           });
-        }).catch(()=>{
-          drivers.slice(0,10).forEach(d=>{ const li=document.createElement('li'); const display = d.slug.split('-').map(s=>s.charAt(0).toUpperCase()+s.slice(1)).join(' '); li.textContent = `${display} — ${d.points} p`; topDriversEl.appendChild(li); });
-        });
-      }
+        }
 
-      const topTeamsEl = document.getElementById('topTeams');
-      if(topTeamsEl){
-        topTeamsEl.innerHTML = '';
-        const teams = Object.entries(stats.teamStats).map(([slug,t])=>({slug,name:slug.replace(/-/g,' '),points: (t && t.allTime && typeof t.allTime.points === 'number') ? t.allTime.points : (t && t.allTime && parseInt(t.allTime.points) || 0)}));
-        teams.sort((a,b)=>b.points-a.points);
-        teams.slice(0,10).forEach(t=>{
-          const li = document.createElement('li');
-          li.innerHTML = `<a href="${sitePath(`/teams/${t.slug}/index.html`)}">${t.name}</a> — ${t.points} p`;
-          topTeamsEl.appendChild(li);
-        });
-      }
+        const topTeamsEl = document.getElementById('topTeams');
+        if(topTeamsEl){
+          topTeamsEl.innerHTML = '';
+          const teams = Object.entries(stats.teamStats).map(([slug,t])=>({slug,name:slug.replace(/-/g,' '),points: (t && t.allTime && typeof t.allTime.points === 'number') ? t.allTime.points : (t && t.allTime && parseInt(t.allTime.points) || 0)}));
+          teams.sort((a,b)=>b.points-a.points);
+          teams.slice(0,10).forEach(t=>{
+            const li = document.createElement('li');
+            li.innerHTML = `<a href="${sitePath(`/teams/${t.slug}/index.html`)}">${t.name}</a> — ${t.points} p`;
+            topTeamsEl.appendChild(li);
+          });
+        }
+      };
+      renderTop();
 
       // Helper: if on a team page, render season buttons and detailed stats
       const teamSeasonsEl = document.getElementById('teamSeasons');
       const teamStatsEl = document.getElementById('teamStats');
-      if(teamSeasonsEl && teamStatsEl){
+      if(teamSeasonsEl && teamStatsEl && !teamSeasonsEl.dataset.prerendered){
         const teamSlug = teamSeasonsEl.dataset.team;
         const seasons = stats.seasons;
         teamSeasonsEl.innerHTML = '';
@@ -267,7 +302,7 @@ document.addEventListener('DOMContentLoaded', ()=>{
 
       // Driver page helper (supports F1 and optional feeder series like F2/F3)
       const driverStatsEl = document.getElementById('driverStats');
-      if(driverStatsEl){
+      if(driverStatsEl && !driverStatsEl.dataset.prerendered){
         const driverSlug = (driverStatsEl.dataset && driverStatsEl.dataset.driver) || driverStatsEl.getAttribute('data-driver') || '';
         const seasons = stats.seasons;
         const dsourced = stats.driverStats[driverSlug];
@@ -345,6 +380,27 @@ document.addEventListener('DOMContentLoaded', ()=>{
         f1All.click();
       }
 
+      // Race-weekend live mode (scripts/live_weekend.py): with <meta name="f1-live" content="http://host:8002/live">
+      // the live season's rows are pushed as they change and merged into the loaded stats, no stats.json reload.
+      const liveMeta = document.querySelector('meta[name="f1-live"]');
+      if(liveMeta && window.EventSource){
+        const merge = e=>{
+          const ev = JSON.parse(e.data);
+          [['drivers','driverStats'],['teams','teamStats']].forEach(([kind, key])=>{
+            Object.entries(ev[kind] || {}).forEach(([slug, change])=>{
+              const ent = stats[key][slug] = stats[key][slug] || {};
+              ent.bySeason = ent.bySeason || {};
+              ent.allTime = Object.assign(ent.allTime || {}, change.allTime || {});
+              ent.bySeason[ev.season] = Object.assign(ent.bySeason[ev.season] || {}, change.season || {});
+            });
+          });
+          renderTop();
+        };
+        const live = new EventSource(liveMeta.content);
+        live.addEventListener('state', merge);
+        live.addEventListener('delta', merge);
+      }
+
     }).catch(err=>{
       console.error('Stats load error', err);
       const teamStatsEl = document.getElementById('teamStats');
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Exercise `ergast_source.ErgastSource` against local stand-in mirrors.
+
+Starts a few local HTTP servers that answer every path with a small JSON body
+after an injected delay (a base latency plus an occasional slow tail or an
+error), then fires requests through the source in three configurations and
+prints p50/p95/p99/max latency for each:
+
+  single   only the slow, flaky mirror (what a hard-coded host gives us)
+  select   all mirrors, latency-aware selection, no hedging
+  hedged   all mirrors, selection plus hedged duplicates past p95
+
+Usage: python scripts/bench_mirrors.py [--requests 300]
+"""
+import argparse
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ergast_source import ErgastSource, urllib_transport
+
+# (name, base latency s, tail probability, tail latency s, error probability)
+PROFILES = [
+    ('slow-flaky', 0.040, 0.10, 0.600, 0.05),
+    ('fast', 0.010, 0.03, 0.300, 0.00),
+    ('steady', 0.020, 0.00, 0.000, 0.00),
+]
+
+def make_handler(base, tail_p, tail, err_p, rng):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if rng.random() < err_p:
+                self.send_error(503)
+                return
+            time.sleep(base + (tail if rng.random() < tail_p else 0.0))
+            body = b'{"MRData": {"total": "0"}}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+def start_servers(seed):
+    servers = []
+    for i, (name, base, tail_p, tail, err_p) in enumerate(PROFILES):
+        srv = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(base, tail_p, tail, err_p, random.Random(seed + i)))
+        srv.daemon_threads = True
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+        servers.append((name, srv))
+    return servers
+
+def pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def run(source, n):
+    lat = []
+    failed = 0
+    for i in range(n):
+        t0 = time.perf_counter()
+        try:
+            source.get_bytes(f'2023/{i % 24 + 1}/results.json')
+        except Exception:
+            failed += 1
+        lat.append(time.perf_counter() - t0)
+    return lat, failed
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark mirror selection and hedging locally')
+    ap.add_argument('--requests', type=int, default=300)
+    ap.add_argument('--seed', type=int, default=7)
+    args = ap.parse_args(argv)
+
+    servers = start_servers(args.seed)
+    bases = {name: f'http://127.0.0.1:{srv.server_address[1]}' for name, srv in servers}
+    configs = [
+        ('single', ErgastSource([bases['slow-flaky']], transport=urllib_transport, timeout=5)),
+        ('select', ErgastSource(list(bases.values()), transport=urllib_transport, timeout=5, hedge=False)),
+        ('hedged', ErgastSource(list(bases.values()), transport=urllib_transport, timeout=5, hedge=True)),
+    ]
+    print(f'{"config":8} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"max ms":>8} {"failed":>7} {"hedged":>7}')
+    for name, src in configs:
+        lat, failed = run(src, args.requests)
+        ms = [x * 1000 for x in lat]
+        print(f'{name:8} {pct(ms, .5):8.1f} {pct(ms, .95):8.1f} {pct(ms, .99):8.1f} {max(ms):8.1f} {failed:7} {src.hedged:7}')
+    for _, srv in servers:
+        srv.shutdown()
+
+if __name__ == '__main__':
+    main()
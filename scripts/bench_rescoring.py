@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Time rescoring full race history under every points system.
+
+Writes a synthetic results cache (1950-2026, ~20 races of 24 cars a season,
+fastest laps from 2004) to a temp directory, loads it with
+`rescoring.load_results`, then reports per system the time of
+`ResultColumns.score` against a plain per-row Python loop over the same data,
+and checks that both give the same totals.
+
+Usage: python scripts/bench_rescoring.py [--seasons 1950-2026] [--cars 24] [--seed 7]
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from f1data import parse_years
+from rescoring import SYSTEMS, load_results, lookup_table
+
+def synthetic_results(season, cars, rng, pool):
+    races = []
+    for rnd in range(1, rng.randint(8, 24) + 1):
+        grid = rng.sample(pool, cars)
+        fastest = rng.randrange(cars)
+        rows = []
+        for i, (driver, team) in enumerate(grid):
+            row = {'position': str(i + 1), 'positionText': str(i + 1) if rng.random() > 0.15 else 'R',
+                   'Driver': {'driverId': driver}, 'Constructor': {'constructorId': team}}
+            if season >= 2004 and i == fastest:
+                row['FastestLap'] = {'rank': '1'}
+            rows.append(row)
+        races.append({'season': str(season), 'round': str(rnd), 'Results': rows})
+    return {'MRData': {'RaceTable': {'season': str(season), 'Races': races}}}
+
+def naive(rows_by_slug, system):
+    """Reference: one dict lookup per row."""
+    points = {i + 1: p for i, p in enumerate(system['points'])}
+    top = system.get('fastestLapTop') or 10 ** 6
+    out = {}
+    for slug, rows in rows_by_slug.items():
+        total = 0.0
+        for pos, fastest in rows:
+            total += points.get(pos, 0)
+            if fastest and pos and pos <= top:
+                total += system.get('fastestLap') or 0
+        out[slug] = total
+    return out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark vectorized rescoring against a per-row loop')
+    ap.add_argument('--seasons', type=parse_years, default=parse_years('1950-2026'))
+    ap.add_argument('--cars', type=int, default=24)
+    ap.add_argument('--seed', type=int, default=7)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    pool = [(f'driver_{i}', f'team_{i % 40}') for i in range(900)]
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for s in args.seasons:
+            window = pool[(s - args.seasons[0]) * 10 % 800:][:args.cars * 3]
+            (tmp / f'ergast_{s}_results.json').write_text(json.dumps(synthetic_results(s, args.cars, rng, window)))
+        t0 = time.perf_counter()
+        drivers, teams, races = load_results(args.seasons, tmp)
+        loaded = time.perf_counter() - t0
+    print(f'{races} races, {len(drivers)} driver rows, {len(drivers.slugs)} drivers; load {loaded * 1000:.0f} ms')
+    rows = {slug: list(zip(drivers.position[lo:hi], drivers.fastest[lo:hi]))
+            for slug, lo, hi in zip(drivers.slugs, drivers.offsets, drivers.offsets[1:])}
+    ok = True
+    for name, system in SYSTEMS.items():
+        t0 = time.perf_counter()
+        totals = drivers.score(lookup_table(system))
+        fast = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        ref = naive(rows, system)
+        slow = time.perf_counter() - t0
+        same = all(abs(ref[s] - t) < 1e-6 for s, t in zip(drivers.slugs, totals))
+        ok = ok and same
+        print(f'{name:9} score {fast * 1000:6.2f} ms   per-row loop {slow * 1000:6.2f} ms   {"ok" if same else "MISMATCH"}')
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    raise SystemExit(main())
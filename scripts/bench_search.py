@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Measure the prefix search index: size, build time and lookup latency.
+
+Builds the index from the current data (optionally padded with synthetic
+drivers to approximate a full-history `stats.json`), then:
+
+- reports item count, JSON size and gzip size against the 50 KB budget.
+  The budget is the compressed transfer size (the index is served gzip
+  encoded, like the other data files), not the raw JSON: at full-history
+  size the raw index is about 75 KB and its gzip about 26 KB
+- times a lookup for every prefix of every indexed term (p50/p95/p99/max)
+- checks each result against a brute-force scan over all items' terms
+
+Usage: python scripts/bench_search.py [--synthetic 850] [--k 8] [--seed 7]
+"""
+import argparse
+import gzip
+import json
+import random
+import time
+
+from search_index import SearchIndex, build, collect, fold
+
+# compressed transfer size of data/search-index.json; the raw JSON is not budgeted
+BUDGET = 50 * 1024
+SYLLABLES = ['ma', 'ro', 'ni', 'ka', 'lo', 'ber', 'gar', 'vet', 'sen', 'ton', 'ri', 'chel', 'an',
+             'do', 'mi', 'le', 'han', 'ss', 'pi', 'que', 'ström', 'ñez', 'ël', 'go']
+
+def synthetic_drivers(n, rng):
+    def word():
+        return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+    out = []
+    for _ in range(n):
+        given, family = word(), word()
+        name = f'{given} {family}'
+        out.append((round(rng.paretovariate(1.2) * 10, 1), name, 'd', None,
+                    {fold(given), fold(family), fold(name), fold(family[:3])}))
+    return out
+
+def pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark the prefix search index')
+    ap.add_argument('--synthetic', type=int, default=850, help='extra fake drivers (0 = real data only)')
+    ap.add_argument('--k', type=int, default=8)
+    ap.add_argument('--seed', type=int, default=7)
+    args = ap.parse_args(argv)
+
+    items = collect() + synthetic_drivers(args.synthetic, random.Random(args.seed))
+    t0 = time.perf_counter()
+    data = build(items, k=args.k)
+    built = time.perf_counter() - t0
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf8')
+    packed = gzip.compress(raw, 9)
+    print(f'items: {len(items)}  build: {built * 1000:.1f} ms')
+    print(f'size: {len(raw)} bytes json, {len(packed)} bytes gzip (transfer budget {BUDGET}: '
+          f'{"ok" if len(packed) <= BUDGET else "OVER"})')
+
+    index = SearchIndex(json.loads(raw))
+    ranked = sorted(items, key=lambda it: (-it[0], it[2], it[1]))
+    prefixes = sorted({t[:i] for it in ranked for t in it[4] for i in range(1, len(t) + 1)})
+    times = []
+    wrong = 0
+    for p in prefixes:
+        t0 = time.perf_counter()
+        got = index.ids(p)
+        times.append(time.perf_counter() - t0)
+        want = [i for i, it in enumerate(ranked) if any(t.startswith(p) for t in it[4])][:args.k]
+        wrong += got != want
+    us = [t * 1e6 for t in times]
+    print(f'lookups: {len(prefixes)} prefixes  p50 {pct(us, 0.5):.1f} us  p95 {pct(us, 0.95):.1f} us  '
+          f'p99 {pct(us, 0.99):.1f} us  max {max(us):.1f} us')
+    print('mismatches vs brute force:', wrong)
+    return 1 if wrong else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
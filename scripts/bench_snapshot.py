@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compare loading `stats.json` with opening the binary snapshot.
+
+Builds a synthetic full-history dataset (by default ~870 drivers and ~210
+teams over 1950-2026, written the way the pipeline writes `stats.json`),
+stores it as JSON and as `stats_binary` snapshot in a temp directory, then
+reports:
+
+- file sizes
+- `json.loads` and `StatsModel.load` of the whole file
+- opening the snapshot and reading one driver, from a fresh reader each time
+- p50/p95/p99 of single-driver and single-season lookups on an open reader
+
+Usage: python scripts/bench_snapshot.py [--drivers 870] [--teams 210] [--seed 7]
+"""
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from pipeline_io import write_json
+from stats_binary import BinaryStats, write
+from stats_model import StatsModel
+
+def synthetic_stats(n_drivers, n_teams, rng):
+    teams = {}
+    names = [f'team-{i}' for i in range(n_teams)]
+    for slug in names:
+        first = rng.randint(1950, 2020)
+        by_season = {str(y): {'points': rng.randint(0, 600), 'wins': rng.randint(0, 15), 'podiums': rng.randint(0, 30),
+                              'position': rng.randint(1, 12)}
+                     for y in range(first, min(2026, first + rng.randint(1, 40)) + 1)}
+        teams[slug] = {'aliases': [slug.replace('-', ' ')], 'bySeason': by_season,
+                       'allTime': {'points': sum(s['points'] for s in by_season.values()),
+                                   'wins': sum(s['wins'] for s in by_season.values())}}
+    drivers = {}
+    for i in range(n_drivers):
+        first = rng.randint(1950, 2025)
+        by_season = {}
+        for y in range(first, min(2026, first + rng.randint(0, 15)) + 1):
+            by_season[str(y)] = {'team': rng.choice(names).replace('-', ' ').title(),
+                                 'points': rng.choice([rng.randint(0, 400), rng.randint(0, 800) / 2]),
+                                 'wins': rng.randint(0, 10), 'podiums': rng.randint(0, 20), 'poles': rng.randint(0, 10),
+                                 'fastestLaps': rng.randint(0, 8), 'races': rng.randint(1, 24),
+                                 'position': rng.choice([None, rng.randint(1, 25)])}
+        if rng.random() < 0.1:
+            by_season[f'{first - 1}_f2'] = {'team': 'Feeder', 'points': rng.randint(0, 200), 'position': 3}
+        drivers[f'driver-{i}'] = {'bySeason': by_season,
+                                  'allTime': {'points': sum(s['points'] for s in by_season.values()),
+                                              'wins': sum(s.get('wins', 0) for s in by_season.values()),
+                                              'championships': rng.randint(0, 2), 'winRate': rng.random()}}
+    return {'seasons': list(range(1950, 2027)), 'driverStats': drivers, 'teamStats': teams, 'version': 1}
+
+def pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+def timed(fn, n):
+    out = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1e6)
+    return out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Benchmark stats.json parsing against the mmap snapshot')
+    ap.add_argument('--drivers', type=int, default=870)
+    ap.add_argument('--teams', type=int, default=210)
+    ap.add_argument('--seed', type=int, default=7)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    stats = synthetic_stats(args.drivers, args.teams, rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        js, bin_path = Path(tmp) / 'stats.json', Path(tmp) / 'stats.bin'
+        write_json(js, stats)
+        model = StatsModel.load(js)
+        write(model, bin_path)
+        records = sum(len(e) for e in model.drivers.values()) + sum(len(e) for e in model.teams.values())
+        print(f'{len(model.drivers)} drivers, {len(model.teams)} teams, {records} season records')
+        print(f'size: json {js.stat().st_size} bytes, snapshot {bin_path.stat().st_size} bytes')
+
+        slugs = list(model.drivers)
+        loads = timed(lambda: json.loads(js.read_text(encoding='utf8')), 5)
+        full = timed(lambda: StatsModel.load(js), 5)
+
+        def cold():
+            with BinaryStats(bin_path) as snap:
+                snap.driver(rng.choice(slugs))
+        opened = timed(cold, 200)
+        print(f'json.loads:            {min(loads) / 1000:8.1f} ms')
+        print(f'StatsModel.load:       {min(full) / 1000:8.1f} ms')
+        print(f'open + one driver:     {pct(opened, .5):8.1f} us p50  {pct(opened, .95):8.1f} us p95')
+
+        with BinaryStats(bin_path) as snap:
+            ok = snap.to_dict() == model.to_dict()
+            picks = [rng.choice(slugs) for _ in range(5000)]
+            it = iter(picks)
+            drv = timed(lambda: snap.driver(next(it)), len(picks))
+            pairs = iter([(s, rng.choice(model.drivers[s].years or [2000])) for s in picks])
+            sea = timed(lambda: snap.season('drivers', *next(pairs)), len(picks))
+        for name, us in (('driver()', drv), ('season()', sea)):
+            print(f'{name:22} {pct(us, .5):8.1f} us p50  {pct(us, .95):8.1f} us p95  {pct(us, .99):8.1f} us p99')
+        print('round trip:', 'ok' if ok else 'MISMATCH')
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    raise SystemExit(main())
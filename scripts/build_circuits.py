@@ -0,0 +1,217 @@
+"""Per-circuit history shards joined to the season calendar.
+
+Usage:
+  python scripts/build_circuits.py
+
+Reads every cached season of race results and qualifying
+(`data/ergast/ergast_{season}_{results,qualifying}.json[.gz]`) once and groups
+the rows by Ergast `circuitId`. For each circuit it writes
+`data/circuits/{id}.json`:
+
+  races         one entry per Grand Prix held there (winner, team, pole)
+  drivers       per-driver track record (starts, wins, podiums, poles,
+                points, best finish)
+  constructors  per-constructor wins, podiums and poles
+  topDrivers / topConstructors   most successful, by wins then podiums
+
+`data/circuits/index.json` maps each calendar round to its circuit id.
+Calendar entries are matched to Ergast circuits by the words they share
+(circuit name and city vs. circuit name and locality) plus the country; a
+calendar race may also carry an explicit `circuitId`. A circuit with no
+Ergast history yet (a new venue) still gets a shard with empty history.
+Ids use the site's slug style (`red_bull_ring` -> `red-bull-ring`).
+"""
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from pipeline_io import cache_exists, read_cached_json, slug_of, write_json
+from search_index import fold
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+ERGAST_DIR = DATA / 'ergast'
+CALENDAR = DATA / 'calendar-2026.json'
+OUT_DIR = DATA / 'circuits'
+TOP = 10
+
+# words that say nothing about which circuit is meant
+STOPWORDS = {'circuit', 'international', 'street', 'grand', 'prix', 'de', 'di', 'of', 'the', 'city',
+             'autodromo', 'autodrome', 'park', 'nazionale', 'gp'}
+COUNTRY_ALIASES = {'uk': 'unitedkingdom', 'usa': 'unitedstates', 'us': 'unitedstates',
+                   'uae': 'unitedarabemirates', 'korea': 'southkorea'}
+
+def words(*texts):
+    out = set()
+    for t in texts:
+        for w in re.split(r'[\s,\-/()]+', str(t or '')):
+            w = fold(w)
+            if w and w not in STOPWORDS:
+                out.add(w)
+    return out
+
+def slugify(name):
+    return '-'.join(w for w in (fold(p) for p in re.split(r'[\s,\-/()]+', str(name or ''))) if w)
+
+def country_key(name):
+    c = fold(name)
+    return COUNTRY_ALIASES.get(c, c)
+
+def cached_seasons(ergast_dir=ERGAST_DIR):
+    seasons = set()
+    for p in ergast_dir.glob('ergast_*_results.json*'):
+        part = p.name.split('_')[1]
+        if part.isdigit():
+            seasons.add(int(part))
+    return sorted(seasons)
+
+# -- grouped aggregation --------------------------------------------------------
+
+def _int(v):
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+def aggregate(seasons, ergast_dir=ERGAST_DIR):
+    """Group race and qualifying rows by circuit in one pass per payload.
+
+    Returns `(circuits, races, drivers, constructors)`, all keyed by circuit
+    slug: Ergast circuit info, `(season, round) -> race summary`, and the
+    per-driver / per-constructor tallies at that circuit.
+    """
+    circuits = {}
+    races = defaultdict(dict)                               # circuit -> (season, round) -> summary
+    drivers = defaultdict(lambda: defaultdict(lambda: {'starts': 0, 'wins': 0, 'podiums': 0, 'poles': 0,
+                                                        'points': 0.0, 'bestFinish': None}))
+    ctors = defaultdict(lambda: defaultdict(lambda: {'starts': 0, 'wins': 0, 'podiums': 0, 'poles': 0}))
+    for s in seasons:
+        res = ergast_dir / f'ergast_{s}_results.json'
+        qual = ergast_dir / f'ergast_{s}_qualifying.json'
+        for path, key in ((res, 'Results'), (qual, 'QualifyingResults')):
+            if not cache_exists(path):
+                continue
+            payload = read_cached_json(path)
+            for race in payload.get('MRData', {}).get('RaceTable', {}).get('Races', []):
+                circ = race.get('Circuit') or {}
+                cid = slug_of(circ.get('circuitId'))
+                if not cid:
+                    continue
+                loc = circ.get('Location') or {}
+                circuits[cid] = {'circuitId': circ.get('circuitId'), 'name': circ.get('circuitName'),
+                                 'locality': loc.get('locality'), 'country': loc.get('country'),
+                                 'lat': loc.get('lat'), 'long': loc.get('long')}
+                rkey = (int(race.get('season')), int(race.get('round')))
+                summary = races[cid].setdefault(rkey, {'season': rkey[0], 'round': rkey[1],
+                                                       'raceName': race.get('raceName'), 'date': race.get('date'),
+                                                       'winner': None, 'winnerTeam': None, 'pole': None})
+                for row in race.get(key, []):
+                    d = slug_of((row.get('Driver') or {}).get('driverId'))
+                    c = slug_of((row.get('Constructor') or {}).get('constructorId'))
+                    pos = _int(row.get('position'))
+                    if key == 'QualifyingResults':
+                        if pos == 1:
+                            summary['pole'] = d
+                            drivers[cid][d]['poles'] += 1
+                            if c:
+                                ctors[cid][c]['poles'] += 1
+                        continue
+                    dr = drivers[cid][d]
+                    dr['starts'] += 1
+                    dr['points'] += float(row.get('points') or 0)
+                    if pos is not None and row.get('positionText', str(pos)).isdigit():
+                        if dr['bestFinish'] is None or pos < dr['bestFinish']:
+                            dr['bestFinish'] = pos
+                    if c:
+                        ctors[cid][c]['starts'] += 1
+                    if pos == 1:
+                        summary['winner'], summary['winnerTeam'] = d, c
+                        dr['wins'] += 1
+                        if c:
+                            ctors[cid][c]['wins'] += 1
+                    if pos is not None and pos <= 3:
+                        dr['podiums'] += 1
+                        if c:
+                            ctors[cid][c]['podiums'] += 1
+    return circuits, races, drivers, ctors
+
+def _ranked(group, limit=TOP):
+    rows = [{'slug': k, **v} for k, v in group.items() if k and (v.get('wins') or v.get('podiums'))]
+    rows.sort(key=lambda r: (-r['wins'], -r['podiums'], -r.get('poles', 0), r['slug']))
+    return rows[:limit]
+
+def _clean(record):
+    pts = record.get('points')
+    if isinstance(pts, float) and pts.is_integer():
+        record = dict(record, points=int(pts))
+    return record
+
+# -- calendar join ----------------------------------------------------------------
+
+def match_calendar(calendar, circuits):
+    """calendar round -> circuit slug (None when no Ergast circuit matches)."""
+    by_country = defaultdict(list)
+    for cid, info in circuits.items():
+        by_country[country_key(info.get('country'))].append(cid)
+    out = {}
+    for race in calendar.get('races', []):
+        rnd = race.get('round')
+        if race.get('circuitId'):
+            out[rnd] = slug_of(race['circuitId'])
+            continue
+        want = words(race.get('circuit'), race.get('city'))
+        country = country_key(race.get('country'))
+        best = (0, None)
+        for cid, info in circuits.items():
+            shared = len(want & words(info.get('name'), info.get('locality'), cid))
+            if not shared:
+                continue
+            score = 2 * shared + (country_key(info.get('country')) == country)
+            if score > best[0]:
+                best = (score, cid)
+        if best[1] is None and len(by_country.get(country, ())) == 1:
+            # the only circuit ever used in that country (e.g. Lusail vs Losail)
+            best = (1, by_country[country][0])
+        out[rnd] = best[1]
+    return out
+
+def build(seasons=None, calendar=CALENDAR, out_dir=OUT_DIR, ergast_dir=ERGAST_DIR):
+    """Write every circuit shard plus the calendar index; returns the index."""
+    seasons = cached_seasons(ergast_dir) if seasons is None else seasons
+    circuits, races, drivers, ctors = aggregate(seasons, ergast_dir)
+    try:
+        cal = json.loads(Path(calendar).read_text(encoding='utf8'))
+    except (OSError, ValueError):
+        cal = {}
+    matched = match_calendar(cal, circuits)
+
+    index = {'season': cal.get('season'), 'rounds': [], 'circuits': {}}
+    for race in cal.get('races', []):
+        cid = matched.get(race.get('round')) or slugify(race.get('circuit')) or f"round-{race.get('round')}"
+        index['rounds'].append({'round': race.get('round'), 'name': race.get('name'), 'date': race.get('date'),
+                                'circuit': race.get('circuit'), 'city': race.get('city'), 'id': cid,
+                                'matched': cid in circuits})
+    ids = set(circuits) | {r['id'] for r in index['rounds']}
+    for cid in sorted(ids):
+        info = circuits.get(cid) or {}
+        history = [races[cid][k] for k in sorted(races[cid])] if cid in races else []
+        shard = {
+            'id': cid,
+            'circuit': info,
+            'calendarRounds': [r['round'] for r in index['rounds'] if r['id'] == cid],
+            'races': history,
+            'topDrivers': _ranked(drivers[cid]) if cid in drivers else [],
+            'topConstructors': _ranked(ctors[cid]) if cid in ctors else [],
+            'drivers': {k: _clean(v) for k, v in sorted(drivers[cid].items()) if k} if cid in drivers else {},
+            'constructors': {k: v for k, v in sorted(ctors[cid].items()) if k} if cid in ctors else {},
+        }
+        write_json(out_dir / f'{cid}.json', shard)
+        index['circuits'][cid] = {'name': info.get('name'), 'races': len(history)}
+    write_json(out_dir / 'index.json', index)
+    unmatched = [r['circuit'] for r in index['rounds'] if not r['matched']]
+    print(f'Circuits: {len(ids)} shards from {len(seasons)} seasons; calendar rounds without history: {unmatched or "none"}')
+    return index
+
+if __name__ == '__main__':
+    build()
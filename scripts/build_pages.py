@@ -0,0 +1,266 @@
+"""Render the static team and driver pages from `data/stats.json`.
+
+Usage:
+  python scripts/build_pages.py [--jobs N] [--force]
+
+Every team in `data/entries-2026.json` and `teamStats` gets `teams/{slug}/index.html`;
+every driver gets `teams/{team}/drivers/{slug}.html` (current drivers under
+their 2026 team, others under the team of their latest F1 season). The season
+tables are rendered into the HTML from `scripts/templates/*.html`, marked
+`data-prerendered`, so `js/app.js` does not fetch `stats.json` on these pages.
+
+Each page's inputs (its records plus the template) are hashed; pages whose
+hash matches `data/pages-manifest.json` and that still exist are skipped.
+Changed pages are rendered over a process pool.
+"""
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from string import Template
+
+from f1stats import StatsDB, normalize
+from pipeline_io import atomic_write_text, write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+STATS = DATA / 'stats.json'
+ENTRIES = DATA / 'entries-2026.json'
+TEMPLATES = Path(__file__).resolve().parent / 'templates'
+MANIFEST = DATA / 'pages-manifest.json'
+# bump when the rendering code below changes, so every page is rebuilt once
+RENDER_VERSION = 1
+
+DRIVER_COLUMNS = ('position', 'points', 'wins', 'podiums', 'poles', 'fastestLaps')
+DRIVER_HEADERS = '<th>Plek</th><th>Punten</th><th>Overwinningen</th><th>Podia</th><th>Poles</th><th>Fastest laps</th>'
+
+def display_name(slug):
+    return ' '.join(p.capitalize() for p in slug.split('-'))
+
+def _cell(v, dash=False):
+    if v is None:
+        return '—' if dash else '0'
+    return escape(str(v))
+
+def _row(rec):
+    return ''.join(f'<td>{_cell(rec.get(c), c == "position")}</td>' for c in DRIVER_COLUMNS)
+
+# -- page inputs (main process) ---------------------------------------------
+
+def team_pages(db, entries):
+    """Team page list: current entries first, then teams only known from history.
+
+    A current team without its own `teamStats` entry takes over the history of
+    the stats team whose names it matches (`tgr-haas` <- `haas`).
+    """
+    teams = {}
+    for t in entries.get('teams', []):
+        teams[t['slug']] = {'slug': t['slug'], 'name': t.get('name') or display_name(t['slug']),
+                            'country': t.get('country') or '—', 'stats': t['slug'],
+                            'drivers': [d['slug'] for d in t.get('drivers', [])]}
+    history = [slug for slug in db.model.teams if slug not in teams]
+    for team in teams.values():
+        if team['slug'] not in db.model.teams:
+            keys = db.team_keys.get(team['slug']) or {normalize(team['slug'])}
+            team['stats'] = _match(keys, history, db) or team['slug']
+    taken = {t['stats'] for t in teams.values()}
+    for slug in history:
+        if slug not in taken:
+            teams[slug] = {'slug': slug, 'name': display_name(slug), 'country': '—', 'stats': slug, 'drivers': []}
+    return teams
+
+def _match(keys, candidates, db):
+    """Candidate slug whose names contain or are contained in `keys` (longest match wins)."""
+    best = None
+    for slug in candidates:
+        for k in db.team_keys.get(slug) or {normalize(slug)}:
+            if k and any(n and (n in k or k in n) for n in keys) and (best is None or len(k) > best[0]):
+                best = (len(k), slug)
+    return best[1] if best else None
+
+def resolve_team(db, team_name, teams):
+    """Team page slug for a season team name (site's loose containment rule)."""
+    name = normalize(team_name)
+    if not name:
+        return None
+    page = {t['stats']: slug for slug, t in teams.items()}
+    hit = _match({name}, list(teams) + list(page), db)
+    return page.get(hit, hit)
+
+def assign_drivers(db, teams):
+    """driver slug -> team slug of its page; historical drivers are added to their team."""
+    home = {}
+    for slug, t in teams.items():
+        for d in t['drivers']:
+            home.setdefault(d, slug)
+    for slug, ent in db.model.drivers.items():
+        if slug in home:
+            continue
+        for y, rec in reversed(list(ent.items())):
+            team = resolve_team(db, rec.team, teams)
+            if team:
+                home[slug] = team
+                teams[team]['drivers'].append(slug)
+                break
+    return home
+
+def team_inputs(db, team, home):
+    ent = db.model.teams.get(team['stats'])
+    seasons = []
+    for y in sorted(db.model.seasons or [], key=int, reverse=True):
+        rec = ent.get(y) if ent is not None else None
+        rows = []
+        for d in sorted(set(db.team_drivers(team['slug'], y)) | set(db.team_drivers(team['stats'], y))):
+            dr = db.model.drivers[d].get(y)
+            rows.append({'slug': d, 'name': driver_name(db, d), 'href': driver_href(d, home),
+                         **{c: dr.get(c) for c in DRIVER_COLUMNS}})
+        rows.sort(key=lambda r: (-(r['points'] or 0), r['slug']))
+        seasons.append({'season': int(y), 'team': rec.to_dict() if rec is not None else None, 'drivers': rows})
+    return {'slug': team['slug'], 'name': team['name'], 'country': team['country'],
+            'allTime': ent.all_time if ent is not None else None, 'seasons': seasons,
+            'drivers': [{'name': driver_name(db, d), 'href': driver_href(d, home)}
+                        for d in sorted(team['drivers'], key=lambda d: driver_name(db, d))]}
+
+def driver_inputs(db, slug, team):
+    ent = db.model.drivers.get(slug)
+    info = db.info.get(slug) or {}
+    return {'slug': slug, 'name': driver_name(db, slug),
+            'nationality': info.get('nationalityLabel') or info.get('nationality') or '—',
+            'number': info.get('number'), 'team': team['name'], 'teamSlug': team['slug'],
+            'seasons': [{'season': y, **rec.to_dict()} for y, rec in reversed(list(ent.items()))] if ent else [],
+            'other': ent.other if ent is not None else None,
+            'allTime': ent.all_time if ent is not None else None}
+
+def driver_name(db, slug):
+    return (db.info.get(slug) or {}).get('name') or display_name(slug)
+
+def driver_href(slug, home):
+    return f'teams/{home[slug]}/drivers/{slug}.html' if slug in home else None
+
+# -- rendering (worker processes) --------------------------------------------
+
+@lru_cache(maxsize=None)
+def load_template(name):
+    return Template((TEMPLATES / name).read_text(encoding='utf8'))
+
+def _link(name, href):
+    return f'<a href="{escape(href)}">{escape(name)}</a>' if href else escape(name)
+
+def render_team(p):
+    parts = []
+    for i, s in enumerate(p['seasons']):
+        t = s['team']
+        summary = (f'F1 {s["season"]} — {_cell(t.get("points"))} punten, {_cell(t.get("wins"))} overwinningen'
+                   if t else f'F1 {s["season"]} — geen teamdata')
+        body = ''
+        if s['drivers']:
+            body = ('<table class="stats-table"><thead><tr><th>Rijder</th>' + DRIVER_HEADERS + '</tr></thead><tbody>'
+                    + ''.join(f'<tr><td>{_link(d["name"], d["href"])}</td>{_row(d)}</tr>' for d in s['drivers'])
+                    + '</tbody></table>')
+        elif t:
+            body = '<p>Geen rijdersdata gevonden voor dit team in dit seizoen.</p>'
+        parts.append(f'        <details class="season"{" open" if i == 0 else ""}><summary>{summary}</summary>{body}</details>')
+    at = p['allTime'] or {}
+    summary = f'<p class="muted">All-time — {_cell(at.get("points"))} p, {_cell(at.get("wins"))} wins</p>' if at else ''
+    return load_template('team.html').substitute(
+        title=escape(f'{p["name"]} — Team'), name=escape(p['name']), country=escape(p['country']),
+        slug=escape(p['slug']), seasons='\n'.join(parts), summary=summary,
+        drivers='\n'.join(f'        <li>{_link(d["name"], d["href"])}</li>' for d in p['drivers']))
+
+def render_driver(p):
+    html = '        <h3>F1 Carrière</h3>'
+    if p['seasons']:
+        html += ('<table class="stats-table"><thead><tr><th>Seizoen</th><th>Team</th>' + DRIVER_HEADERS
+                 + '</tr></thead><tbody>'
+                 + ''.join(f'<tr><td>{s["season"]}</td><td>{_cell(s.get("team"), True)}</td>{_row(s)}</tr>'
+                           for s in p['seasons'])
+                 + '</tbody></table>')
+    else:
+        html += '<p>Geen F1 data</p>'
+    at = p['allTime'] or {}
+    if at:
+        html += (f'<p class="muted">All-time — {_cell(at.get("points", at.get("f1Points")))} p, '
+                 f'{_cell(at.get("wins") if not isinstance(at.get("wins"), dict) else None)} wins</p>')
+    other = p['other'] or {}
+    if other:
+        html += ('<h3>Juniorklassen</h3><table class="stats-table"><thead><tr><th>Seizoen</th><th>Klasse</th>'
+                 '<th>Team</th>' + DRIVER_HEADERS + '</tr></thead><tbody>'
+                 + ''.join(f'<tr><td>{escape(k.split("_")[0])}</td><td>{_cell(r.get("series"), True)}</td>'
+                           f'<td>{_cell(r.get("team"), True)}</td>{_row(r)}</tr>'
+                           for k, r in sorted(other.items(), reverse=True))
+                 + '</tbody></table>')
+    return load_template('driver.html').substitute(
+        title=escape(f'{p["name"]} — {p["team"]}'), name=escape(p['name']), team=escape(p['team']),
+        nationality=escape(p['nationality']), slug=escape(p['slug']), team_slug=escape(p['teamSlug']),
+        number=f'\n      <p>Nummer: {escape(str(p["number"]))}</p>' if p.get('number') is not None else '',
+        career=html)
+
+RENDERERS = {'team.html': render_team, 'driver.html': render_driver}
+
+def render_job(job):
+    """Worker entry point: render and atomically write one page."""
+    path, template, inputs = job
+    atomic_write_text(ROOT / path, RENDERERS[template](inputs))
+    return path
+
+# -- build ----------------------------------------------------------------------
+
+def page_hash(template, inputs):
+    h = hashlib.sha256()
+    h.update(f'{RENDER_VERSION}\0'.encode())
+    h.update((TEMPLATES / template).read_bytes())
+    h.update(json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode('utf8'))
+    return h.hexdigest()
+
+def collect(stats=STATS):
+    """All `(path, template, inputs)` page jobs for the current dataset."""
+    db = StatsDB(stats, cache_size=4096, auto_refresh=False)
+    entries = json.loads(ENTRIES.read_text(encoding='utf8')) if ENTRIES.exists() else {}
+    teams = team_pages(db, entries)
+    home = assign_drivers(db, teams)
+    jobs = []
+    for slug, team in teams.items():
+        jobs.append((f'teams/{slug}/index.html', 'team.html', team_inputs(db, team, home)))
+    for slug, team_slug in home.items():
+        jobs.append((f'teams/{team_slug}/drivers/{slug}.html', 'driver.html',
+                     driver_inputs(db, slug, teams[team_slug])))
+    return jobs
+
+def build(jobs=None, force=False, stats=STATS, manifest=MANIFEST):
+    """Render pages whose inputs changed; returns `(rendered, skipped)` counts."""
+    pages = collect(stats)
+    try:
+        old = json.loads(Path(manifest).read_text(encoding='utf8'))
+    except (OSError, ValueError):
+        old = {}
+    hashes = {}
+    todo = []
+    for path, template, inputs in pages:
+        h = hashes[path] = page_hash(template, inputs)
+        if force or old.get(path) != h or not (ROOT / path).exists():
+            todo.append((path, template, inputs))
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            list(pool.map(render_job, todo, chunksize=max(1, len(todo) // (jobs * 4))))
+    else:
+        for job in todo:
+            render_job(job)
+    write_json(manifest, hashes)
+    return len(todo), len(pages) - len(todo)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Render static team and driver pages')
+    ap.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    ap.add_argument('--force', action='store_true', help='render every page, ignoring the manifest')
+    ap.add_argument('--stats', default=str(STATS))
+    args = ap.parse_args(argv)
+    rendered, skipped = build(jobs=args.jobs, force=args.force, stats=args.stats)
+    print('Pages rendered:', rendered, 'unchanged:', skipped)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""Per-round championship progression, one binary shard per season.
+
+Usage:
+  python scripts/build_progression.py [--years 1950-2026] [--force]
+
+For every season with cached results
+(`data/ergast/ergast_{season}_{results,sprint}.json[.gz]`) this derives the
+standings after each round without asking the API for them:
+
+  points     per-round points (Grand Prix plus that weekend's sprint) per
+             driver, one dense `rounds x drivers` matrix, turned into
+             championship totals by a cumulative sum down each column
+  position   standings position after each round: entities ranked by total
+             points, ties broken by countback (more wins, then more 2nd
+             places, ...); 0 until an entity has taken part
+
+and the same for constructors, whose rows add up both cars. Points are the
+ones awarded on the day, so seasons with dropped scores (before 1991) can
+end on a slightly different order than the official final standings.
+
+`data/progression/{season}.bin` holds a little-endian `uint32` header length,
+the JSON header (rounds, driver and constructor slugs, and per array its
+`offset`, `type` and `shape`), padding to 4 bytes, then the arrays:
+`driverPoints` / `teamPoints` as `float32` and `driverPosition` /
+`teamPosition` as `uint8`, row-major by round. A page needs one fetch per
+season and wraps each array in a typed array without parsing it:
+
+    const buf = await (await fetch('/data/progression/2024.bin')).arrayBuffer();
+    const n = new DataView(buf).getUint32(0, true);
+    const head = JSON.parse(new TextDecoder().decode(new Uint8Array(buf, 4, n)));
+    const a = head.arrays.driverPoints;
+    const points = new Float32Array(buf, a.offset, a.shape[0] * a.shape[1]);
+
+`data/progression/index.json` lists the seasons with their round and entry
+counts plus the source stamps, so a rebuild only redoes seasons whose cached
+results changed (or every season when its `format` is not the current one). `Progression.load(season)` reads a shard back in Python.
+"""
+import argparse
+import json
+import os
+import struct
+import sys
+from array import array
+from itertools import accumulate
+from pathlib import Path
+
+from build_circuits import cached_seasons
+from f1data import add_common_args, selected_seasons
+from pipeline_io import atomic_open, cache_exists, cache_file, read_cached_json, slug_of, write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+ERGAST_DIR = DATA / 'ergast'
+OUT_DIR = DATA / 'progression'
+FORMAT = 1
+KINDS = (('driver', 'Driver', 'driverId'), ('team', 'Constructor', 'constructorId'))
+
+def _races(path):
+    if not cache_exists(path):
+        return []
+    return read_cached_json(path).get('MRData', {}).get('RaceTable', {}).get('Races', [])
+
+def _position(row):
+    text = row.get('positionText') or row.get('position') or ''
+    return int(text) if text.isdigit() else 0
+
+def source_stamp(season, ergast_dir=ERGAST_DIR):
+    stamp = []
+    for name in ('results', 'sprint'):
+        path = cache_file(ergast_dir / f'ergast_{season}_{name}.json')
+        if not path.exists():
+            path = ergast_dir / f'ergast_{season}_{name}.json'
+        if path.exists():
+            st = os.stat(path)
+            stamp.append([name, st.st_mtime_ns, st.st_size])
+    return stamp
+
+# -- cube ---------------------------------------------------------------------------------
+
+def rank(totals, finishes, started):
+    """Standings positions (1-based, 0 = not started) from totals and countback counters."""
+    order = sorted((i for i in range(len(totals)) if started[i]),
+                   key=lambda i: (-totals[i], [-c for c in finishes[i]], i))
+    out = [0] * len(totals)
+    for p, i in enumerate(order, 1):
+        out[i] = p
+    return out
+
+def cube(rounds, races, sprints, entity, id_key):
+    """`(slugs, points, position)` for one kind: per-round-cumulative `float32` and `uint8` matrices."""
+    index = {r: i for i, r in enumerate(rounds)}
+    rows = []
+    for race_list, key in ((races, 'Results'), (sprints, 'SprintResults')):
+        for race in race_list:
+            r = index.get(int(race.get('round') or 0))
+            if r is None:
+                continue
+            for row in race.get(key, []):
+                slug = slug_of((row.get(entity) or {}).get(id_key))
+                if slug:
+                    rows.append((r, slug, float(row.get('points') or 0), _position(row) if key == 'Results' else 0))
+    slugs = sorted({slug for _, slug, _, _ in rows})
+    col = {s: i for i, s in enumerate(slugs)}
+    n_rounds, n = len(rounds), len(slugs)
+    per_round = array('d', bytes(8 * n_rounds * n))
+    # per round: (entity, finishing position) of every Grand Prix car, for countback
+    finished = [[] for _ in rounds]
+    for r, slug, pts, pos in rows:
+        per_round[r * n + col[slug]] += pts
+        finished[r].append((col[slug], pos))
+    points = array('f', bytes(4 * n_rounds * n))
+    for i in range(n):
+        for r, total in enumerate(accumulate(per_round[i::n])):
+            points[r * n + i] = total
+    position = array('B', bytes(n_rounds * n))
+    width = max((pos for f in finished for _, pos in f), default=0)
+    counts = [[0] * width for _ in range(n)]
+    started = [False] * n
+    for r in range(n_rounds):
+        for i, pos in finished[r]:
+            started[i] = True
+            if pos:
+                counts[i][pos - 1] += 1
+        for i, p in enumerate(rank(points[r * n:(r + 1) * n], counts, started)):
+            position[r * n + i] = min(p, 255)
+    return slugs, points, position
+
+def season_shard(season, ergast_dir=ERGAST_DIR):
+    """Header dict and array payload for one season, or None without cached results."""
+    races = _races(ergast_dir / f'ergast_{season}_results.json')
+    if not races:
+        return None
+    sprints = _races(ergast_dir / f'ergast_{season}_sprint.json')
+    races = sorted(races, key=lambda race: int(race.get('round') or 0))
+    rounds = [int(race.get('round') or 0) for race in races]
+    header = {'format': FORMAT, 'season': int(season),
+              'rounds': [{'round': int(race.get('round') or 0), 'raceName': race.get('raceName'), 'date': race.get('date'),
+                          'sprint': any(int(s.get('round') or 0) == int(race.get('round') or 0) for s in sprints)}
+                         for race in races],
+              'arrays': {}}
+    arrays = []
+    for kind, entity, id_key in KINDS:
+        slugs, points, position = cube(rounds, races, sprints, entity, id_key)
+        header[f'{kind}s'] = slugs
+        arrays += [(f'{kind}Points', 'float32', points), (f'{kind}Position', 'uint8', position)]
+    return header, arrays
+
+def encode(header, arrays):
+    """Shard bytes: header length, JSON header, then each array 4-byte aligned."""
+    rows = len(header['rounds'])
+    # offsets depend on the header length, which depends on the offsets: repeat until it settles
+    head = b''
+    while True:
+        pos = 4 + len(head)
+        for name, kind, arr in arrays:
+            pos += -pos % 4
+            header['arrays'][name] = {'offset': pos, 'type': kind, 'shape': [rows, len(arr) // rows if rows else 0]}
+            pos += len(arr) * arr.itemsize
+        encoded = json.dumps(header, separators=(',', ':')).encode('utf8')
+        settled = len(encoded) == len(head)
+        head = encoded
+        if settled:
+            break
+    out = bytearray(struct.pack('<I', len(head)) + head)
+    for name, _, arr in arrays:
+        out += bytes(-len(out) % 4)
+        assert len(out) == header['arrays'][name]['offset']
+        if sys.byteorder != 'little':
+            arr = array(arr.typecode, arr)
+            arr.byteswap()
+        out += arr.tobytes()
+    return bytes(out)
+
+class Progression:
+    """One season shard read back: `points('driver', round_index, slug)`, `series`, `standings`."""
+
+    TYPES = {'float32': 'f', 'uint8': 'B'}
+
+    def __init__(self, data):
+        n = struct.unpack_from('<I', data, 0)[0]
+        self.header = json.loads(data[4:4 + n])
+        self.arrays = {}
+        for name, spec in self.header['arrays'].items():
+            arr = array(self.TYPES[spec['type']])
+            size = spec['shape'][0] * spec['shape'][1] * arr.itemsize
+            arr.frombytes(data[spec['offset']:spec['offset'] + size])
+            if sys.byteorder != 'little':
+                arr.byteswap()
+            self.arrays[name] = arr
+        self.index = {kind: {s: i for i, s in enumerate(self.header[f'{kind}s'])} for kind, _, _ in KINDS}
+
+    @classmethod
+    def load(cls, season, out_dir=OUT_DIR):
+        return cls((Path(out_dir) / f'{season}.bin').read_bytes())
+
+    @property
+    def rounds(self):
+        return [r['round'] for r in self.header['rounds']]
+
+    def series(self, kind, slug):
+        """`(points, position)` after every round for one driver (`kind='driver'`) or team."""
+        n = len(self.index[kind])
+        i = self.index[kind][slug]
+        return list(self.arrays[f'{kind}Points'][i::n]), list(self.arrays[f'{kind}Position'][i::n])
+
+    def standings(self, kind, r=-1):
+        """`[(position, slug, points)]` after round index `r` (default: the last one)."""
+        slugs = self.header[f'{kind}s']
+        n = len(slugs)
+        r = r % len(self.header['rounds'])
+        pts = self.arrays[f'{kind}Points'][r * n:(r + 1) * n]
+        pos = self.arrays[f'{kind}Position'][r * n:(r + 1) * n]
+        return sorted((p, s, v) for p, s, v in zip(pos, slugs, pts) if p)
+
+def build(seasons=None, out_dir=OUT_DIR, ergast_dir=ERGAST_DIR, force=False):
+    """Write the shards of seasons whose cached results changed; returns the index."""
+    out_dir = Path(out_dir)
+    seasons = cached_seasons(ergast_dir) if seasons is None else seasons
+    index_path = out_dir / 'index.json'
+    try:
+        index = json.loads(index_path.read_text(encoding='utf8'))
+    except (OSError, ValueError):
+        index = {}
+    if index.get('format') != FORMAT:
+        # shards in an older layout cannot be reused, whatever their source stamps say
+        index = {'format': FORMAT, 'seasons': {}}
+    written = 0
+    for season in seasons:
+        stamp = source_stamp(season, ergast_dir)
+        entry = index['seasons'].get(str(season))
+        if not stamp or (not force and entry and entry.get('source') == stamp and (out_dir / f'{season}.bin').exists()):
+            continue
+        shard = season_shard(season, ergast_dir)
+        if shard is None:
+            continue
+        header, arrays = shard
+        data = encode(header, arrays)
+        with atomic_open(out_dir / f'{season}.bin', 'wb') as f:
+            f.write(data)
+        index['seasons'][str(season)] = {'rounds': len(header['rounds']), 'drivers': len(header['drivers']),
+                                         'teams': len(header['teams']), 'bytes': len(data), 'source': stamp}
+        written += 1
+    index['seasons'] = dict(sorted(index['seasons'].items()))
+    write_json(index_path, index)
+    print(f'Progression: {written} season shards written, {len(index["seasons"]) - written} unchanged')
+    return index
+
+def main(argv=None):
+    ap = add_common_args(argparse.ArgumentParser(description='Build per-round championship progression shards'))
+    ap.add_argument('--force', action='store_true', help='rebuild every season, ignoring the source stamps')
+    args = ap.parse_args(argv)
+    build(seasons=selected_seasons(args), force=args.force)
+
+if __name__ == '__main__':
+    main()
@@ -1,41 +1,31 @@
 #!/usr/bin/env python3
-"""Compute championships/titles from `careerSummary` and write into `data/stats.json`.
+"""Derive championships and career records from standings positions in `data/stats.json`.
 
 Usage: python scripts/compute_championships.py
 
-This script looks for `careerSummary` entries per driver and counts seasons
-where the `series` contains 'Formula One' and `position` is '1st'. It writes
-`allTime.championships` field for each driver (0 if none).
+Standalone wrapper around `derived_metrics`: counts titles (final position 1)
+and runner-up finishes per driver and constructor from `bySeason`, plus best
+finish and per-start win/podium/pole rates, and writes `allTime` fields. The
+orchestrator runs the same engine as part of its final merge, so this is only
+needed to refresh an existing `stats.json` by hand.
 """
-import json
 from pathlib import Path
 
+from derived_metrics import update_model
+from stats_model import StatsModel
+
 ROOT = Path(__file__).resolve().parents[1]
 STATS = ROOT / 'data' / 'stats.json'
 
 def main():
-    s = json.loads(STATS.read_text(encoding='utf8'))
-    ds = s.setdefault('driverStats', {})
-    updated = []
-    for slug, info in ds.items():
-        career = info.get('careerSummary') or []
-        champs = 0
-        for row in career:
-            series = (row.get('series') or '').lower()
-            pos = (row.get('position') or '').lower()
-            if 'formula one' in series or series.strip().lower().startswith('formula one'):
-                if pos and (pos == '1st' or pos.startswith('1')):
-                    champs += 1
-        at = info.setdefault('allTime', {})
-        if at.get('championships') != champs:
-            at['championships'] = champs
-            updated.append(slug)
-
-    if updated:
-        STATS.write_text(json.dumps(s, indent=2, ensure_ascii=False), encoding='utf8')
-        print('Updated championships for:', updated)
+    model = StatsModel.load(STATS)
+    changed = update_model(model)
+    if changed['drivers'] or changed['teams']:
+        model.save(STATS)
+        print('Updated drivers:', changed['drivers'])
+        print('Updated teams:', changed['teams'])
     else:
-        print('No changes; championships already present or zero for all drivers')
+        print('No changes; derived metrics already up to date')
 
 if __name__ == '__main__':
     main()
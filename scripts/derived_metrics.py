@@ -0,0 +1,118 @@
+"""Derived career metrics computed from final standings positions.
+
+For every driver and constructor this derives, from the `position` values in
+`bySeason` (so no `careerSummary` is needed):
+
+- `championships` / `runnerUps`: seasons finished 1st / 2nd
+- `titleYears`: the championship seasons
+- `bestFinish`: best final championship position
+- drivers only: `winRate`, `podiumRate`, `poleRate` per start, when the
+  seasons carry a `races` (starts) count
+
+A season that is still being raced (see `in_progress_seasons`) never counts as
+a title, runner-up or best finish; its starts and wins still count for the
+rates.
+
+All records are flattened into parallel typed arrays (entity index, year,
+position, wins, podiums, poles, starts) and reduced in one plain Python loop
+over those columns (the repo has no numpy dependency, so this is compact
+storage and a single pass rather than vectorized arithmetic); the result is
+then written into `allTime` only where a value actually changed.
+"""
+import json
+from array import array
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+CALENDAR = ROOT / 'data' / 'calendar-2026.json'
+
+def in_progress_seasons(calendar=CALENDAR, today=None):
+    """Seasons whose last calendar race has not been run yet."""
+    today = today or date.today()
+    try:
+        cal = json.loads(Path(calendar).read_text(encoding='utf8'))
+    except (OSError, ValueError):
+        return set()
+    dates = [r.get('date') for r in cal.get('races', []) if r.get('date')]
+    if dates and date.fromisoformat(max(dates)) >= today:
+        return {int(cal.get('season'))}
+    return set()
+
+def _flatten(entities):
+    """Parallel arrays over every (entity, season) record."""
+    slugs = list(entities)
+    idx, years, pos = array('I'), array('H'), array('H')
+    wins, podiums, poles, starts = array('I'), array('I'), array('I'), array('I')
+    for i, slug in enumerate(slugs):
+        ent = entities[slug]
+        for y, rec in ent.items():
+            idx.append(i)
+            years.append(y)
+            pos.append(rec.position or 0)
+            wins.append(rec.wins or 0)
+            podiums.append(rec.podiums or 0)
+            poles.append(rec.poles or 0)
+            starts.append(rec.races or 0)
+    return slugs, idx, years, pos, wins, podiums, poles, starts
+
+def derive(entities, exclude=(), rates=True):
+    """Derived allTime fields for every entity in `entities` (slug -> EntityStats)."""
+    slugs, idx, years, pos, wins, podiums, poles, starts = _flatten(entities)
+    n = len(slugs)
+    titles = array('I', bytes(4 * n))
+    seconds = array('I', bytes(4 * n))
+    best = array('H', bytes(2 * n))
+    w, p, q, st = (array('I', bytes(4 * n)) for _ in range(4))
+    title_years = [[] for _ in range(n)]
+    for i, y, ps, a, b, c, d in zip(idx, years, pos, wins, podiums, poles, starts):
+        if d:
+            w[i] += a
+            p[i] += b
+            q[i] += c
+            st[i] += d
+        if not ps or y in exclude:
+            continue
+        if not best[i] or ps < best[i]:
+            best[i] = ps
+        if ps == 1:
+            titles[i] += 1
+            title_years[i].append(y)
+        elif ps == 2:
+            seconds[i] += 1
+
+    out = {}
+    for i, slug in enumerate(slugs):
+        d = {'championships': titles[i], 'runnerUps': seconds[i], 'titleYears': title_years[i],
+             'bestFinish': best[i] or None}
+        if rates and st[i]:
+            d['winRate'] = round(w[i] / st[i], 4)
+            d['podiumRate'] = round(p[i] / st[i], 4)
+            d['poleRate'] = round(q[i] / st[i], 4)
+        out[slug] = d
+    return out
+
+def apply(entities, derived):
+    """Merge `derived` into each entity's allTime; returns the slugs that changed."""
+    changed = []
+    for slug, fields in derived.items():
+        ent = entities[slug]
+        at = ent.all_time if ent.all_time is not None else {}
+        diff = {k: v for k, v in fields.items() if at.get(k) != v}
+        if diff:
+            at.update(diff)
+            ent.all_time = at
+            changed.append(slug)
+    return changed
+
+def update_model(model, exclude=None):
+    """Derive and apply metrics for drivers and teams of a `StatsModel`.
+
+    Returns `{'drivers': [...], 'teams': [...]}` with the slugs that changed.
+    """
+    if exclude is None:
+        exclude = in_progress_seasons()
+    return {
+        'drivers': apply(model.drivers, derive(model.drivers, exclude)),
+        'teams': apply(model.teams, derive(model.teams, exclude, rates=False)),
+    }
@@ -0,0 +1,283 @@
+"""Ergast-compatible data source with mirror selection and hedged requests.
+
+Fetchers ask for a path relative to the API root (`2023/results.json?limit=100&offset=0`)
+and `ErgastSource` decides which base URL serves it:
+
+- Base URLs come from the `ERGAST_MIRRORS` environment variable
+  (comma-separated, e.g. a local mirror first) or `DEFAULT_MIRRORS`.
+- Every mirror keeps a rolling window of request latencies and outcomes.
+  Requests go to the healthy mirror with the best score (median latency
+  weighted by recent error rate); untried mirrors are probed first, and a
+  mirror with repeated failures is benched for a cooldown.
+- With hedging on, if the chosen mirror has not answered within its own p95
+  latency, the same request is sent to the next-best mirror and whichever
+  succeeds first wins. Tail latency is then bounded by the better mirror.
+
+The transport is pluggable (`transport(url, timeout, headers) -> (status,
+headers, body)`, `body` being bytes or an iterator of byte chunks), which keeps the class testable against local stand-in
+servers; see `scripts/bench_mirrors.py`.
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_MIRRORS = ['https://ergast.com/api/f1', 'https://api.jolpi.ca/ergast/f1']
+USER_AGENT = 'stats-fetcher/1.0 (+https://example.invalid)'
+
+def requests_transport(url, timeout, headers):
+    """The body is a lazy `ResponseChunks` that closes the response once drained or closed."""
+    import requests
+    r = requests.get(url, timeout=timeout, headers=headers, stream=True)
+    if r.status_code == 304:
+        r.close()
+        return r.status_code, r.headers, b''
+    try:
+        r.raise_for_status()
+    except Exception:
+        r.close()
+        raise
+    return r.status_code, r.headers, ResponseChunks(r)
+
+class ResponseChunks:
+    """Chunks of a streamed `requests` response.
+
+    `close()` releases the connection even if iteration never started (a
+    generator's `finally` would not run in that case).
+    """
+
+    def __init__(self, response, chunk_size=64 * 1024):
+        self.response = response
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        try:
+            yield from self.response.iter_content(chunk_size=self.chunk_size)
+        finally:
+            self.close()
+
+    def close(self):
+        self.response.close()
+
+def urllib_transport(url, timeout, headers):
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+    try:
+        with urlopen(Request(url, headers=headers), timeout=timeout) as r:
+            return r.status, r.headers, r.read()
+    except HTTPError as e:
+        if e.code == 304:
+            return 304, e.headers, b''
+        raise
+
+class Mirror:
+    """Rolling health/latency stats for one base URL."""
+
+    def __init__(self, base, window=50, timeout=15):
+        self.base = base.rstrip('/')
+        self.timeout = timeout
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.consecutive_errors = 0
+        self.benched_until = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, seconds, ok):
+        with self.lock:
+            self.outcomes.append(bool(ok))
+            if ok:
+                self.latencies.append(seconds)
+                self.consecutive_errors = 0
+            else:
+                self.consecutive_errors += 1
+
+    def error_rate(self):
+        if not self.outcomes:
+            return 0.0
+        return 1 - sum(self.outcomes) / len(self.outcomes)
+
+    def percentile(self, q, default=None):
+        with self.lock:
+            lat = sorted(self.latencies)
+        if not lat:
+            return default
+        return lat[min(len(lat) - 1, int(q * len(lat)))]
+
+    def score(self):
+        """Lower is better; untried mirrors score 0 so they get probed.
+
+        A mirror that has only failed has no latency samples and counts as
+        answering at the request timeout, which ranks it last.
+        """
+        if not self.outcomes:
+            return 0.0
+        p50 = self.percentile(0.5, self.timeout)
+        return p50 * (1 + 4 * self.error_rate())
+
+    def healthy(self, now):
+        return now >= self.benched_until
+
+    def __repr__(self):
+        return (f'Mirror({self.base!r}, p50={self.percentile(0.5)}, p95={self.percentile(0.95)}, '
+                f'errors={self.error_rate():.0%})')
+
+class MeteredBody:
+    """Streamed body that charges the mirror once it ends.
+
+    Draining it records the full transfer time as a success; an error while
+    reading records a failure (and can bench the mirror). Closing it early,
+    or a hedged loser being discarded, records the time so far as a success:
+    the mirror did answer.
+    """
+
+    def __init__(self, source, mirror, t0, chunks):
+        self.source, self.mirror, self.t0 = source, mirror, t0
+        self.chunks = chunks
+        self.charged = False
+
+    def _finish(self, ok):
+        if not self.charged:
+            self.charged = True
+            self.source._charge(self.mirror, time.monotonic() - self.t0, ok)
+
+    def __iter__(self):
+        try:
+            yield from self.chunks
+        except Exception:
+            self._finish(False)
+            raise
+        finally:
+            self.close()
+
+    def close(self):
+        close = getattr(self.chunks, 'close', None)
+        if close is not None:
+            close()
+        self._finish(True)
+
+def _discard(future):
+    """Release the body of a request whose answer is not used."""
+    try:
+        _, (_, _, body) = future.result()
+    except Exception:
+        return
+    close = getattr(body, 'close', None)
+    if close is not None:
+        close()
+
+class ErgastSource:
+    def __init__(self, bases=None, transport=None, timeout=15, hedge=True,
+                 hedge_floor=0.05, default_hedge_after=2.0, bench_after=3, cooldown=60.0):
+        if bases is None:
+            env = os.environ.get('ERGAST_MIRRORS', '')
+            bases = [b.strip() for b in env.split(',') if b.strip()] or DEFAULT_MIRRORS
+        self.mirrors = [Mirror(b, timeout=timeout) for b in bases]
+        self.transport = transport or requests_transport
+        self.timeout = timeout
+        self.hedge = hedge and len(self.mirrors) > 1
+        self.hedge_floor = hedge_floor
+        self.default_hedge_after = default_hedge_after
+        self.bench_after = bench_after
+        self.cooldown = cooldown
+        self.hedged = 0
+        self._pool = ThreadPoolExecutor(max_workers=4 * len(self.mirrors), thread_name_prefix='ergast')
+
+    def ranked(self):
+        """Healthy mirrors, best first (config order breaks ties)."""
+        now = time.monotonic()
+        live = [m for m in self.mirrors if m.healthy(now)] or list(self.mirrors)
+        return sorted(live, key=lambda m: (m.score(), self.mirrors.index(m)))
+
+    def best(self):
+        return self.ranked()[0]
+
+    def _charge(self, mirror, seconds, ok):
+        mirror.record(seconds, ok)
+        if not ok and mirror.consecutive_errors >= self.bench_after:
+            mirror.benched_until = time.monotonic() + self.cooldown
+
+    def _call(self, mirror, path, headers, per_mirror=None, stream=False):
+        url = f'{mirror.base}/{path.lstrip("/")}'
+        if per_mirror and per_mirror.get(mirror.base):
+            headers = {**headers, **per_mirror[mirror.base]}
+        t0 = time.monotonic()
+        try:
+            status, resp_headers, body = self.transport(url, self.timeout, headers)
+            if isinstance(body, (bytes, bytearray)):
+                pass
+            elif stream:
+                # latency and errors are charged when the body ends, not at the headers
+                return mirror, (status, resp_headers, MeteredBody(self, mirror, t0, body))
+            else:
+                body = b''.join(body)
+        except Exception:
+            self._charge(mirror, time.monotonic() - t0, False)
+            raise
+        self._charge(mirror, time.monotonic() - t0, True)
+        return mirror, (status, resp_headers, body)
+
+    def request(self, path, headers=None, per_mirror=None, stream=False):
+        """GET `path` from the best mirror (hedged if enabled).
+
+        `per_mirror` maps a mirror's base URL to extra headers sent only to
+        that mirror, for conditional-request validators (ETags differ between
+        hosts). Returns `(mirror, status, headers, body)`; key anything learned
+        from the response on the returned mirror, which with hedging need not
+        be the best one. With `stream` the body may be a `MeteredBody` of byte
+        chunks; drain or close it. Otherwise it is bytes read in full, and a
+        failure while reading counts against the mirror like any other. Raises
+        the last error when every attempted mirror failed.
+        """
+        headers = dict(headers or {})
+        headers.setdefault('User-Agent', USER_AGENT)
+        ranked = self.ranked()
+        primary = ranked[0]
+        futures = {self._pool.submit(self._call, primary, path, headers, per_mirror, stream)}
+        backups = ranked[1:] if self.hedge else []
+        delay = max(self.hedge_floor, primary.percentile(0.95, self.default_hedge_after))
+        last_err = None
+        while futures:
+            done, futures = wait(futures, timeout=delay if backups else None, return_when=FIRST_COMPLETED)
+            winner = None
+            for f in done:
+                if winner is not None:
+                    _discard(f)
+                    continue
+                try:
+                    winner = f.result()
+                except Exception as e:
+                    last_err = e
+            if winner is not None:
+                # the losers keep running; release their connections as they finish
+                for f in futures:
+                    f.add_done_callback(_discard)
+                mirror, (status, resp_headers, body) = winner
+                return mirror, status, resp_headers, body
+            if backups and (not done or not futures):
+                # primary is slower than its p95 (or failed): race the next mirror
+                if not done:
+                    self.hedged += 1
+                futures.add(self._pool.submit(self._call, backups.pop(0), path, headers, per_mirror, stream))
+                delay = max(self.hedge_floor, self.default_hedge_after)
+        raise last_err or RuntimeError(f'no mirror answered {path}')
+
+    def get_bytes(self, path, headers=None):
+        return self.request(path, headers)[3]
+
+    def get_chunks(self, path, headers=None):
+        """The body of `path` as an iterable of byte chunks, read as it arrives."""
+        body = self.request(path, headers, stream=True)[3]
+        return [body] if isinstance(body, (bytes, bytearray)) else body
+
+    def report(self):
+        return [repr(m) for m in self.mirrors] + [f'hedged requests: {self.hedged}']
+
+_SOURCE = None
+
+def default_source():
+    """Process-wide source configured from the environment."""
+    global _SOURCE
+    if _SOURCE is None:
+        _SOURCE = ErgastSource()
+    return _SOURCE
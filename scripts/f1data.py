@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""One entry point for the data pipeline.
+
+Usage:
+  python scripts/f1data.py fetch    [--resume] [--juniors] [--generator ergast|races|standings]
+  python scripts/f1data.py fix      [--fill]
+  python scripts/f1data.py validate [--syntax]
+  python scripts/f1data.py build    [stats pages search circuits progression simulation] [--force]
+  python scripts/f1data.py serve    [--host 127.0.0.1] [--port 8001] [--quiet]
+  python scripts/f1data.py live     [--host 127.0.0.1] [--port 8002] [--interval 20] [--replay [SEASON]]
+  python scripts/f1data.py bench    search|mirrors|snapshot|load|rescoring [ARGS ...]
+
+Shared flags (`fetch` and `build`):
+  --years 2020-2026,2010   seasons to work on (ranges and single years)
+  --since 2024             every season from 2024 up to the current year
+  --jobs N                 worker threads/processes
+  --offline                use cached Ergast payloads only, no network
+
+The other subcommands do not take them. `build` rejects a flag that none of
+the selected targets uses (see `BUILD_FLAGS`) instead of ignoring it.
+
+Only `argparse` is imported up front. Each subcommand imports its own
+modules when it runs, and `requests` / `bs4` are only loaded by the fetchers
+that use them, so `validate` and `build` start without paying for the
+network stack (`python -X importtime scripts/f1data.py validate`).
+"""
+import argparse
+import sys
+import time
+
+def parse_years(spec):
+    """`'2019,2021-2023'` -> `[2019, 2021, 2022, 2023]`."""
+    years = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        lo, _, hi = part.partition('-')
+        try:
+            lo, hi = int(lo), int(hi or lo)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'not a year or range: {part!r}')
+        if lo > hi:
+            lo, hi = hi, lo
+        years.update(range(lo, hi + 1))
+    return sorted(years)
+
+def add_common_args(ap):
+    ap.add_argument('--years', type=parse_years, help='seasons, e.g. 2020-2026 or 2019,2021')
+    ap.add_argument('--since', type=int, help='every season from this year up to the current one')
+    ap.add_argument('--jobs', type=int, default=1, help='worker threads/processes')
+    ap.add_argument('--offline', action='store_true', help='use cached payloads only, no network')
+    return ap
+
+def selected_seasons(args):
+    """Seasons picked by `--years` / `--since`, or None when neither was given."""
+    years = set(getattr(args, 'years', None) or ())
+    since = getattr(args, 'since', None)
+    if since:
+        years.update(range(since, time.localtime().tm_year + 1))
+    return sorted(years) or None
+
+def _flags(args):
+    """The shared flags as an argv list, for the scripts that parse their own."""
+    argv = ['--jobs', str(args.jobs)]
+    if args.years:
+        argv += ['--years', ','.join(map(str, args.years))]
+    if args.since:
+        argv += ['--since', str(args.since)]
+    if args.offline:
+        argv.append('--offline')
+    return argv
+
+# -- subcommands ------------------------------------------------------------------
+
+def cmd_fetch(args):
+    if args.generator == 'ergast':
+        import fetch_stats_ergast
+        fetch_stats_ergast.run(selected_seasons(args), resume=args.resume, jobs=args.jobs, offline=args.offline)
+    elif args.generator == 'races':
+        import generate_full_stats
+        generate_full_stats.main(_flags(args))
+    else:
+        import generate_stats_from_ergast
+        generate_stats_from_ergast.main(_flags(args))
+    if args.juniors:
+        import fetch_driver_junior_careers
+        fetch_driver_junior_careers.main(_flags(args))
+
+def cmd_fix(args):
+    import fix_stats
+    fix_stats.main(['--input', args.input] if args.input else [])
+    if args.fill:
+        import fill_stats
+        fill_stats.main()
+
+def cmd_validate(args):
+    if args.syntax:
+        import check_stats_json
+        return check_stats_json.main()
+    import validate_stats
+    validate_stats.main()
+
+BUILD_TARGETS = ('stats', 'pages', 'search', 'circuits', 'progression', 'simulation')
+# shared flags each build target honours
+BUILD_FLAGS = {'stats': (), 'pages': ('jobs',), 'search': (), 'circuits': ('years', 'since'),
+               'progression': ('years', 'since'), 'simulation': ('jobs',)}
+
+def cmd_build(args):
+    unknown = [t for t in args.targets if t not in BUILD_TARGETS]
+    if unknown:
+        raise SystemExit(f"f1data build: unknown target {', '.join(unknown)} (choose from {', '.join(BUILD_TARGETS)})")
+    targets = args.targets or BUILD_TARGETS
+    given = [f for f in ('years', 'since', 'jobs', 'offline') if getattr(args, f) not in (None, False)]
+    unused = [f for f in given if not any(f in BUILD_FLAGS[t] for t in targets)]
+    if unused:
+        raise SystemExit(f"f1data build: {', '.join('--' + f for f in unused)} not used by {' '.join(targets)}")
+    for target in targets:
+        t0 = time.perf_counter()
+        if target == 'stats':
+            import run_fetch_and_merge
+            run_fetch_and_merge.merge_and_write()
+        elif target == 'pages':
+            import build_pages
+            rendered, skipped = build_pages.build(jobs=args.jobs, force=args.force)
+            print('Pages rendered:', rendered, 'unchanged:', skipped)
+        elif target == 'search':
+            import search_index
+            search_index.main([])
+        elif target == 'circuits':
+            import build_circuits
+            build_circuits.build(seasons=selected_seasons(args))
+        elif target == 'progression':
+            import build_progression
+            build_progression.build(seasons=selected_seasons(args), force=args.force)
+        elif target == 'simulation':
+            import simulate_season
+            simulate_season.simulate(jobs=args.jobs)
+        print(f'build {target}: {time.perf_counter() - t0:.2f}s')
+
+def cmd_serve(args):
+    import serve_api
+    argv = ['--host', args.host, '--port', str(args.port)]
+    serve_api.main(argv + (['--quiet'] if args.quiet else []))
+
+def cmd_live(args):
+    import live_weekend
+    argv = ['--host', args.host, '--port', str(args.port), '--interval', str(args.interval)]
+    if args.replay is not None:
+        argv += ['--replay', args.replay] if args.replay else ['--replay']
+    live_weekend.main(argv)
+
+def cmd_bench(args):
+    if args.what == 'search':
+        import bench_search
+        return bench_search.main(args.args)
+    if args.what == 'snapshot':
+        import bench_snapshot
+        return bench_snapshot.main(args.args)
+    if args.what == 'rescoring':
+        import bench_rescoring
+        return bench_rescoring.main(args.args)
+    if args.what == 'load':
+        import load_test
+        return load_test.main(args.args)
+    import bench_mirrors
+    return bench_mirrors.main(args.args)
+
+def parser():
+    common = add_common_args(argparse.ArgumentParser(add_help=False))
+    ap = argparse.ArgumentParser(prog='f1data', description='F1 stats data pipeline')
+    sub = ap.add_subparsers(dest='cmd', required=True)
+
+    p = sub.add_parser('fetch', parents=[common], help='download Ergast data into data/stats.generated.json')
+    p.add_argument('--resume', action='store_true', help='continue an interrupted crawl')
+    p.add_argument('--generator', choices=['ergast', 'races', 'standings'], default='ergast',
+                   help='ergast: cached crawl (default); races / standings: the older one-file generators')
+    p.add_argument('--juniors', action='store_true', help='also look up F2/F3 careers on Wikipedia')
+    p.set_defaults(func=cmd_fetch)
+
+    p = sub.add_parser('fix', help='normalize stats.json against the entry list')
+    p.add_argument('--input', help='stats file to normalize instead of data/stats.json')
+    p.add_argument('--fill', action='store_true', help='also write stats.updated.json with every season filled')
+    p.set_defaults(func=cmd_fix)
+
+    p = sub.add_parser('validate', help='write the missing-field report')
+    p.add_argument('--syntax', action='store_true', help='only check that stats.json parses')
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser('build', parents=[common], help='write stats.json and the derived site artifacts')
+    # unset rather than 1, so a --jobs that no target uses can be told apart; targets default to the CPU count
+    p.set_defaults(jobs=None)
+    # no `choices` here: argparse rejects an empty list against them
+    p.add_argument('targets', nargs='*', metavar='TARGET',
+                   help='stats, pages, search, circuits, progression and/or simulation (default: all, in this order)')
+    p.add_argument('--force', action='store_true', help='render every page / progression shard, ignoring the manifest')
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser('serve', help='serve the JSON API')
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8001)
+    p.add_argument('--quiet', action='store_true')
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser('live', help='push race-weekend changes over Server-Sent Events')
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8002)
+    p.add_argument('--interval', type=float, default=20.0, help='seconds between polls')
+    p.add_argument('--replay', nargs='?', const='', metavar='SEASON', help='replay a season from a local stand-in feed')
+    p.set_defaults(func=cmd_live)
+
+    p = sub.add_parser('bench', help='run a benchmark script')
+    p.add_argument('what', choices=['search', 'mirrors', 'snapshot', 'load', 'rescoring'])
+    p.add_argument('args', nargs=argparse.REMAINDER, help='passed on to the benchmark')
+    p.set_defaults(func=cmd_bench)
+    return ap
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
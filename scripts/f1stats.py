@@ -0,0 +1,297 @@
+"""Load-once query library over `data/stats.json`.
+
+    from f1stats import load
+    db = load()
+    db.rank('wins', start=2010, end=2020, limit=5)
+    db.head_to_head('lewis-hamilton', 'george-russell')
+    db.career_arc('max-verstappen')
+
+The dataset is parsed once into a `StatsModel` and indexed by season, team,
+nationality and debut year. Query results are memoized in a bounded LRU; every
+query first checks the source file's mtime/size and, if the pipeline rewrote
+it, reloads and drops the cache. Results are shared between callers, so treat
+them as read-only.
+"""
+import json
+import os
+import threading
+from collections import OrderedDict, defaultdict
+from functools import wraps
+from pathlib import Path
+
+from stats_model import StatsModel
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+STATS = DATA / 'stats.json'
+ENTRIES = DATA / 'entries-2026.json'
+
+def normalize(s):
+    """Team/name key as used by the site: lowercase alphanumerics only."""
+    return ''.join(c for c in (s or '').lower() if c.isalnum())
+
+def file_stamp(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def _num(v):
+    try:
+        return float(v or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+def raced(rec):
+    """Whether a season record is a real participation, not a filled-in zero row.
+
+    The fixers give every driver a zero record in every listed season, so a
+    season counts only with starts, a non-zero counter or a standings position.
+    """
+    if _num(rec.get('races')) > 0 or rec.get('position') is not None:
+        return True
+    return any(_num(rec.get(f)) for f in ('points', 'wins', 'podiums', 'poles', 'fastestLaps'))
+
+# per-season counters that `rank` can sum
+RANK_METRICS = ('points', 'wins', 'podiums', 'poles', 'fastestLaps', 'races')
+
+def cached(fn):
+    """Memoize a StatsDB query in the instance's bounded LRU."""
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if self.auto_refresh:
+            self.refresh()
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        cache = self._cache
+        view = self._view
+        # handler threads share the LRU: an unlocked eviction can race a move_to_end
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                self.hits += 1
+                return cache[key]
+            self.misses += 1
+        result = fn(self, *args, **kwargs)
+        with self._lock:
+            # a reload while this ran already cleared the cache; keep the old result out of it
+            if self._view is view:
+                cache[key] = result
+                if len(cache) > self.cache_size:
+                    cache.popitem(last=False)
+        return result
+    return wrapper
+
+class _View:
+    """One loaded model and the indexes built from it, swapped in as a unit."""
+    __slots__ = ('model', 'by_season', 'teams_by_season', 'by_team', 'by_nationality',
+                 'by_debut', 'team_keys', 'info')
+
+    def __init__(self, m):
+        self.model = m
+        self.by_season = defaultdict(list)       # season -> [driver slug]
+        self.teams_by_season = defaultdict(list) # season -> [team slug]
+        self.by_team = defaultdict(list)         # normalized team -> [(season, driver slug)]
+        self.by_nationality = defaultdict(list)  # nationality -> [driver slug]
+        self.by_debut = defaultdict(list)        # first season raced -> [driver slug]
+        self.team_keys = {}                      # team slug -> normalized names it goes by
+        for slug, ent in m.drivers.items():
+            first = None
+            for y, rec in ent.items():
+                if raced(rec):
+                    self.by_season[y].append(slug)
+                    if first is None:
+                        first = y
+                if rec.team:
+                    self.by_team[normalize(rec.team)].append((y, slug))
+            if first is not None:
+                self.by_debut[first].append(slug)
+        for slug, ent in m.teams.items():
+            for y, rec in ent.items():
+                if raced(rec):
+                    self.teams_by_season[y].append(slug)
+            keys = {normalize(slug)}
+            keys.update(normalize(a) for a in (ent.extra or {}).get('aliases', []))
+            self.team_keys[slug] = keys
+
+        info = dict(m.extra.get('drivers') or {})
+        if ENTRIES.exists():
+            entries = json.loads(ENTRIES.read_text(encoding='utf8'))
+            for team in entries.get('teams', []):
+                for d in team.get('drivers', []):
+                    di = info[d.get('slug')] = dict(info.get(d.get('slug')) or {})
+                    di.setdefault('nationality', d.get('nationality'))
+                    di.setdefault('name', d.get('name'))
+                    di.setdefault('teamSlug', team.get('slug'))
+                    # page-only extras: the Dutch nationality label and the race number
+                    for k in ('nationalityLabel', 'number'):
+                        if d.get(k) is not None:
+                            di.setdefault(k, d[k])
+                # the current entry name is another name the team goes by
+                self.team_keys.setdefault(team.get('slug'), {normalize(team.get('slug'))}).add(normalize(team.get('name')))
+        self.info = info
+        for slug, d in info.items():
+            if slug in m.drivers and d.get('nationality'):
+                self.by_nationality[d['nationality'].lower()].append(slug)
+
+def _view_attr(name):
+    return property(lambda self: getattr(self._view, name))
+
+class StatsDB:
+    """Indexed, memoized view of one stats file.
+
+    With `auto_refresh=False` the instance never reloads itself; callers that
+    need an atomic swap (the API server) build a new StatsDB instead. A reload
+    builds the new model and its indexes first and then replaces both with one
+    assignment, so a concurrent query never mixes a new model with old indexes.
+    """
+
+    def __init__(self, path=STATS, cache_size=256, auto_refresh=True):
+        self.path = Path(path)
+        self.cache_size = cache_size
+        self.auto_refresh = auto_refresh
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._view = None
+        self.hits = self.misses = 0
+        self.refresh()
+
+    model = _view_attr('model')
+    by_season = _view_attr('by_season')
+    teams_by_season = _view_attr('teams_by_season')
+    by_team = _view_attr('by_team')
+    by_nationality = _view_attr('by_nationality')
+    by_debut = _view_attr('by_debut')
+    team_keys = _view_attr('team_keys')
+    info = _view_attr('info')
+
+    # -- loading / indexes -------------------------------------------------
+
+    def _file_stamp(self):
+        return file_stamp(self.path)
+
+    def is_stale(self):
+        return file_stamp(self.path) != self._stamp
+
+    def refresh(self):
+        """Reload if the source file changed since it was last read."""
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return False
+        view = _View(StatsModel.load(self.path))
+        with self._lock:
+            self._view = view
+            self._stamp = stamp
+            self._cache.clear()
+        return True
+
+    # -- queries ------------------------------------------------------------
+    # each query reads `self._view` once, so a reload cannot change it midway
+
+    @cached
+    def rank(self, metric, start=None, end=None, limit=10, kind='drivers'):
+        """Entities that raced in start..end (inclusive), ranked by `metric` summed over those seasons.
+
+        `metric` is one of `RANK_METRICS`; anything else raises ValueError.
+        """
+        if metric not in RANK_METRICS:
+            raise ValueError(f'unsupported metric {metric!r} (expected one of {", ".join(RANK_METRICS)})')
+        v = self._view
+        entities = v.model.drivers if kind == 'drivers' else v.model.teams
+        index = v.by_season if kind == 'drivers' else v.teams_by_season
+        totals = defaultdict(float)
+        for y, slugs in index.items():
+            if (start is None or y >= start) and (end is None or y <= end):
+                for slug in slugs:
+                    totals[slug] += _num(getattr(entities[slug].get(y), metric))
+        out = [(slug, int(t) if t.is_integer() else t) for slug, t in totals.items()]
+        out.sort(key=lambda r: (-r[1], r[0]))
+        return tuple(out[:limit]) if limit else tuple(out)
+
+    @cached
+    def season_table(self, season, metric='points'):
+        """Drivers that raced in `season`, best `metric` first."""
+        v = self._view
+        rows = []
+        for slug in v.by_season.get(int(season), ()):
+            rec = v.model.drivers[slug].get(season)
+            rows.append((slug, rec.to_dict()))
+        rows.sort(key=lambda r: (-_num(r[1].get(metric)), r[0]))
+        return tuple(rows)
+
+    @cached
+    def team_drivers(self, team, season):
+        """Drivers whose season team matches `team` (slug, alias or name).
+
+        Matching is the site's loose rule: normalized names contained in one
+        another ('Red Bull' vs 'oracle-red-bull').
+        """
+        v = self._view
+        keys = v.team_keys.get(team) or {normalize(team)}
+        season = int(season)
+        out = []
+        for name, rows in v.by_team.items():
+            if not any(k and (name in k or k in name) for k in keys):
+                continue
+            out.extend(slug for y, slug in rows if y == season)
+        return tuple(sorted(set(out)))
+
+    @cached
+    def teammates(self, slug, season):
+        v = self._view
+        rec = v.model.drivers[slug].get(season)
+        if rec is None or not rec.team:
+            return ()
+        rows = v.by_team.get(normalize(rec.team), ())
+        return tuple(sorted(s for y, s in rows if y == int(season) and s != slug))
+
+    @cached
+    def head_to_head(self, a, b):
+        """Season-by-season comparison of two drivers where they were teammates.
+
+        `aheadInStandings` counts the seasons each finished ahead; a shared
+        position counts for neither.
+        """
+        drivers = self._view.model.drivers
+        da, db = drivers[a], drivers[b]
+        seasons = []
+        tally = {a: 0, b: 0}
+        for y, ra in da.items():
+            rb = db.get(y)
+            if rb is None or not ra.team or normalize(ra.team) != normalize(rb.team):
+                continue
+            pa, pb = ra.position, rb.position
+            if pa and pb and pa != pb:
+                tally[a if pa < pb else b] += 1
+            seasons.append({'season': y, 'team': ra.team,
+                            a: {'points': ra.points, 'position': pa},
+                            b: {'points': rb.points, 'position': pb}})
+        return {'seasons': seasons, 'aheadInStandings': tally}
+
+    @cached
+    def career_arc(self, slug):
+        """Per-season points/position with running totals, oldest first."""
+        arc = []
+        total = 0.0
+        for y, rec in self._view.model.drivers[slug].items():
+            total += _num(rec.points)
+            arc.append({'season': y, 'team': rec.team, 'points': rec.points,
+                        'position': rec.position, 'cumulativePoints': total})
+        return tuple(arc)
+
+    @cached
+    def by_nationality_of(self, nationality):
+        return tuple(sorted(self._view.by_nationality.get(nationality.lower(), ())))
+
+    @cached
+    def debuts(self, season):
+        """Drivers whose first raced season is `season`."""
+        return tuple(sorted(self._view.by_debut.get(int(season), ())))
+
+_DB = {}
+
+def load(path=STATS, cache_size=256):
+    """Shared StatsDB for `path`; cheap to call repeatedly."""
+    key = str(Path(path).resolve())
+    db = _DB.get(key)
+    if db is None:
+        db = _DB[key] = StatsDB(path, cache_size=cache_size)
+    return db
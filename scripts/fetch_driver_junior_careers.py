@@ -12,16 +12,22 @@ This is a best-effort extractor — Wikipedia pages differ markedly, so the
 script looks for nearby 4-digit years around occurrences of "Formula 2"/"F2"
 and "Formula 3"/"F3" and returns the found years.
 
-Requires: requests
+Usage: python scripts/fetch_driver_junior_careers.py [--since 2025]
+
+`--since` (or the first of `--years`) sets the earliest debut season to
+inspect.
+
+Requires: requests, beautifulsoup4 (imported on first use)
 """
 from pathlib import Path
+import argparse
 import json
 import re
 import time
 from urllib.parse import unquote
 
-import requests
-from bs4 import BeautifulSoup
+from f1data import add_common_args, selected_seasons
+from pipeline_io import write_json
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA = ROOT / 'data'
@@ -30,6 +36,7 @@ STATS_SRC = DATA / 'stats.json'
 OUT_FILE = DATA / 'drivers.junior.json'
 
 WIKI_API = 'https://en.wikipedia.org/w/api.php'
+DEBUT_FROM = 2025
 
 def load_stats():
     if STATS_GEN.exists():
@@ -47,11 +54,15 @@ def extract_title_from_url(url):
         pass
     return None
 
-def wiki_search(title):
-    params = {'action':'query','list':'search','srsearch':title,'format':'json','srlimit':1}
+def wiki_get(params):
+    import requests
     r = requests.get(WIKI_API, params=params, timeout=15)
     r.raise_for_status()
-    js = r.json()
+    return r.json()
+
+def wiki_search(title):
+    params = {'action':'query','list':'search','srsearch':title,'format':'json','srlimit':1}
+    js = wiki_get(params)
     hits = js.get('query',{}).get('search', [])
     if not hits:
         return None
@@ -59,9 +70,7 @@ def wiki_search(title):
 
 def fetch_wikitext(title):
     params = {'action':'query','prop':'revisions','rvprop':'content','rvslots':'*','titles':title,'format':'json'}
-    r = requests.get(WIKI_API, params=params, timeout=15)
-    r.raise_for_status()
-    js = r.json()
+    js = wiki_get(params)
     pages = js.get('query', {}).get('pages', {})
     for p in pages.values():
         revs = p.get('revisions')
@@ -74,9 +83,7 @@ def fetch_wikitext(title):
 
 def fetch_parsed_html(title):
     params = {'action':'parse','page':title,'prop':'text','format':'json'}
-    r = requests.get(WIKI_API, params=params, timeout=15)
-    r.raise_for_status()
-    js = r.json()
+    js = wiki_get(params)
     text = js.get('parse', {}).get('text', {}).get('*', '')
     return text
 
@@ -84,6 +91,7 @@ def find_series_years_from_tables(html, keywords):
     found = set()
     if not html:
         return []
+    from bs4 import BeautifulSoup
     soup = BeautifulSoup(html, 'html.parser')
     # examine captions and entire table text
     tables = soup.find_all('table')
@@ -128,7 +136,15 @@ def find_series_years(wikitext, keywords):
     # sort and return
     return sorted(found)
 
-def main():
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Look up F2/F3 careers of recent debutants on Wikipedia')
+    add_common_args(ap)
+    args = ap.parse_args(argv)
+    if args.offline:
+        print('Junior careers come from Wikipedia; skipped in offline mode')
+        return
+    first_debut = (selected_seasons(args) or [DEBUT_FROM])[0]
+
     stats = load_stats()
     drivers = stats.get('drivers', {})
     results = {}
@@ -144,10 +160,10 @@ def main():
         except Exception:
             continue
         debut = yrs[0]
-        if debut >= 2025:
+        if debut >= first_debut:
             targets.append((slug, entry, debut))
 
-    print(f'Found {len(targets)} drivers with debut >= 2025 to inspect')
+    print(f'Found {len(targets)} drivers with debut >= {first_debut} to inspect')
 
     for i, (slug, entry, debut) in enumerate(targets, start=1):
         print(f'[{i}/{len(targets)}] Processing', slug)
@@ -198,13 +214,13 @@ def main():
         time.sleep(0.5)
 
     # write outputs
-    OUT_FILE.write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf8')
+    write_json(OUT_FILE, results)
     print('Wrote', OUT_FILE)
 
     # if stats.generated exists, overwrite with updated drivers attached
     if STATS_GEN.exists():
         stats['drivers'] = drivers
-        STATS_GEN.write_text(json.dumps(stats, indent=2, ensure_ascii=False), encoding='utf8')
+        write_json(STATS_GEN, stats)
         print('Updated', STATS_GEN)
 
 if __name__ == '__main__':
@@ -1,23 +1,67 @@
 #!/usr/bin/env python3
 """Fetch stats from Ergast API and generate data/stats.generated.json.
 
-Usage: python scripts/fetch_stats_ergast.py
+Usage: python scripts/fetch_stats_ergast.py [--resume] [--years 2020-2026 | --since 2024] [--jobs 4] [--offline]
+
+Raw responses are cached gzip-compressed as `data/ergast/*.json.gz`. List
+endpoints are paged (`limit=100`, the cap of api.jolpi.ca) until
+`MRData.total` is reached and cached as one merged payload; a short row count
+is an error rather than a silently truncated season.
+Every completed request (endpoint, season, page) is journaled in
+`data/ergast/.checkpoint.jsonl`.
+With `--resume` an interrupted run reuses the cached payloads for those units
+and only fetches what is still missing; `--offline` never touches the network
+and builds from whatever is cached. `--jobs N` fetches N seasons at a time.
+
+Requests go through `ergast_source.ErgastSource`, so the base URL can be a
+list of mirrors (`ERGAST_MIRRORS=http://localhost:8000/f1,https://ergast.com/api/f1`).
+
+Season points come from the standings. Race and sprint (`sprint.json`) rows
+are summed in the same pass that counts wins/podiums, and every driver or
+constructor whose standings total differs from race + sprint points is
+listed in `data/points-reconciliation.json`.
 
 Requires: requests
 """
+import argparse
 import json
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-import requests
+from ergast_source import default_source
+from f1data import add_common_args, selected_seasons
+from pipeline_io import (Checkpoint, cache_exists, cache_file,
+                         read_cached_json, write_cache_stream, write_json)
+from snapshot_store import snapshot
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA = ROOT / 'data'
 STATS_IN = DATA / 'stats.json'
 STATS_OUT = DATA / 'stats.generated.json'
 ERGAST_DIR = DATA / 'ergast'
+PAGES_DIR = ERGAST_DIR / 'pages'
+CHECKPOINT_FILE = ERGAST_DIR / '.checkpoint.jsonl'
+RECONCILE_OUT = DATA / 'points-reconciliation.json'
+
+# journal of completed fetch units; set up by main()
+CHECKPOINT = None
+# serve every request from the cache (`--offline`); uncached payloads are errors
+OFFLINE = False
+_last_request = 0.0
+# raw bytes downloaded vs. bytes stored in the compressed cache this run
+TRANSFER = {'raw': 0, 'stored': 0}
+# standings vs race+sprint row totals that disagree, filled by fetch_season
+MISMATCHES = []
+# rows per request; api.jolpi.ca caps `limit` at 100
+PAGE_SIZE = 100
+# per-item row lists that Ergast pages over (a race split across two pages shows up in both)
+ROW_LISTS = ('Results', 'SprintResults', 'QualifyingResults', 'DriverStandings', 'ConstructorStandings')
+
+class IncompletePayload(RuntimeError):
+    """A paged endpoint returned fewer rows than its `MRData.total`."""
 
 def safe_get(d, *keys, default=None):
     for k in keys:
@@ -26,217 +70,372 @@ def safe_get(d, *keys, default=None):
         d = d[k]
     return d
 
-def fetch_json(url, save_path=None, retries=3, backoff=1.0):
+def fetch_json(path, save_path=None, retries=3, backoff=1.0, unit=None, throttle=0.0):
+    """GET Ergast `path` (relative to the API root) as JSON.
+
+    The request goes to the best available mirror. The body is written once
+    into the gzip cache entry at `save_path` (if given) and parsed once from
+    the same bytes. `unit` is an (endpoint, season, page) tuple; when the
+    checkpoint journal already has it and the cache entry exists, the cached
+    payload is returned without a request. `throttle` is the minimum gap in
+    seconds since the previous network request.
+    """
+    global _last_request
+    if unit and CHECKPOINT is not None and save_path and cache_exists(save_path) and CHECKPOINT.is_done(*unit):
+        return read_cached_json(save_path)
+    if OFFLINE:
+        if save_path and cache_exists(save_path):
+            return read_cached_json(save_path)
+        raise LookupError(f'offline: {path} is not cached')
+    wait = throttle - (time.monotonic() - _last_request)
+    if wait > 0:
+        time.sleep(wait)
     last_err = None
     for attempt in range(1, retries + 1):
         try:
-            headers = {'User-Agent': 'stats-fetcher/1.0 (+https://example.invalid)'}
-            r = requests.get(url, timeout=15, headers=headers)
-            r.raise_for_status()
+            chunks = default_source().get_chunks(path)
             if save_path:
-                save_path.write_text(r.text, encoding='utf8')
-            return r.json()
+                # chunks go straight into the gzip writer; parse the one buffer it collected
+                body = write_cache_stream(save_path, chunks)
+                TRANSFER['stored'] += cache_file(save_path).stat().st_size
+            else:
+                body = b''.join(chunks)
+            _last_request = time.monotonic()
+            TRANSFER['raw'] += len(body)
+            data = json.loads(body)
+            if unit and CHECKPOINT is not None:
+                CHECKPOINT.mark(*unit)
+            return data
         except Exception as e:
             last_err = e
-            print(f'fetch_json attempt {attempt} failed for {url}:', e)
+            print(f'fetch_json attempt {attempt} failed for {path}:', e)
             time.sleep(backoff * attempt)
     raise last_err
 
-def main():
-    if not STATS_IN.exists():
-        print('Missing', STATS_IN)
-        return
+def _table_items(payload):
+    """The item list of an Ergast payload (`RaceTable.Races`, `DriverTable.Drivers`, ...)."""
+    for key, table in payload.get('MRData', {}).items():
+        if key.endswith('Table') and isinstance(table, dict):
+            for v in table.values():
+                if isinstance(v, list):
+                    return v
+    return []
 
-    stats_src = json.loads(STATS_IN.read_text())
-    seasons = stats_src.get('seasons', [])
-    if not seasons:
-        # default to seasons from 2000 up to current year
-        current = datetime.now().year
-        seasons = list(range(2000, current + 1))
+def _row_list(item):
+    return next((k for k in ROW_LISTS if k in item), None)
 
-    # ensure ergast cache directory exists
-    ERGAST_DIR.mkdir(parents=True, exist_ok=True)
+def count_rows(payload):
+    """Rows as Ergast counts them for `MRData.total`: result/standings rows, else items."""
+    return sum(len(it[k]) if (k := _row_list(it)) else 1 for it in _table_items(payload))
 
-    driver_stats = {}
-    team_stats = {}
-    driver_info = {}
-    ctor_info = {}
+def merge_pages(pages):
+    """One payload holding the rows of every page, as if the endpoint had not been paged."""
+    merged = json.loads(json.dumps(pages[0]))
+    items = _table_items(merged)
+    for page in pages[1:]:
+        for it in _table_items(page):
+            k = _row_list(it)
+            last = items[-1] if items else None
+            if k and last is not None and k in last and (last.get('season'), last.get('round')) == (it.get('season'), it.get('round')):
+                last[k].extend(it[k])
+            else:
+                items.append(it)
+    mr = merged.get('MRData', {})
+    mr['limit'], mr['offset'] = str(count_rows(merged)), '0'
+    return merged
 
-    for season in seasons:
-        s = str(season)
-        print('Season', s)
-        # initialize per-season containers
-        per_driver = defaultdict(lambda: {'points': 0.0, 'wins': 0, 'podiums': 0, 'poles': 0, 'fastestLaps': 0, 'team': None, 'position': None})
-        per_team = defaultdict(lambda: {'points': 0.0, 'wins': 0, 'position': None})
+def page_file(save_path, page):
+    return PAGES_DIR / f'{Path(save_path).name.removesuffix(".json")}.p{page}.json'
 
-        # Driver standings (final positions and points)
-        try:
-            ds = fetch_json(f'https://ergast.com/api/f1/{s}/driverStandings.json', save_path=ERGAST_DIR / f'ergast_{s}_driverStandings.json')
-            standings = safe_get(ds, 'MRData', 'StandingsTable', 'StandingsLists', default=[])
-            if standings:
-                driver_list = standings[0].get('DriverStandings', [])
-                for d in driver_list:
-                    driverId = safe_get(d, 'Driver', 'driverId')
-                    points = float(d.get('points', 0))
-                    position = int(d.get('position', 0)) if d.get('position') else None
-                    # normalize Ergast driverId to repo slug style: underscores -> hyphens
-                    if driverId:
-                        driver_slug = driverId.replace('_', '-').lower()
-                    else:
-                        driver_slug = None
-                    per_driver[driver_slug]['points'] = points
-                    per_driver[driver_slug]['position'] = position
-        except Exception as e:
-            print('DriverStandings error', e)
+def fetch_pages(path, save_path, unit, throttle=0.0):
+    """GET every page of a list endpoint and cache them as one payload.
 
-        time.sleep(0.5)
+    Page `k` is requested with `limit=PAGE_SIZE&offset=k*PAGE_SIZE` until
+    `MRData.total` is covered. Each page is cached under `data/ergast/pages/`
+    and journaled as `(endpoint, season, k)`, so `--resume` continues at the
+    page level. Once all pages are in, the merged payload is written to
+    `save_path` and the page files are removed. `unit` is `(endpoint, season)`.
+    Raises `IncompletePayload` when the pages hold fewer rows than `total`.
+    """
+    endpoint, season = unit
+    # page files only outlive a fetch that was interrupted before the merge
+    leftover = any(PAGES_DIR.glob(f'{Path(save_path).name.removesuffix(".json")}.p*.json*'))
+    if cache_exists(save_path) and (OFFLINE or (CHECKPOINT is not None and not leftover
+                                                 and CHECKPOINT.is_done(endpoint, season, 0))):
+        return read_cached_json(save_path)
+    sep = '&' if '?' in path else '?'
+    pages, total = [], None
+    while total is None or len(pages) * PAGE_SIZE < total:
+        k = len(pages)
+        page = fetch_json(f'{path}{sep}limit={PAGE_SIZE}&offset={k * PAGE_SIZE}', save_path=page_file(save_path, k),
+                          unit=(endpoint, season, k), throttle=throttle)
+        total = int(safe_get(page, 'MRData', 'total', default=0) or 0)
+        pages.append(page)
+    payload = merge_pages(pages)
+    rows = count_rows(payload)
+    if rows < total:
+        raise IncompletePayload(f'{path}: {rows} of {total} rows in {len(pages)} pages')
+    write_cache_stream(save_path, [json.dumps(payload).encode('utf8')], collect=False)
+    for k in range(len(pages)):
+        cache_file(page_file(save_path, k)).unlink(missing_ok=True)
+    return payload
 
-        # Constructor standings
-        try:
-            cs = fetch_json(f'https://ergast.com/api/f1/{s}/constructorStandings.json', save_path=ERGAST_DIR / f'ergast_{s}_constructorStandings.json')
-            standings = safe_get(cs, 'MRData', 'StandingsTable', 'StandingsLists', default=[])
-            if standings:
-                ctor_list = standings[0].get('ConstructorStandings', [])
-                for c in ctor_list:
-                    ctorId = safe_get(c, 'Constructor', 'constructorId')
-                    points = float(c.get('points', 0))
-                    position = int(c.get('position', 0)) if c.get('position') else None
-                    ctor_slug = ctorId.replace('_', '-').lower() if ctorId else None
-                    # collect constructor info
-                    if ctor_slug:
-                        ci = ctor_info.setdefault(ctor_slug, {'constructorId': ctorId, 'name': safe_get(c, 'Constructor', 'name'), 'seasons': []})
-                        if s not in ci['seasons']:
-                            ci['seasons'].append(s)
-                    per_team[ctor_slug]['points'] = points
-                    per_team[ctor_slug]['position'] = position
-        except Exception as e:
-            print('ConstructorStandings error', e)
+def fetch_season(s, driver_info, ctor_info):
+    """Fetch and aggregate the season-level Ergast endpoints for season `s`.
 
-        time.sleep(0.5)
+    Returns `(per_driver, per_team)` dicts keyed by site slug. `driver_info`
+    and `ctor_info` are updated in place with any drivers/constructors seen.
+    """
+    print('Season', s)
+    per_driver, per_team = season_rows()
+    # standings points per slug, the authoritative season totals
+    driver_standings = {}
+    team_standings = {}
 
-        # All race results for season
-        try:
-            res = fetch_json(f'https://ergast.com/api/f1/{s}/results.json?limit=1000', save_path=ERGAST_DIR / f'ergast_{s}_results.json')
-            races = safe_get(res, 'MRData', 'RaceTable', 'Races', default=[])
-            for race in races:
-                results = race.get('Results', [])
-                for r in results:
-                    driverId = safe_get(r, 'Driver', 'driverId')
-                    ctorId = safe_get(r, 'Constructor', 'constructorId')
-                    pos_text = r.get('position')
-                    try:
-                        pos = int(pos_text) if pos_text and pos_text.isdigit() else None
-                    except Exception:
-                        pos = None
-                    points = float(r.get('points', 0) or 0)
-                    # wins
-                    # normalize ids
-                    driver_slug = driverId.replace('_', '-').lower() if driverId else None
-                    ctor_slug = ctorId.replace('_', '-').lower() if ctorId else None
-                    # collect constructor seasonal association
-                    if ctor_slug:
-                        ci = ctor_info.setdefault(ctor_slug, {'constructorId': ctorId, 'name': safe_get(r, 'Constructor', 'name'), 'seasons': []})
-                        if s not in ci['seasons']:
-                            ci['seasons'].append(s)
-                    # collect driver basic info from race row if missing
-                    if driver_slug:
-                        di = driver_info.setdefault(driver_slug, {'driverId': driverId, 'givenName': safe_get(r, 'Driver', 'givenName'), 'familyName': safe_get(r, 'Driver', 'familyName'), 'dateOfBirth': None, 'nationality': None, 'code': None, 'url': None, 'seasons': []})
-                        if s not in di['seasons']:
-                            di['seasons'].append(s)
-                    if pos == 1:
-                        per_driver[driver_slug]['wins'] += 1
-                        per_team[ctor_slug]['wins'] += 1
-                        per_driver[driver_slug]['team'] = safe_get(r, 'Constructor', 'name') or per_driver[driver_slug].get('team')
-                    # podiums
-                    if pos and pos <= 3:
-                        per_driver[driver_slug]['podiums'] += 1
-                    # points
-                    per_driver[driver_slug]['points'] += points
-                    # fastest lap
-                    fl = r.get('FastestLap')
-                    if fl and fl.get('rank') in ('1', 1):
-                        per_driver[driver_slug]['fastestLaps'] += 1
-                        per_team[ctor_slug]['fastestLaps'] = per_team[ctor_slug].get('fastestLaps', 0) + 1
-        except Exception as e:
-            print('Results error', e)
+    # Driver standings (final positions and points)
+    try:
+        ds = fetch_pages(f'{s}/driverStandings.json', save_path=ERGAST_DIR / f'ergast_{s}_driverStandings.json', unit=('driverStandings', s), throttle=0.5)
+        standings = safe_get(ds, 'MRData', 'StandingsTable', 'StandingsLists', default=[])
+        if standings:
+            driver_list = standings[0].get('DriverStandings', [])
+            for d in driver_list:
+                driverId = safe_get(d, 'Driver', 'driverId')
+                points = float(d.get('points', 0))
+                position = int(d.get('position', 0)) if d.get('position') else None
+                # normalize Ergast driverId to repo slug style: underscores -> hyphens
+                if driverId:
+                    driver_slug = driverId.replace('_', '-').lower()
+                else:
+                    driver_slug = None
+                per_driver[driver_slug]['points'] = points
+                per_driver[driver_slug]['position'] = position
+                driver_standings[driver_slug] = points
+    except IncompletePayload:
+        raise
+    except Exception as e:
+        print('DriverStandings error', e)
 
-        time.sleep(0.5)
 
-        # Drivers list for season (collect basic driver info)
-        try:
-            dr = fetch_json(f'https://ergast.com/api/f1/{s}/drivers.json?limit=1000', save_path=ERGAST_DIR / f'ergast_{s}_drivers.json')
-            drivers = safe_get(dr, 'MRData', 'DriverTable', 'Drivers', default=[])
-            for d in drivers:
-                driverId = d.get('driverId')
-                if not driverId:
+    # Constructor standings
+    try:
+        cs = fetch_pages(f'{s}/constructorStandings.json', save_path=ERGAST_DIR / f'ergast_{s}_constructorStandings.json', unit=('constructorStandings', s), throttle=0.5)
+        standings = safe_get(cs, 'MRData', 'StandingsTable', 'StandingsLists', default=[])
+        if standings:
+            ctor_list = standings[0].get('ConstructorStandings', [])
+            for c in ctor_list:
+                ctorId = safe_get(c, 'Constructor', 'constructorId')
+                points = float(c.get('points', 0))
+                position = int(c.get('position', 0)) if c.get('position') else None
+                ctor_slug = ctorId.replace('_', '-').lower() if ctorId else None
+                # collect constructor info
+                if ctor_slug:
+                    ci = ctor_info.setdefault(ctor_slug, {'constructorId': ctorId, 'name': safe_get(c, 'Constructor', 'name'), 'seasons': []})
+                    if s not in ci['seasons']:
+                        ci['seasons'].append(s)
+                per_team[ctor_slug]['points'] = points
+                per_team[ctor_slug]['position'] = position
+                team_standings[ctor_slug] = points
+    except IncompletePayload:
+        raise
+    except Exception as e:
+        print('ConstructorStandings error', e)
+
+
+    # Race and sprint results: one pass over both sets of rows builds the
+    # per-race aggregates and the row-level points that are reconciled below
+    sessions = []
+    try:
+        res = fetch_pages(f'{s}/results.json', save_path=ERGAST_DIR / f'ergast_{s}_results.json', unit=('results', s), throttle=0.5)
+        sessions.append((False, safe_get(res, 'MRData', 'RaceTable', 'Races', default=[]), 'Results'))
+    except IncompletePayload:
+        raise
+    except Exception as e:
+        print('Results error', e)
+    try:
+        sp = fetch_pages(f'{s}/sprint.json', save_path=ERGAST_DIR / f'ergast_{s}_sprint.json', unit=('sprint', s), throttle=0.5)
+        sessions.append((True, safe_get(sp, 'MRData', 'RaceTable', 'Races', default=[]), 'SprintResults'))
+    except IncompletePayload:
+        raise
+    except Exception as e:
+        print('Sprint results error', e)
+
+    driver_rows, team_rows = tally_results(s, sessions, per_driver, per_team, driver_info, ctor_info)
+    reconcile_points(s, 'driver', per_driver, driver_standings, driver_rows)
+    reconcile_points(s, 'team', per_team, team_standings, team_rows)
+
+    # Drivers list for season (collect basic driver info)
+    try:
+        dr = fetch_pages(f'{s}/drivers.json', save_path=ERGAST_DIR / f'ergast_{s}_drivers.json', unit=('drivers', s), throttle=0.5)
+        drivers = safe_get(dr, 'MRData', 'DriverTable', 'Drivers', default=[])
+        for d in drivers:
+            driverId = d.get('driverId')
+            if not driverId:
+                continue
+            driver_slug = driverId.replace('_', '-').lower()
+            entry = driver_info.setdefault(driver_slug, {
+                'driverId': driverId,
+                'givenName': d.get('givenName'),
+                'familyName': d.get('familyName'),
+                'dateOfBirth': d.get('dateOfBirth'),
+                'nationality': d.get('nationality'),
+                'code': d.get('code'),
+                'url': d.get('url'),
+                'seasons': []
+            })
+            if s not in entry['seasons']:
+                entry['seasons'].append(s)
+    except IncompletePayload:
+        raise
+    except Exception as e:
+        print('Drivers list error', e)
+    # Qualifying results for poles
+    try:
+        q = fetch_pages(f'{s}/qualifying.json', save_path=ERGAST_DIR / f'ergast_{s}_qualifying.json', unit=('qualifying', s), throttle=0.5)
+        tally_poles(safe_get(q, 'MRData', 'RaceTable', 'Races', default=[]), per_driver)
+    except IncompletePayload:
+        raise
+    except Exception as e:
+        print('Qualifying error', e)
+
+    return per_driver, per_team
+
+def season_rows():
+    """Empty `(per_driver, per_team)` aggregates for one season (or round)."""
+    per_driver = defaultdict(lambda: {'points': 0.0, 'wins': 0, 'podiums': 0, 'poles': 0, 'fastestLaps': 0, 'races': 0, 'team': None, 'position': None})
+    per_team = defaultdict(lambda: {'points': 0.0, 'wins': 0, 'fastestLaps': 0, 'position': None})
+    return per_driver, per_team
+
+def tally_results(s, sessions, per_driver, per_team, driver_info, ctor_info):
+    """Count race and sprint rows into `per_driver` / `per_team`.
+
+    `sessions` holds `(sprint, races, key)` triples, `key` being the result
+    list of each race (`Results` / `SprintResults`). Returns the
+    `slug -> [race points, sprint points]` sums for drivers and teams.
+    """
+    # slug -> [race points, sprint points] summed from the rows
+    driver_rows = defaultdict(lambda: [0.0, 0.0])
+    team_rows = defaultdict(lambda: [0.0, 0.0])
+    driver_teams = defaultdict(list)
+    for sprint, races, key in sessions:
+        for race in races:
+            for r in race.get(key, []):
+                driverId = safe_get(r, 'Driver', 'driverId')
+                ctorId = safe_get(r, 'Constructor', 'constructorId')
+                pos_text = r.get('position')
+                try:
+                    pos = int(pos_text) if pos_text and pos_text.isdigit() else None
+                except Exception:
+                    pos = None
+                points = float(r.get('points', 0) or 0)
+                # normalize ids
+                driver_slug = driverId.replace('_', '-').lower() if driverId else None
+                ctor_slug = ctorId.replace('_', '-').lower() if ctorId else None
+                # collect constructor seasonal association
+                if ctor_slug:
+                    ci = ctor_info.setdefault(ctor_slug, {'constructorId': ctorId, 'name': safe_get(r, 'Constructor', 'name'), 'seasons': []})
+                    if s not in ci['seasons']:
+                        ci['seasons'].append(s)
+                # collect driver basic info from race row if missing
+                if driver_slug:
+                    di = driver_info.setdefault(driver_slug, {'driverId': driverId, 'givenName': safe_get(r, 'Driver', 'givenName'), 'familyName': safe_get(r, 'Driver', 'familyName'), 'dateOfBirth': None, 'nationality': None, 'code': None, 'url': None, 'seasons': []})
+                    if s not in di['seasons']:
+                        di['seasons'].append(s)
+                driver_rows[driver_slug][sprint] += points
+                team_rows[ctor_slug][sprint] += points
+                if sprint:
+                    # sprints add points only; wins/podiums/starts count Grands Prix
                     continue
-                driver_slug = driverId.replace('_', '-').lower()
-                entry = driver_info.setdefault(driver_slug, {
-                    'driverId': driverId,
-                    'givenName': d.get('givenName'),
-                    'familyName': d.get('familyName'),
-                    'dateOfBirth': d.get('dateOfBirth'),
-                    'nationality': d.get('nationality'),
-                    'code': d.get('code'),
-                    'url': d.get('url'),
-                    'seasons': []
-                })
-                if s not in entry['seasons']:
-                    entry['seasons'].append(s)
-        except Exception as e:
-            print('Drivers list error', e)
-        # Qualifying results for poles
-        try:
-            q = fetch_json(f'https://ergast.com/api/f1/{s}/qualifying.json?limit=1000', save_path=ERGAST_DIR / f'ergast_{s}_qualifying.json')
-            races = safe_get(q, 'MRData', 'RaceTable', 'Races', default=[])
-            for race in races:
-                quals = race.get('QualifyingResults', [])
-                for qual in quals:
-                    driverId = safe_get(qual, 'Driver', 'driverId')
-                    pos_text = qual.get('position')
-                    try:
-                        pos = int(pos_text) if pos_text and pos_text.isdigit() else None
-                    except Exception:
-                        pos = None
-                    if pos == 1:
-                        driver_slug = driverId.replace('_', '-').lower() if driverId else None
-                        per_driver[driver_slug]['poles'] += 1
-        except Exception as e:
-            print('Qualifying error', e)
-
-        # merge per-season into global structure
-        for driverId, vals in per_driver.items():
-            key = driverId or ''
-            ds = driver_stats.setdefault(key, {'bySeason': {}, 'allTime': {}})
-            pts = vals.get('points', 0)
-            ds['bySeason'][s] = {
-                'team': vals.get('team'),
-                'points': int(pts) if float(pts).is_integer() else float(pts),
-                'wins': int(vals.get('wins', 0)),
-                'podiums': int(vals.get('podiums', 0)),
-                'poles': int(vals.get('poles', 0)),
-                'fastestLaps': int(vals.get('fastestLaps', 0)),
-                'position': vals.get('position')
-            }
-
-        for ctorId, vals in per_team.items():
-            key = ctorId or ''
-            ts = team_stats.setdefault(key, {'bySeason': {}, 'allTime': {}})
-            pts = vals.get('points', 0)
-            ts['bySeason'][s] = {
-                'points': int(pts) if float(pts).is_integer() else float(pts),
-                'wins': int(vals.get('wins', 0)),
-                'position': vals.get('position')
-            }
+                # starts (one result row per race entered) and every team driven for
+                per_driver[driver_slug]['races'] += 1
+                team_name = safe_get(r, 'Constructor', 'name')
+                if team_name and team_name not in driver_teams[driver_slug]:
+                    driver_teams[driver_slug].append(team_name)
+                if pos == 1:
+                    per_driver[driver_slug]['wins'] += 1
+                    per_team[ctor_slug]['wins'] += 1
+                # podiums
+                if pos and pos <= 3:
+                    per_driver[driver_slug]['podiums'] += 1
+                # fastest lap
+                fl = r.get('FastestLap')
+                if fl and fl.get('rank') in ('1', 1):
+                    per_driver[driver_slug]['fastestLaps'] += 1
+                    per_team[ctor_slug]['fastestLaps'] += 1
+    for driver_slug, names in driver_teams.items():
+        per_driver[driver_slug]['team'] = ' / '.join(names)
+    return driver_rows, team_rows
 
-    out = {
-        'seasons': seasons,
-        'driverStats': driver_stats,
-        'teamStats': team_stats,
-        'drivers': driver_info
-    }
+def tally_poles(races, per_driver):
+    """Count qualifying wins from a `qualifying.json` race list."""
+    for race in races:
+        quals = race.get('QualifyingResults', [])
+        for qual in quals:
+            driverId = safe_get(qual, 'Driver', 'driverId')
+            pos_text = qual.get('position')
+            try:
+                pos = int(pos_text) if pos_text and pos_text.isdigit() else None
+            except Exception:
+                pos = None
+            if pos == 1:
+                driver_slug = driverId.replace('_', '-').lower() if driverId else None
+                per_driver[driver_slug]['poles'] += 1
+
+def reconcile_points(s, kind, per_entity, standings, rows):
+    """Check standings points against race + sprint points summed from the rows.
+
+    Standings stay authoritative; an entity without a standings entry (e.g. a
+    season still being raced) gets the row total. Disagreements are appended
+    to `MISMATCHES`.
+    """
+    for slug in set(standings) | set(rows):
+        race_pts, sprint_pts = rows[slug] if slug in rows else (0.0, 0.0)
+        total = race_pts + sprint_pts
+        if slug not in standings:
+            per_entity[slug]['points'] = total
+        elif abs(standings[slug] - total) > 1e-6:
+            MISMATCHES.append({'season': s, 'kind': kind, 'slug': slug, 'standings': standings[slug],
+                               'race': race_pts, 'sprint': sprint_pts, 'diff': round(standings[slug] - total, 2)})
+
+def write_reconciliation():
+    """Write and summarize the points mismatches collected during this run."""
+    write_json(RECONCILE_OUT, MISMATCHES)
+    if MISMATCHES:
+        print(f'Points reconciliation: {len(MISMATCHES)} mismatches (see {RECONCILE_OUT})')
+        for m in MISMATCHES[:10]:
+            print(f"  {m['season']} {m['kind']} {m['slug']}: standings {m['standings']} vs race {m['race']} + sprint {m['sprint']}")
+    else:
+        print('Points reconciliation: standings match race + sprint results')
+
+def merge_season(driver_stats, team_stats, s, per_driver, per_team):
+    """Write one season's aggregates into the global driver/team structures."""
+    for driverId, vals in per_driver.items():
+        key = driverId or ''
+        ds = driver_stats.setdefault(key, {'bySeason': {}, 'allTime': {}})
+        pts = vals.get('points', 0)
+        ds['bySeason'][s] = {
+            'team': vals.get('team'),
+            'points': int(pts) if float(pts).is_integer() else float(pts),
+            'wins': int(vals.get('wins', 0)),
+            'podiums': int(vals.get('podiums', 0)),
+            'poles': int(vals.get('poles', 0)),
+            'fastestLaps': int(vals.get('fastestLaps', 0)),
+            'races': int(vals.get('races', 0)),
+            'position': vals.get('position')
+        }
+
+    for ctorId, vals in per_team.items():
+        key = ctorId or ''
+        ts = team_stats.setdefault(key, {'bySeason': {}, 'allTime': {}})
+        pts = vals.get('points', 0)
+        ts['bySeason'][s] = {
+            'points': int(pts) if float(pts).is_integer() else float(pts),
+            'wins': int(vals.get('wins', 0)),
+            'fastestLaps': int(vals.get('fastestLaps', 0)),
+            'position': vals.get('position')
+        }
 
-    # compute allTime aggregates for drivers and teams from bySeason data
+def compute_all_time(driver_stats, team_stats):
+    """(Re)compute allTime aggregates for drivers and teams from bySeason data."""
     for dslug, dval in driver_stats.items():
         bys = dval.get('bySeason', {})
         alltime = {'points': 0.0, 'wins': 0, 'podiums': 0, 'poles': 0, 'fastestLaps': 0}
@@ -265,7 +464,8 @@ def main():
         pts = alltime['points']
         team_stats[tslug]['allTime'] = {'points': int(pts) if float(pts).is_integer() else float(pts), 'wins': alltime['wins']}
 
-    # cache per-driver and per-constructor Ergast endpoints for deeper analysis
+def cache_entity_endpoints(driver_info, ctor_info):
+    """Cache per-driver and per-constructor Ergast endpoints for deeper analysis."""
     try:
         for slug, info in driver_info.items():
             did = info.get('driverId')
@@ -273,11 +473,11 @@ def main():
                 continue
             # results and seasons for driver
             try:
-                fetch_json(f'https://ergast.com/api/f1/drivers/{did}/results.json?limit=1000', save_path=ERGAST_DIR / f'driver_{slug}_results.json')
+                fetch_pages(f'drivers/{did}/results.json', save_path=ERGAST_DIR / f'driver_{slug}_results.json', unit=(f'drivers/{did}/results', None))
             except Exception:
                 pass
             try:
-                fetch_json(f'https://ergast.com/api/f1/drivers/{did}/seasons.json?limit=1000', save_path=ERGAST_DIR / f'driver_{slug}_seasons.json')
+                fetch_pages(f'drivers/{did}/seasons.json', save_path=ERGAST_DIR / f'driver_{slug}_seasons.json', unit=(f'drivers/{did}/seasons', None))
             except Exception:
                 pass
     except Exception as e:
@@ -289,26 +489,154 @@ def main():
             if not cid:
                 continue
             try:
-                fetch_json(f'https://ergast.com/api/f1/constructors/{cid}/results.json?limit=1000', save_path=ERGAST_DIR / f'ctor_{cslug}_results.json')
+                fetch_pages(f'constructors/{cid}/results.json', save_path=ERGAST_DIR / f'ctor_{cslug}_results.json', unit=(f'constructors/{cid}/results', None))
             except Exception:
                 pass
             try:
-                fetch_json(f'https://ergast.com/api/f1/constructors/{cid}/seasons.json?limit=1000', save_path=ERGAST_DIR / f'ctor_{cslug}_seasons.json')
+                fetch_pages(f'constructors/{cid}/seasons.json', save_path=ERGAST_DIR / f'ctor_{cslug}_seasons.json', unit=(f'constructors/{cid}/seasons', None))
             except Exception:
                 pass
     except Exception as e:
         print('Per-constructor cache error', e)
 
-    # backup existing stats.json if present
-    if STATS_IN.exists():
-        bk = DATA / f'stats.json.bak'
-        if not bk.exists():
-            bk.write_text(STATS_IN.read_text())
-            print('Backed up', STATS_IN, '->', bk)
+def update_seasons(seasons, jobs=1):
+    """Incrementally refresh `seasons` in the existing generated artifact.
+
+    Only the season-level endpoints for the given seasons are re-fetched; the
+    per-driver/per-constructor crawl is skipped and every other season is
+    taken as-is from `stats.generated.json` (or `stats.json`). allTime totals
+    are recomputed afterwards. Used by the race-weekend watcher.
+    """
+    src = STATS_OUT if STATS_OUT.exists() else STATS_IN
+    out = json.loads(src.read_text(encoding='utf8'))
+    driver_stats = out.setdefault('driverStats', {})
+    team_stats = out.setdefault('teamStats', {})
+    driver_info = out.setdefault('drivers', {})
+    ctor_info = {}
+
+    ERGAST_DIR.mkdir(parents=True, exist_ok=True)
+    known = [int(s) for s in out.get('seasons', [])]
+    for s, per_driver, per_team in fetch_seasons(seasons, driver_info, ctor_info, jobs):
+        if not per_driver:
+            # nothing fetched (or cached, offline): keep what we had
+            print('No data for season', s, '- keeping the existing rows')
+            continue
+        # drop stale rows for this season before merging the fresh ones
+        for d in driver_stats.values():
+            d.get('bySeason', {}).pop(s, None)
+        for t in team_stats.values():
+            t.get('bySeason', {}).pop(s, None)
+        merge_season(driver_stats, team_stats, s, per_driver, per_team)
+        if int(s) not in known:
+            known.append(int(s))
+
+    out['seasons'] = sorted(known)
+    compute_all_time(driver_stats, team_stats)
+    write_json(STATS_OUT, out)
+    print('Wrote', STATS_OUT)
+    write_reconciliation()
+    return out
+
+def merge_info(target, found):
+    """Fold entity info collected by one `fetch_season` call into `target`."""
+    for slug, info in found.items():
+        entry = target.setdefault(slug, info)
+        if entry is info:
+            continue
+        for k, v in info.items():
+            if k == 'seasons':
+                entry['seasons'].extend(x for x in v if x not in entry['seasons'])
+            elif entry.get(k) is None:
+                entry[k] = v
+
+def fetch_seasons(seasons, driver_info, ctor_info, jobs=1):
+    """`fetch_season` for every season, `jobs` at a time; yields `(s, per_driver, per_team)` in order."""
+    if jobs <= 1:
+        for season in seasons:
+            s = str(season)
+            yield (s, *fetch_season(s, driver_info, ctor_info))
+        return
+
+    def one(season):
+        found_drivers, found_ctors = {}, {}
+        per_driver, per_team = fetch_season(str(season), found_drivers, found_ctors)
+        return str(season), per_driver, per_team, found_drivers, found_ctors
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for s, per_driver, per_team, found_drivers, found_ctors in pool.map(one, seasons):
+            merge_info(driver_info, found_drivers)
+            merge_info(ctor_info, found_ctors)
+            yield s, per_driver, per_team
+
+def run(seasons=None, resume=False, jobs=1, offline=False):
+    """Fetch `seasons` (default: every season in `stats.json`) and write `stats.generated.json`.
+
+    With an explicit season list only those seasons are refreshed in place
+    (`update_seasons`); otherwise everything is crawled, including the
+    per-driver/per-constructor endpoints.
+    """
+    global CHECKPOINT, OFFLINE
+    OFFLINE = offline
+    if not STATS_IN.exists():
+        print('Missing', STATS_IN)
+        return
+    # the journal covers both paths, so --resume also works with --years / --since
+    ERGAST_DIR.mkdir(parents=True, exist_ok=True)
+    CHECKPOINT = Checkpoint(CHECKPOINT_FILE, resume=resume)
+    if CHECKPOINT.done:
+        print('Resuming:', len(CHECKPOINT.done), 'units already fetched')
+    if seasons:
+        out = update_seasons(seasons, jobs=jobs)
+        CHECKPOINT.clear()
+        return out
+
+    stats_src = json.loads(STATS_IN.read_text())
+    seasons = stats_src.get('seasons', [])
+    if not seasons:
+        # default to seasons from 2000 up to current year
+        current = datetime.now().year
+        seasons = list(range(2000, current + 1))
 
-    STATS_OUT.write_text(json.dumps(out, indent=2, ensure_ascii=False))
+    driver_stats = {}
+    team_stats = {}
+    driver_info = {}
+    ctor_info = {}
+
+    for s, per_driver, per_team in fetch_seasons(seasons, driver_info, ctor_info, jobs):
+        merge_season(driver_stats, team_stats, s, per_driver, per_team)
+
+    out = {
+        'seasons': seasons,
+        'driverStats': driver_stats,
+        'teamStats': team_stats,
+        'drivers': driver_info
+    }
+
+    compute_all_time(driver_stats, team_stats)
+    cache_entity_endpoints(driver_info, ctor_info)
+
+    # keep the previous generated build restorable from the snapshot store
+    if STATS_OUT.exists():
+        snapshot([STATS_OUT], label='before-ergast-fetch')
+
+    write_json(STATS_OUT, out)
     print('Wrote', STATS_OUT)
+    write_reconciliation()
+    CHECKPOINT.clear()
+
+    cached = sum(p.stat().st_size for p in ERGAST_DIR.glob('*.json.gz'))
+    print(f"Downloaded {TRANSFER['raw'] / 1e6:.1f} MB, stored {TRANSFER['stored'] / 1e6:.1f} MB compressed; "
+          f"cache now {cached / 1e6:.1f} MB")
+    for line in default_source().report():
+        print(' ', line)
+    return out
 
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Fetch Ergast stats into data/stats.generated.json')
+    ap.add_argument('--resume', action='store_true', help='continue an interrupted run from the checkpoint journal')
+    add_common_args(ap)
+    args = ap.parse_args(argv)
+    run(selected_seasons(args), resume=args.resume, jobs=args.jobs, offline=args.offline)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Give every driver and entry team a record for every season in `data/stats.json`.
+
+Usage: python scripts/fill_stats.py
+
+Drivers on the 2026 entry list that are missing get an empty record, missing
+seasons are added with zero totals and a best-guess team name, and missing
+season fields are filled with defaults. The result goes to
+`data/stats.updated.json`; `stats.json` itself is only snapshotted.
+"""
+import json
+from pathlib import Path
+
+from snapshot_store import snapshot
+from stats_model import EntityStats, SeasonRecord, StatsModel
+
+root = Path(__file__).resolve().parent.parent
+stats_path = root / 'data' / 'stats.json'
+entries_path = root / 'data' / 'entries-2026.json'
+out_path = root / 'data' / 'stats.updated.json'
+
+def normalize(s):
+    return ''.join(c.lower() if c.isalnum() else '-' for c in (s or '')).strip('-')
+
+def load(p):
+    return json.loads(p.read_text(encoding='utf8'))
+
+def guess_team_name_for(driverStats, team_name_by_slug, season, driver_slug, default_team_slug=None):
+    """Team name for a driver in `season`: their own record, a teammate's, or the entry list's."""
+    # prefer explicit team in driver's bySeason if present
+    d = driverStats.get(driver_slug)
+    if d:
+        rec = d.get(season)
+        if rec is not None and rec.team:
+            return rec.team
+    # otherwise, search other drivers for same normalized team name in that season
+    # build map seasonTeamName -> occurrences
+    for other_slug, od in driverStats.items():
+        if other_slug == driver_slug: continue
+        s = od.get(season)
+        if s is not None and s.team:
+            # if this other driver shares team slug with default_team_slug, return that name
+            if default_team_slug:
+                if normalize(s.team).find(default_team_slug) != -1 or default_team_slug.find(normalize(s.team)) != -1:
+                    return s.team
+    # fallback: use team name from entries current mapping
+    if default_team_slug and default_team_slug in team_name_by_slug:
+        return team_name_by_slug[default_team_slug]
+    return None
+
+def fill(model, entries):
+    """Fill `model` in place from `entries`; returns a summary of what was created."""
+    seasons = model.seasons or []
+    driverStats = model.drivers
+    teamStats = model.teams
+
+    # build mapping of entry driver -> team (current 2026)
+    entry_map = {}
+    team_name_by_slug = {}
+    for team in entries.get('teams', []):
+        tslug = team.get('slug') or normalize(team.get('name'))
+        team_name_by_slug[tslug] = team.get('name')
+        for d in team.get('drivers', []):
+            dslug = d.get('slug') or normalize(d.get('name'))
+            entry_map[dslug] = {'name': d.get('name'), 'teamSlug': tslug, 'teamName': team.get('name')}
+
+    def guess(season, dslug):
+        return guess_team_name_for(driverStats, team_name_by_slug, season, dslug, entry_map.get(dslug, {}).get('teamSlug'))
+
+    created = {'driversAdded': [], 'driverSeasonsAdded': [], 'teamsSeasonsAdded': []}
+
+    # Ensure all drivers from entries exist in stats.driverStats
+    for dslug, info in entry_map.items():
+        if dslug not in driverStats:
+            driverStats[dslug] = EntityStats.new({'points': 0, 'wins': 0, 'podiums': 0})
+            created['driversAdded'].append(dslug)
+
+    # Ensure each driver has an entry for each season
+    for dslug in list(driverStats.keys()):
+        d = driverStats[dslug]
+        for s in seasons:
+            key = str(s)
+            sd = d.get(s)
+            if sd is None:
+                team_guess = guess(s, dslug)
+                d.set(s, SeasonRecord(team=team_guess or '', points=0, wins=0, podiums=0, poles=0, position=None))
+                created['driverSeasonsAdded'].append({'driver': dslug, 'season': key})
+            else:
+                # fill common missing fields inside season object
+                sd.fill_missing({'points': 0, 'wins': 0, 'podiums': 0, 'poles': 0, 'position': None})
+                if sd.team is None:
+                    sd.team = guess(s, dslug) or ''
+
+    # Ensure each team has season entries
+    for team in entries.get('teams', []):
+        tslug = team.get('slug') or normalize(team.get('name'))
+        tstats = teamStats.setdefault(tslug, EntityStats.new())
+        for s in seasons:
+            key = str(s)
+            if s not in tstats:
+                tstats.set(s, SeasonRecord(points=0, wins=0))
+                created['teamsSeasonsAdded'].append({'team': tslug, 'season': key})
+    return created
+
+def main():
+    model = StatsModel.load(stats_path)
+    created = fill(model, load(entries_path))
+
+    # backup and write updated stats
+    backup = snapshot([stats_path], label='before-fill')
+    model.save(out_path)
+
+    print('Snapshot of', stats_path, 'stored as run', backup['id'])
+    print('Updated stats written to', out_path)
+    print('Summary of created items:')
+    print(json.dumps(created, indent=2))
+    return created
+
+if __name__ == '__main__':
+    main()
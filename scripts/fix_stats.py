@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
 """Fill and normalize data/stats.json using entries-2026.json as source of truth for drivers/teams.
 
-Creates a backup of `data/stats.json` and writes `data/stats.fixed.json`.
+Snapshots `data/stats.json` into the snapshot store and writes `data/stats.fixed.json`.
 Run locally:
 
-python scripts/fix_stats.py
+python scripts/fix_stats.py [--input data/stats.generated.json]
+
+`--input` picks the stats to normalize (default `data/stats.json`); the
+pipeline passes the freshly generated file so a new fetch reaches the merge.
 
 """
+import argparse
 import json
 from pathlib import Path
-from copy import deepcopy
+
+from snapshot_store import snapshot
+from stats_model import EntityStats, SeasonRecord, StatsModel
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA = ROOT / 'data'
 ENTRIES = DATA / 'entries-2026.json'
 STATS = DATA / 'stats.json'
 OUT = DATA / 'stats.fixed.json'
-BACK = DATA / 'stats.json.bak'
 
 def slugify(name):
     return ''.join(c.lower() if c.isalnum() else '-' for c in (name or '')).strip('-')
@@ -24,11 +29,14 @@ def slugify(name):
 def zero_season_dict():
     return {'team': None, 'points': 0, 'wins': 0, 'podiums': 0, 'poles': 0, 'fastestLaps': 0, 'position': None}
 
-def main():
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Normalize stats against the entry list')
+    ap.add_argument('--input', default=str(STATS), help='stats file to normalize (default data/stats.json)')
+    args = ap.parse_args(argv)
     entries = json.loads(ENTRIES.read_text(encoding='utf8'))
-    stats = json.loads(STATS.read_text(encoding='utf8'))
+    model = StatsModel.load(Path(args.input))
 
-    seasons = stats.get('seasons') or entries.get('season') and [entries.get('season')] or [2026]
+    seasons = model.seasons or entries.get('season') and [entries.get('season')] or [2026]
     if isinstance(seasons, int):
         seasons = [seasons]
 
@@ -42,61 +50,53 @@ def main():
             driver_slug = d.get('slug') or slugify(d.get('name'))
             entry_map[driver_slug] = {'name': d.get('name'), 'team': team.get('name'), 'team_slug': team_slug}
 
-    driverStats = deepcopy(stats.get('driverStats', {}))
-    teamStats = deepcopy(stats.get('teamStats', {}))
+    driverStats = model.drivers
+    teamStats = model.teams
 
     added_drivers = []
     filled_seasons = []
+    defaults = zero_season_dict()
 
     # ensure every entry driver exists in driverStats
     for slug, info in entry_map.items():
         if slug not in driverStats:
-            driverStats[slug] = {'bySeason': {}, 'allTime': {'points': 0, 'wins': 0, 'podiums': 0}}
+            driverStats[slug] = EntityStats.new({'points': 0, 'wins': 0, 'podiums': 0})
             added_drivers.append(slug)
         # ensure seasons
-        bySeason = driverStats[slug].setdefault('bySeason', {})
+        ent = driverStats[slug]
         for s in seasons:
-            ks = str(s)
-            if ks not in bySeason:
-                bySeason[ks] = zero_season_dict()
-                bySeason[ks]['team'] = info.get('team')
-                filled_seasons.append((slug, ks))
+            rec = ent.get(s)
+            if rec is None:
+                ent.set(s, SeasonRecord.zero(team=info.get('team')))
+                filled_seasons.append((slug, str(s)))
             else:
                 # ensure required keys
-                for k, v in zero_season_dict().items():
-                    if k not in bySeason[ks]:
-                        bySeason[ks][k] = v
+                rec.fill_missing(defaults)
 
     # ensure every driver in stats has all seasons
-    for slug, d in driverStats.items():
-        bySeason = d.setdefault('bySeason', {})
+    for slug, ent in driverStats.items():
         for s in seasons:
-            ks = str(s)
-            if ks not in bySeason:
-                bySeason[ks] = zero_season_dict()
-                filled_seasons.append((slug, ks))
+            rec = ent.get(s)
+            if rec is None:
+                ent.set(s, SeasonRecord.zero())
+                filled_seasons.append((slug, str(s)))
             else:
-                for k, v in zero_season_dict().items():
-                    if k not in bySeason[ks]:
-                        bySeason[ks][k] = v
+                rec.fill_missing(defaults)
 
     # ensure teams exist and have seasons
     entry_teams = { (t.get('slug') or slugify(t.get('name'))): t for t in entries.get('teams', []) }
     for team_slug, team in entry_teams.items():
         if team_slug not in teamStats:
-            teamStats[team_slug] = {'bySeason': {}, 'allTime': {'points': 0, 'wins': 0}}
+            teamStats[team_slug] = EntityStats.new({'points': 0, 'wins': 0})
         for s in seasons:
-            ks = str(s)
-            byS = teamStats[team_slug].setdefault('bySeason', {})
-            if ks not in byS:
-                byS[ks] = {'points': 0, 'wins': 0, 'position': None}
+            teamStats[team_slug].setdefault(s, lambda: SeasonRecord(points=0, wins=0, position=None))
 
     # write backup and output
-    if not BACK.exists():
-        BACK.write_text(STATS.read_text(encoding='utf8'), encoding='utf8')
+    snapshot([STATS], label='before-fix')
 
-    out = {'seasons': seasons, 'driverStats': driverStats, 'teamStats': teamStats}
-    OUT.write_text(json.dumps(out, indent=2, ensure_ascii=False), encoding='utf8')
+    # top-level extras (the Ergast `drivers` names/codes, `records`, ...) pass through
+    out = StatsModel(seasons=seasons, drivers=driverStats, teams=teamStats, extra=model.extra)
+    out.save(OUT)
 
     print('Fixed stats written to', OUT)
     print('Added drivers:', added_drivers)
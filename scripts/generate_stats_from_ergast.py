@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Build `data/stats.generated.json` from Ergast season standings only.
+
+Usage: python scripts/generate_stats_from_ergast.py [--years 2020-2026 | --since 2024]
+
+Older one-file generator; `fetch_stats_ergast.py` is the cached pipeline.
+Seasons default to 2020 up to the current year.
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from ergast_source import ErgastSource, urllib_transport
+from f1data import add_common_args, selected_seasons
+from pipeline_io import write_json
+from snapshot_store import snapshot
+
+root = Path(__file__).resolve().parent.parent
+out_path = root / 'data' / 'stats.generated.json'
+
+SOURCE = ErgastSource(transport=urllib_transport)
+
+def fetch(path):
+    return json.loads(SOURCE.get_bytes(path))
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Build stats.generated.json from Ergast standings')
+    add_common_args(ap)
+    args = ap.parse_args(argv)
+    if args.offline:
+        print('generate_stats_from_ergast.py always fetches; nothing to do offline')
+        return
+    seasons = selected_seasons(args) or list(range(2020, time.localtime().tm_year + 1))
+
+    driver_stats = {}
+    team_stats = {}
+
+    for s in seasons:
+        url = f'{s}/driverStandings.json'
+        print('Fetching', url)
+        data = fetch(url)
+        standings = data.get('MRData', {}).get('StandingsTable', {}).get('StandingsLists', [])
+        if not standings:
+            print('No standings for', s)
+            continue
+        drivers = standings[0].get('DriverStandings', [])
+        for d in drivers:
+            driver = d.get('Driver', {})
+            family = driver.get('familyName', '')
+            given = driver.get('givenName','')
+            name = f"{given} {family}".strip()
+            slug = '-'.join(name.lower().replace('ú','u').replace('ö','o').replace('í','i').split())
+            points = int(float(d.get('points', '0')))
+            wins = int(d.get('wins', '0'))
+            position = int(d.get('position', '0'))
+            constructors = d.get('Constructors', [])
+            teamName = constructors[0].get('name') if constructors else ''
+            ds = driver_stats.setdefault(slug, {'bySeason': {}, 'allTime': {'points':0,'wins':0,'podiums':0}})
+            ds['bySeason'][str(s)] = {'team': teamName, 'points': points, 'wins': wins, 'podiums': 0, 'poles': 0, 'position': position}
+            # accumulate allTime points/wins
+            at = ds.setdefault('allTime', {'points':0,'wins':0,'podiums':0})
+            at['points'] = at.get('points',0) + points
+            at['wins'] = at.get('wins',0) + wins
+
+        # constructor standings for teams
+        turl = f'{s}/constructorStandings.json'
+        print('Fetching', turl)
+        tdata = fetch(turl)
+        tlist = tdata.get('MRData', {}).get('StandingsTable', {}).get('StandingsLists', [])
+        if tlist:
+            cons = tlist[0].get('ConstructorStandings', [])
+            for c in cons:
+                cname = c.get('Constructor', {}).get('name','')
+                cslug = '-'.join(cname.lower().split())
+                pts = int(float(c.get('points','0')))
+                wins = int(c.get('wins','0'))
+                ts = team_stats.setdefault(cslug, {'bySeason': {}, 'allTime': {'points':0,'wins':0}})
+                ts['bySeason'][str(s)] = {'points': pts, 'wins': wins}
+                at = ts.setdefault('allTime', {'points':0,'wins':0})
+                at['points'] = at.get('points',0) + pts
+                at['wins'] = at.get('wins',0) + wins
+
+    # ensure seasons array
+    out = {'seasons': seasons, 'driverStats': driver_stats, 'teamStats': team_stats}
+
+    if (root / 'data' / 'stats.json').exists():
+        backup = snapshot([root / 'data' / 'stats.json'], label='before-ergast-generate')
+        print('Existing stats.json stored as snapshot run', backup['id'])
+
+    write_json(out_path, out)
+    print('Wrote generated stats to', out_path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+"""Race-weekend live mode: push standings changes to open pages over SSE.
+
+Usage:
+  python scripts/live_weekend.py [--season 2026] [--interval 20] [--host 127.0.0.1] [--port 8002]
+  python scripts/live_weekend.py --replay [2025] [--step 10]   # local stand-in feed, no network
+
+The poller asks for `{season}/last/results` to learn the current round, then
+for that round's sprint and qualifying rows and the driver and constructor
+standings after it. Every request is conditional (ETag / Last-Modified,
+validators kept per mirror), so a quiet poll costs five bodiless 304s. Rounds
+before the current one are fetched once, on the first poll. When a payload
+changes, only that round is tallied again with `fetch_stats_ergast`'s
+aggregation; the season rows are the sum of the per-round tallies, with
+points and positions taken from the standings as in `fetch_season`. The
+fields that differ from what was last published go out as one event.
+
+Pages subscribe with `EventSource` (`js/app.js` does when the page has
+`<meta name="f1-live" content="http://127.0.0.1:8002/live">`):
+
+  GET /live          event stream:
+                       state  on connect: the live season's rows and allTime totals
+                       delta  {"season", "round", "drivers": {slug: {"season": {...}, "allTime": {...}}}, "teams": {...}}
+  GET /live/state    the `state` payload as plain JSON
+  GET /live/health   open streams, events sent, poll counters
+
+Events carry ids; a reconnecting `EventSource` sends `Last-Event-ID` and gets
+only the events it missed (or a fresh `state` when they are no longer kept).
+The server is one asyncio loop: an idle stream is a parked coroutine, each
+event is encoded once and written to every stream without awaiting, and a
+client whose unsent buffer passes `MAX_BUFFERED` is dropped. A few thousand
+open pages therefore cost one core and some memory.
+
+`--replay` serves a season from a stand-in Ergast API on a local port and
+reveals one more round every `--step` seconds: cached `data/ergast` payloads
+for that season when present, otherwise a seeded synthetic season over the
+2026 entry list and calendar.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from ergast_source import ErgastSource, default_source, urllib_transport
+from fetch_stats_ergast import ERGAST_DIR, merge_season, safe_get, season_rows, tally_poles, tally_results
+from pipeline_io import cache_exists, read_cached_json
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+STATS = DATA / 'stats.json'
+ENTRIES = DATA / 'entries-2026.json'
+CALENDAR = DATA / 'calendar-2026.json'
+
+KINDS = ('drivers', 'teams')
+# season counters summed over rounds, and the fields `compute_all_time` totals
+COUNTERS = {'drivers': ('wins', 'podiums', 'poles', 'fastestLaps', 'races'), 'teams': ('wins', 'fastestLaps')}
+ALL_TIME = {'drivers': ('points', 'wins', 'podiums', 'poles', 'fastestLaps'), 'teams': ('points', 'wins')}
+STANDINGS = {'drivers': ('driverStandings', 'DriverStandings', 'Driver', 'driverId'),
+             'teams': ('constructorStandings', 'ConstructorStandings', 'Constructor', 'constructorId')}
+BACKLOG = 256
+MAX_BUFFERED = 256 * 1024
+HEARTBEAT = 20.0
+
+def norm(s):
+    return ''.join(c for c in (s or '').lower() if c.isalnum())
+
+def slugify(name):
+    return ''.join(c.lower() if c.isalnum() else '-' for c in (name or '')).strip('-')
+
+def races_of(payload):
+    return safe_get(payload or {}, 'MRData', 'RaceTable', 'Races', default=[]) or []
+
+def number(v):
+    return int(v) if float(v).is_integer() else float(v)
+
+# -- season state ---------------------------------------------------------------------
+
+class SlugMap:
+    """Ergast ids -> site slugs, for the live rows to line up with `stats.json`.
+
+    Drivers match on the id itself, then on the entry-list name. Constructors
+    match the way the site pairs teams: normalized id or name contained in a
+    known team slug or name (`red_bull` -> `oracle-red-bull`).
+    """
+
+    def __init__(self, stats, entries):
+        self.drivers = set(stats.get('driverStats') or ())
+        self.by_name = {}
+        self.teams = {}
+        for t in entries.get('teams', []):
+            slug = t.get('slug') or slugify(t.get('name'))
+            self.teams[slug] = norm(t.get('name'))
+            for d in t.get('drivers', []):
+                d_slug = d.get('slug') or slugify(d.get('name'))
+                self.drivers.add(d_slug)
+                self.by_name[norm(d.get('name'))] = d_slug
+        for slug in stats.get('teamStats') or ():
+            self.teams.setdefault(slug, norm(slug))
+        self.cache = {}
+
+    def driver(self, slug, names=None):
+        key = ('drivers', slug)
+        if key not in self.cache:
+            if slug in self.drivers:
+                self.cache[key] = slug
+            elif not names:
+                return slug
+            else:
+                self.cache[key] = self.by_name.get(norm(' '.join(n or '' for n in names)), slug)
+        return self.cache[key]
+
+    def team(self, slug, name=None):
+        key = ('teams', slug)
+        if key not in self.cache:
+            found = slug if slug in self.teams else None
+            for probe in (norm(slug), norm(name)):
+                if found or not probe:
+                    continue
+                found = next((s for s, n in self.teams.items() if probe in norm(s) or (n and probe in n)), None)
+            self.cache[key] = found or slug
+        return self.cache[key]
+
+class LiveSeason:
+    """Per-round tallies of one season and the rows last published from them."""
+
+    def __init__(self, season, stats, slugs):
+        self.season = str(season)
+        self.slugs = slugs
+        self.rounds = {}
+        self.standings = {}
+        # allTime totals without this season; the live season rows are added back on top
+        self.base = {}
+        for kind, key in (('drivers', 'driverStats'), ('teams', 'teamStats')):
+            base = self.base[kind] = {}
+            for slug, ent in (stats.get(key) or {}).items():
+                at = ent.get('allTime') or {}
+                row = (ent.get('bySeason') or {}).get(self.season) or {}
+                # fields that hold something other than a number (feeder-series splits) are left alone
+                base[slug] = {f: float(at.get(f) or 0) - float(row.get(f) or 0) for f in ALL_TIME[kind]
+                              if isinstance(at.get(f) or 0, (int, float)) and isinstance(row.get(f) or 0, (int, float))}
+        self.published = {kind: {} for kind in KINDS}
+
+    @property
+    def round(self):
+        return max(self.rounds, default=0)
+
+    def _remap(self, kind, rows):
+        out = {}
+        for slug, vals in rows.items():
+            if slug:
+                out[self.slugs.driver(slug) if kind == 'drivers' else self.slugs.team(slug)] = vals
+        return out
+
+    def set_round(self, rnd, races, sprints, quals):
+        """Tally one round's race, sprint and qualifying rows, replacing any earlier tally of it."""
+        per_driver, per_team = season_rows()
+        driver_info, ctor_info = {}, {}
+        sessions = [(False, races, 'Results'), (True, sprints, 'SprintResults')]
+        driver_rows, team_rows = tally_results(self.season, sessions, per_driver, per_team, driver_info, ctor_info)
+        tally_poles(quals, per_driver)
+        for slug, info in driver_info.items():
+            self.slugs.driver(slug, (info.get('givenName'), info.get('familyName')))
+        for slug, info in ctor_info.items():
+            self.slugs.team(slug, info.get('name'))
+        self.rounds[rnd] = {'drivers': (self._remap('drivers', per_driver), self._remap('drivers', driver_rows)),
+                            'teams': (self._remap('teams', per_team), self._remap('teams', team_rows))}
+
+    def set_standings(self, kind, rnd, payload):
+        _, key, entity, id_key = STANDINGS[kind]
+        lists = safe_get(payload, 'MRData', 'StandingsTable', 'StandingsLists', default=[]) or []
+        table = {}
+        for row in (lists[0].get(key, []) if lists else []):
+            ergast_id = safe_get(row, entity, id_key)
+            if not ergast_id:
+                continue
+            slug = ergast_id.replace('_', '-').lower()
+            if kind == 'drivers':
+                slug = self.slugs.driver(slug, (safe_get(row, entity, 'givenName'), safe_get(row, entity, 'familyName')))
+            else:
+                slug = self.slugs.team(slug, safe_get(row, entity, 'name'))
+            table[slug] = (float(row.get('points', 0) or 0), int(row['position']) if row.get('position') else None)
+        self.standings[kind] = (rnd, table)
+
+    def rows(self):
+        """`{'drivers': {slug: season row}, 'teams': {...}}` as `merge_season` writes them."""
+        per = dict(zip(KINDS, season_rows()))
+        team_names = defaultdict(list)
+        for rnd in sorted(self.rounds):
+            for kind in KINDS:
+                tally, points = self.rounds[rnd][kind]
+                for slug, vals in tally.items():
+                    row = per[kind][slug]
+                    for f in COUNTERS[kind]:
+                        row[f] = row.get(f, 0) + vals.get(f, 0)
+                    if kind == 'drivers':
+                        for name in (vals.get('team') or '').split(' / '):
+                            if name and name not in team_names[slug]:
+                                team_names[slug].append(name)
+                for slug, (race, sprint) in points.items():
+                    per[kind][slug]['points'] += race + sprint
+        for slug, names in team_names.items():
+            per['drivers'][slug]['team'] = ' / '.join(names)
+        # standings stay authoritative for points once they cover the latest round
+        for kind in KINDS:
+            rnd, table = self.standings.get(kind, (0, {}))
+            for slug, (points, position) in table.items():
+                row = per[kind][slug]
+                row['position'] = position
+                if rnd >= self.round:
+                    row['points'] = points
+        driver_stats, team_stats = {}, {}
+        merge_season(driver_stats, team_stats, self.season, per['drivers'], per['teams'])
+        return {'drivers': {s: v['bySeason'][self.season] for s, v in driver_stats.items() if s},
+                'teams': {s: v['bySeason'][self.season] for s, v in team_stats.items() if s}}
+
+    def all_time(self, kind, slug, row):
+        base = self.base[kind].get(slug, dict.fromkeys(ALL_TIME[kind], 0.0))
+        return {f: number(v + float(row.get(f) or 0)) for f, v in base.items()}
+
+    def changes(self):
+        """The fields that differ from what was last published, as a `delta` payload, or None."""
+        rows = self.rows()
+        out = {}
+        for kind in KINDS:
+            changed = {}
+            for slug, row in rows[kind].items():
+                at = self.all_time(kind, slug, row)
+                old_row, old_at = self.published[kind].get(slug, ({}, {}))
+                diff = {}
+                season = {f: v for f, v in row.items() if f not in old_row or old_row[f] != v}
+                if season:
+                    diff['season'] = season
+                totals = {f: v for f, v in at.items() if f not in old_at or old_at[f] != v}
+                if totals:
+                    diff['allTime'] = totals
+                if diff:
+                    changed[slug] = diff
+                self.published[kind][slug] = (row, at)
+            if changed:
+                out[kind] = changed
+        return {'season': self.season, 'round': self.round, **out} if out else None
+
+    def state(self):
+        out = {'season': self.season, 'round': self.round}
+        for kind in KINDS:
+            out[kind] = {slug: {'season': row, 'allTime': at} for slug, (row, at) in self.published[kind].items()}
+        return out
+
+# -- polling --------------------------------------------------------------------------
+
+class ConditionalFeed:
+    """GETs through an `ErgastSource` with the validators each mirror last sent."""
+
+    def __init__(self, source):
+        self.source = source
+        self.validators = {}
+        self.payloads = {}
+        self.requests = 0
+        self.not_modified = 0
+
+    def get(self, path):
+        """`(payload, changed)`; a 304 returns the payload seen last time."""
+        # each mirror only gets the validators it issued; hedging may answer from any of them
+        per_mirror = {base: v for (base, p), v in self.validators.items() if p == path} if path in self.payloads else {}
+        mirror, status, resp_headers, body = self.source.request(path, per_mirror=per_mirror)
+        self.requests += 1
+        if status == 304:
+            self.not_modified += 1
+            return self.payloads[path], False
+        validators = {}
+        if resp_headers.get('ETag'):
+            validators['If-None-Match'] = resp_headers['ETag']
+        if resp_headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = resp_headers['Last-Modified']
+        self.validators[(mirror.base, path)] = validators
+        payload = json.loads(body)
+        changed = payload != self.payloads.get(path)
+        self.payloads[path] = payload
+        return payload, changed
+
+def poll(live, feed):
+    """One poll of the current round. Returns True when the season rows may have changed."""
+    s = live.season
+    last, changed = feed.get(f'{s}/last/results.json')
+    races = races_of(last)
+    if not races:
+        return False
+    current = int(races[0].get('round') or safe_get(last, 'MRData', 'RaceTable', 'round'))
+    # earlier rounds are fetched once (first poll, or rounds missed while down)
+    rounds = [r for r in range(1, current) if r not in live.rounds] + [current]
+    for rnd in rounds:
+        race_rows = races if rnd == current else races_of(feed.get(f'{s}/{rnd}/results.json')[0])
+        sprint, sprint_changed = feed.get(f'{s}/{rnd}/sprint.json')
+        quals, quals_changed = feed.get(f'{s}/{rnd}/qualifying.json')
+        if rnd != current or changed or sprint_changed or quals_changed or rnd not in live.rounds:
+            live.set_round(rnd, race_rows, races_of(sprint), races_of(quals))
+            changed = True
+    for kind in KINDS:
+        payload, standings_changed = feed.get(f'{s}/{current}/{STANDINGS[kind][0]}.json')
+        if standings_changed or live.standings.get(kind, (0,))[0] != current:
+            live.set_standings(kind, current, payload)
+            changed = True
+    return changed
+
+async def poll_forever(live, feed, hub, interval):
+    while True:
+        try:
+            if await asyncio.to_thread(poll, live, feed):
+                event = live.changes()
+                if event:
+                    t0 = time.perf_counter()
+                    hub.publish('delta', event)
+                    print(f'Round {event["round"]}: {len(event.get("drivers", {}))} drivers, '
+                          f'{len(event.get("teams", {}))} teams changed -> {len(hub.clients)} streams '
+                          f'in {(time.perf_counter() - t0) * 1000:.1f} ms')
+        except Exception as e:
+            print('Poll failed:', e)
+        await asyncio.sleep(interval)
+
+# -- event streams ---------------------------------------------------------------------
+
+def frame(event, data, seq=None):
+    head = f'id: {seq}\n' if seq is not None else ''
+    return f'{head}event: {event}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'.encode('utf8')
+
+class Hub:
+    """Open event streams and the recent events a reconnecting client may have missed."""
+
+    def __init__(self, backlog=BACKLOG):
+        self.clients = set()
+        self.seq = 0
+        self.recent = deque(maxlen=backlog)
+        self.sent = 0
+        self.dropped = 0
+
+    def send(self, writer, data):
+        if writer.transport.is_closing():
+            self.clients.discard(writer)
+        elif writer.transport.get_write_buffer_size() > MAX_BUFFERED:
+            # not reading; it can reconnect and catch up from Last-Event-ID
+            self.clients.discard(writer)
+            self.dropped += 1
+            writer.transport.abort()
+        else:
+            writer.write(data)
+            self.sent += 1
+
+    def broadcast(self, data):
+        for writer in list(self.clients):
+            self.send(writer, data)
+
+    def publish(self, event, payload):
+        self.seq += 1
+        data = frame(event, payload, self.seq)
+        self.recent.append((self.seq, data))
+        self.broadcast(data)
+
+    def missed(self, last_id):
+        """Events after `last_id`, or None when some of them are no longer kept."""
+        if last_id > self.seq:
+            return None
+        if last_id < self.seq and (not self.recent or self.recent[0][0] > last_id + 1):
+            return None
+        return [data for seq, data in self.recent if seq > last_id]
+
+async def heartbeat(hub):
+    while True:
+        await asyncio.sleep(HEARTBEAT)
+        hub.broadcast(b': ping\n\n')
+
+def respond(writer, status, payload):
+    body = json.dumps(payload, separators=(',', ':')).encode('utf8')
+    writer.write(f'HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n'
+                 f'Access-Control-Allow-Origin: *\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n'.encode() + body)
+
+async def handle(hub, live, feed, reader, writer):
+    try:
+        head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 10)
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        writer.close()
+        return
+    lines = head.decode('latin-1').split('\r\n')
+    parts = lines[0].split(' ')
+    target = parts[1] if len(parts) > 1 else '/'
+    headers = {k.strip().lower(): v.strip() for k, _, v in (line.partition(':') for line in lines[1:] if line)}
+    path, _, query = target.partition('?')
+    try:
+        if path == '/live/state':
+            respond(writer, '200 OK', live.state())
+        elif path == '/live/health':
+            respond(writer, '200 OK', {'streams': len(hub.clients), 'seq': hub.seq, 'sent': hub.sent,
+                                       'dropped': hub.dropped, 'round': live.round,
+                                       'requests': feed.requests, 'notModified': feed.not_modified})
+        elif path == '/live':
+            await stream(hub, live, reader, writer, headers, query)
+            return
+        else:
+            respond(writer, '404 Not Found', {'error': 'not found'})
+        await writer.drain()
+    except ConnectionError:
+        pass
+    writer.close()
+
+async def stream(hub, live, reader, writer, headers, query):
+    writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n'
+                 b'Access-Control-Allow-Origin: *\r\nConnection: keep-alive\r\n\r\nretry: 5000\n\n')
+    last = headers.get('last-event-id') or (parse_qs(query).get('lastEventId') or [''])[0]
+    missed = hub.missed(int(last)) if last.isdigit() else None
+    if missed is None:
+        writer.write(frame('state', live.state(), hub.seq))
+    else:
+        for data in missed:
+            writer.write(data)
+    hub.clients.add(writer)
+    try:
+        # an idle stream: nothing to do until the browser goes away
+        while await reader.read(1024):
+            pass
+    except ConnectionError:
+        pass
+    finally:
+        hub.clients.discard(writer)
+        writer.close()
+
+def raise_fd_limit():
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+async def serve(live, feed, host, port, interval):
+    hub = Hub()
+    # publish what the first poll finds before opening the port, so `state` is complete
+    try:
+        await asyncio.to_thread(poll, live, feed)
+        live.changes()
+    except Exception as e:
+        print('First poll failed:', e)
+    server = await asyncio.start_server(partial(handle, hub, live, feed), host, port, backlog=1024)
+    print(f'Live season {live.season} (round {live.round}) on http://{host}:{port}/live')
+    tasks = [asyncio.create_task(poll_forever(live, feed, hub, interval)), asyncio.create_task(heartbeat(hub))]
+    async with server:
+        try:
+            await server.serve_forever()
+        finally:
+            for t in tasks:
+                t.cancel()
+
+# -- stand-in feed ---------------------------------------------------------------------
+
+POINTS = (25, 18, 15, 12, 10, 8, 6, 4, 2, 1)
+
+def synthetic_season(season, seed):
+    """Races and qualifying for every calendar round, over the 2026 entry list."""
+    entries = json.loads(ENTRIES.read_text(encoding='utf8'))
+    calendar = json.loads(CALENDAR.read_text(encoding='utf8'))
+    rng = random.Random(seed)
+    grid = []
+    for t in entries.get('teams', []):
+        ctor = {'constructorId': (t.get('slug') or slugify(t.get('name'))).replace('-', '_'), 'name': t.get('name')}
+        for d in t.get('drivers', []):
+            given, _, family = d['name'].partition(' ')
+            grid.append(({'driverId': (d.get('slug') or slugify(d['name'])).replace('-', '_'),
+                          'givenName': given, 'familyName': family}, ctor, rng.random()))
+    races, quals = [], []
+    for race in sorted(calendar.get('races', []), key=lambda r: int(r['round'])):
+        base = {'season': str(season), 'round': str(race['round']), 'raceName': race.get('name'), 'date': race.get('date')}
+        order = sorted(grid, key=lambda g: -(g[2] + rng.gauss(0, 0.3)))
+        fastest = rng.randrange(10)
+        results = []
+        for i, (driver, ctor, _) in enumerate(order):
+            row = {'position': str(i + 1), 'points': str(POINTS[i] if i < len(POINTS) else 0),
+                   'Driver': driver, 'Constructor': ctor}
+            if i == fastest:
+                row['FastestLap'] = {'rank': '1'}
+            results.append(row)
+        races.append({**base, 'Results': results})
+        grid_order = sorted(grid, key=lambda g: -(g[2] + rng.gauss(0, 0.2)))
+        quals.append({**base, 'QualifyingResults': [{'position': str(i + 1), 'Driver': d, 'Constructor': c}
+                                                    for i, (d, c, _) in enumerate(grid_order)]})
+    return races, [], quals
+
+def cached_season(season):
+    """`(races, sprints, qualifying)` from the `data/ergast` cache, or None."""
+    def load(name):
+        path = ERGAST_DIR / f'ergast_{season}_{name}.json'
+        return races_of(read_cached_json(path)) if cache_exists(path) else []
+    races = load('results')
+    return (races, load('sprint'), load('qualifying')) if races else None
+
+class ReplayFeed:
+    """Stand-in Ergast API that has results up to round `revealed` of one season."""
+
+    def __init__(self, season, races, sprints, quals):
+        self.season = str(season)
+        self.by_round = defaultdict(dict)
+        for name, rows in (('results', races), ('sprint', sprints), ('qualifying', quals)):
+            for race in rows:
+                self.by_round[int(race['round'])][name] = race
+        self.last = max(self.by_round, default=0)
+        self.revealed = 0
+
+    def standings(self, rnd, kind):
+        _, key, entity, id_key = STANDINGS[kind]
+        totals = {}
+        for r in range(1, rnd + 1):
+            for name, rows_key in (('results', 'Results'), ('sprint', 'SprintResults')):
+                for row in (self.by_round[r].get(name) or {}).get(rows_key, []):
+                    ent = row[entity]
+                    t = totals.setdefault(ent[id_key], {'points': 0.0, 'wins': 0, entity: ent})
+                    t['points'] += float(row.get('points') or 0)
+                    t['wins'] += name == 'results' and row.get('position') == '1'
+        ranked = sorted(totals.values(), key=lambda t: (-t['points'], -t['wins']))
+        rows = [{'position': str(i + 1), 'points': str(number(t['points'])), 'wins': str(t['wins']), entity: t[entity]}
+                for i, t in enumerate(ranked)]
+        return {'MRData': {'StandingsTable': {'season': self.season, 'round': str(rnd),
+                                              'StandingsLists': [{'round': str(rnd), key: rows}] if rows else []}}}
+
+    def payload(self, path):
+        parts = path.split('?')[0].strip('/').split('/')
+        if len(parts) != 3 or parts[0] != self.season:
+            return None
+        rnd, endpoint = parts[1], parts[2].removesuffix('.json')
+        rnd = self.revealed if rnd == 'last' else int(rnd) if rnd.isdigit() else 0
+        if endpoint in ('driverStandings', 'constructorStandings'):
+            kind = 'drivers' if endpoint == 'driverStandings' else 'teams'
+            return self.standings(min(rnd, self.revealed), kind)
+        race = self.by_round.get(rnd, {}).get(endpoint) if 1 <= rnd <= self.revealed else None
+        return {'MRData': {'RaceTable': {'season': self.season, 'round': str(rnd), 'Races': [race] if race else []}}}
+
+    def start(self, step):
+        feed = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                payload = feed.payload(self.path.removeprefix('/f1'))
+                if payload is None:
+                    self.send_error(404)
+                    return
+                body = json.dumps(payload).encode('utf8')
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        srv = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        srv.daemon_threads = True
+        threading.Thread(target=srv.serve_forever, daemon=True).start()
+
+        def advance():
+            while self.revealed < self.last:
+                self.revealed += 1
+                print(f'Replay: round {self.revealed} of {self.last} published')
+                time.sleep(step)
+        threading.Thread(target=advance, daemon=True).start()
+        return f'http://127.0.0.1:{srv.server_address[1]}/f1'
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Push race-weekend standings changes over Server-Sent Events')
+    ap.add_argument('--season', help='season to follow (default: data/calendar-2026.json)')
+    ap.add_argument('--interval', type=float, default=20.0, help='seconds between polls (default 20)')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8002)
+    ap.add_argument('--replay', nargs='?', const='', metavar='SEASON',
+                    help='replay a season from a local stand-in feed (default: synthetic 2026)')
+    ap.add_argument('--step', type=float, default=10.0, help='seconds between replayed rounds (default 10)')
+    ap.add_argument('--seed', type=int, default=7, help='seed of the synthetic replay season')
+    args = ap.parse_args(argv)
+
+    season = args.replay or args.season or str(json.loads(CALENDAR.read_text(encoding='utf8')).get('season'))
+    if args.replay is not None:
+        rows = cached_season(season)
+        if rows is None:
+            print('No cached results for', season, '- replaying a synthetic season')
+            rows = synthetic_season(season, args.seed)
+        base = ReplayFeed(season, *rows).start(args.step)
+        source = ErgastSource([base], transport=urllib_transport, hedge=False)
+        # let the first round land before the initial poll
+        time.sleep(0.2)
+    else:
+        source = default_source()
+    stats = json.loads(STATS.read_text(encoding='utf8'))
+    entries = json.loads(ENTRIES.read_text(encoding='utf8'))
+    live = LiveSeason(season, stats, SlugMap(stats, entries))
+    raise_fd_limit()
+    try:
+        asyncio.run(serve(live, ConditionalFeed(source), args.host, args.port, args.interval))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Replay homepage, team page and driver page visits against a local server.
+
+Usage:
+  python scripts/load_test.py [--modes full,precompressed,sharded,sharded-gz]
+                              [--concurrency 32] [--duration 10] [--mix home=5,team=3,driver=2]
+                              [--browser-cache] [--url http://127.0.0.1:8000] [--out results.json]
+
+A page view is the HTML plus everything the browser loads for it: the local
+stylesheet, script and images it links, and the data files `js/app.js`
+fetches for the elements on that page (calendar, entries, `stats.json`, and
+`entries-2026.json` again for the top-10 list and the team-season table).
+The mix is read from the pages on disk, so it follows the site as it
+changes. Each view is a cold visit; `--browser-cache` fetches a URL only
+once per view, like a browser reusing its memory cache.
+
+Every mode serves the repo root from a separate process on this machine:
+
+  full           plain static files, what `python -m http.server` does today
+  precompressed  the same files gzip-compressed once at startup and sent
+                 with `Content-Encoding: gzip` to clients that accept it
+  sharded        `stats.json` replaced by the slice a page needs: a top-10
+                 summary with display names for the homepage (no second
+                 entries fetch) and per-team / per-driver files for pages
+                 that are not pre-rendered
+  sharded-gz     sharded plus precompression
+
+`--concurrency` client threads, each on one keep-alive connection, replay
+views for `--duration` seconds. The report gives page views and requests
+per second, p50/p95/p99 latency of whole views and single requests, and the
+bytes per view (headers and body as sent) per page type. `--url` runs the
+`full` mix against a server that is already running instead.
+"""
+import argparse
+import gzip
+import http.client
+import json
+import multiprocessing
+import random
+import threading
+import time
+from collections import defaultdict
+from html.parser import HTMLParser
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+MODES = ('full', 'precompressed', 'sharded', 'sharded-gz')
+STATS_IDS = ('topDrivers', 'topTeams', 'teamSeasons', 'driverStats')
+TYPES = {'.html': 'text/html; charset=utf-8', '.json': 'application/json', '.css': 'text/css',
+         '.js': 'text/javascript', '.svg': 'image/svg+xml'}
+
+# -- request mix --------------------------------------------------------------------
+
+class PageScan(HTMLParser):
+    """Element ids (with their attributes) and same-site assets of one page."""
+
+    def __init__(self):
+        super().__init__()
+        self.ids = {}
+        self.assets = []
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        if a.get('id'):
+            self.ids[a['id']] = a
+        ref = None
+        if tag == 'link' and 'stylesheet' in (a.get('rel') or ''):
+            ref = a.get('href')
+        elif tag in ('script', 'img'):
+            ref = a.get('src')
+        if ref and '://' not in ref and not ref.startswith('//') and ref not in self.assets:
+            self.assets.append(ref)
+
+def pages():
+    """`{'home': [...], 'team': [...], 'driver': [...]}` repo-relative page paths."""
+    return {
+        'home': ['index.html'],
+        'team': sorted(p.relative_to(ROOT).as_posix() for p in ROOT.glob('teams/*/index.html')),
+        'driver': sorted(p.relative_to(ROOT).as_posix() for p in ROOT.glob('teams/*/drivers/*.html')),
+    }
+
+def view_requests(page, mode):
+    """URL paths one visit to `page` requests, in the order `app.js` issues them."""
+    scan = PageScan()
+    scan.feed((ROOT / page).read_text(encoding='utf8'))
+    ids = scan.ids
+    live = lambda i: i in ids and not ids[i].get('data-prerendered')
+    sharded = mode.startswith('sharded')
+    out = ['/' + page] + ['/' + a.lstrip('/') for a in scan.assets]
+    if 'calendarBody' in ids:
+        out.append('/data/calendar-2026.json')
+    if 'driversGrid' in ids or 'teamsGrid' in ids:
+        out.append('/data/entries-2026.json')
+    if not any(live(i) for i in STATS_IDS):
+        return out
+    if not sharded:
+        out.append('/data/stats.json')
+        if 'topDrivers' in ids:
+            out.append('/data/entries-2026.json')
+        if live('teamSeasons'):
+            out.append('/data/entries-2026.json')
+        return out
+    if 'topDrivers' in ids or 'topTeams' in ids:
+        out.append('/data/shards/top.json')
+    if live('teamSeasons'):
+        out.append(f"/data/shards/teams/{ids['teamSeasons'].get('data-team')}.json")
+    if live('driverStats'):
+        out.append(f"/data/shards/drivers/{ids['driverStats'].get('data-driver')}.json")
+    return out
+
+# -- server -------------------------------------------------------------------------
+
+def _norm(s):
+    return ''.join(c for c in (s or '').lower() if c.isalnum())
+
+def shard_files(stats, entries):
+    """In-memory shards for the `sharded` modes: URL path -> JSON bytes."""
+    names = {}
+    for t in entries.get('teams', []):
+        for d in t.get('drivers', []):
+            slug = d.get('slug') or ''.join(c if c.isalnum() else '-' for c in d['name'].lower()).strip('-')
+            names[slug] = {'name': d['name'], 'team': t.get('slug')}
+    points = lambda e: (e.get('allTime') or {}).get('points') or 0
+    drivers = sorted(stats.get('driverStats', {}).items(), key=lambda kv: -points(kv[1]))[:10]
+    teams = sorted(stats.get('teamStats', {}).items(), key=lambda kv: -points(kv[1]))[:10]
+    top = {'drivers': [{'slug': s, 'points': points(d), **names.get(s, {})} for s, d in drivers],
+           'teams': [{'slug': s, 'points': points(t)} for s, t in teams]}
+    dump = lambda o: json.dumps(o, ensure_ascii=False, separators=(',', ':')).encode('utf8')
+    files = {'/data/shards/top.json': dump(top)}
+    for slug, t in stats.get('teamStats', {}).items():
+        key = _norm(slug)
+        rows = {}
+        for dslug, d in stats.get('driverStats', {}).items():
+            seasons = {y: sd for y, sd in (d.get('bySeason') or {}).items()
+                       if _norm(sd.get('team')) and (_norm(sd.get('team')) in key or key in _norm(sd.get('team')))}
+            if seasons:
+                rows[dslug] = seasons
+        files[f'/data/shards/teams/{slug}.json'] = dump({'team': t, 'drivers': rows})
+    for slug, d in stats.get('driverStats', {}).items():
+        files[f'/data/shards/drivers/{slug}.json'] = dump(d)
+    return files
+
+def build_files(mode):
+    """URL path -> `(body, gzip body or None, content type)` served from memory in `mode`."""
+    raw = {}
+    if mode.startswith('sharded'):
+        stats = json.loads((DATA / 'stats.json').read_text(encoding='utf8'))
+        entries = json.loads((DATA / 'entries-2026.json').read_text(encoding='utf8'))
+        raw.update(shard_files(stats, entries))
+    if mode in ('precompressed', 'sharded-gz'):
+        for group in pages().values():
+            for page in group:
+                for path in view_requests(page, mode):
+                    if path not in raw and (ROOT / path.lstrip('/')).is_file():
+                        raw[path] = (ROOT / path.lstrip('/')).read_bytes()
+    gz = mode in ('precompressed', 'sharded-gz')
+    return {p: (b, gzip.compress(b, 9) if gz else None, TYPES.get(Path(p).suffix, 'application/octet-stream'))
+            for p, b in raw.items()}
+
+class SiteHandler(SimpleHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # headers and body go out as separate writes; without this, delayed ACKs add ~40ms per response
+    disable_nagle_algorithm = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(ROOT), **kwargs)
+
+    def do_GET(self):
+        entry = self.server.files.get(urlsplit(self.path).path)
+        if entry is None:
+            return super().do_GET()
+        body, gz, ctype = entry
+        if gz is not None and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gz
+        self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        if body is gz:
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        pass
+
+def serve(mode, ready):
+    srv = ThreadingHTTPServer(('127.0.0.1', 0), SiteHandler)
+    srv.daemon_threads = True
+    srv.files = build_files(mode)
+    ready.put(srv.server_address[1])
+    srv.serve_forever()
+
+# -- load generation ------------------------------------------------------------------
+
+def parse_mix(spec):
+    mix = {}
+    for part in spec.split(','):
+        kind, _, weight = part.partition('=')
+        mix[kind.strip()] = float(weight or 1)
+    unknown = set(mix) - {'home', 'team', 'driver'}
+    if unknown:
+        raise argparse.ArgumentTypeError(f'unknown page type: {", ".join(sorted(unknown))}')
+    return mix
+
+def worker(host, port, plans, mix, deadline, browser_cache, seed, out):
+    rng = random.Random(seed)
+    kinds = [k for k in mix if plans[k]]
+    weights = [mix[k] for k in kinds]
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    while time.perf_counter() < deadline:
+        kind = rng.choices(kinds, weights)[0]
+        paths = rng.choice(plans[kind])
+        if browser_cache:
+            paths = list(dict.fromkeys(paths))
+        sent = 0
+        ok = True
+        v0 = time.perf_counter()
+        for path in paths:
+            t0 = time.perf_counter()
+            try:
+                conn.request('GET', path, headers={'Accept-Encoding': 'gzip'})
+                r = conn.getresponse()
+                body = r.read()
+                ok = ok and r.status == 200
+                sent += len(body) + sum(len(k) + len(v) + 4 for k, v in r.getheaders()) + 17
+            except (OSError, http.client.HTTPException):
+                ok = False
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=30)
+            out['requests'].append(time.perf_counter() - t0)
+        out['views'].append((kind, time.perf_counter() - v0, sent, ok))
+    conn.close()
+
+def pct(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float('nan')
+
+def run_mode(mode, host, port, args):
+    plans = {kind: [view_requests(p, mode) for p in group] for kind, group in pages().items()}
+    deadline = time.perf_counter() + args.duration
+    outs = [{'requests': [], 'views': []} for _ in range(args.concurrency)]
+    threads = [threading.Thread(target=worker, args=(host, port, plans, args.mix, deadline, args.browser_cache,
+                                                     args.seed + i, outs[i]))
+               for i in range(args.concurrency)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    reqs = [x for o in outs for x in o['requests']]
+    views = [v for o in outs for v in o['views']]
+    by_kind = defaultdict(list)
+    for kind, _, sent, _ in views:
+        by_kind[kind].append(sent)
+    ms = lambda xs, q: pct(xs, q) * 1000
+    view_lat = [v[1] for v in views]
+    return {
+        'mode': mode, 'seconds': round(elapsed, 2), 'views': len(views), 'requests': len(reqs),
+        'errors': sum(1 for v in views if not v[3]),
+        'viewsPerSec': round(len(views) / elapsed, 1), 'requestsPerSec': round(len(reqs) / elapsed, 1),
+        'viewMs': {q: round(ms(view_lat, p), 2) for q, p in (('p50', .5), ('p95', .95), ('p99', .99))},
+        'requestMs': {q: round(ms(reqs, p), 2) for q, p in (('p50', .5), ('p95', .95), ('p99', .99))},
+        'bytesPerView': {k: round(sum(v) / len(v)) for k, v in sorted(by_kind.items())},
+        'requestsPerView': {k: sum(len(p) for p in plans[k]) / len(plans[k]) for k in plans if plans[k]},
+    }
+
+def report(results):
+    print(f'{"mode":14} {"views/s":>8} {"req/s":>8} {"view p50":>9} {"p95":>7} {"p99":>7} '
+          f'{"req p50":>8} {"p95":>7} {"p99":>7}  bytes/view (home / team / driver)  errors')
+    for r in results:
+        b = r['bytesPerView']
+        print(f'{r["mode"]:14} {r["viewsPerSec"]:8.1f} {r["requestsPerSec"]:8.1f} '
+              f'{r["viewMs"]["p50"]:8.1f}ms {r["viewMs"]["p95"]:6.1f} {r["viewMs"]["p99"]:6.1f}  '
+              f'{r["requestMs"]["p50"]:6.2f}ms {r["requestMs"]["p95"]:6.2f} {r["requestMs"]["p99"]:6.2f}  '
+              f'{b.get("home", 0):>9} / {b.get("team", 0):>7} / {b.get("driver", 0):>7}  {r["errors"]}')
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Load-test the static site with a realistic page-view mix')
+    ap.add_argument('--modes', default=','.join(MODES), help=f'comma-separated, from {", ".join(MODES)}')
+    ap.add_argument('--concurrency', type=int, default=32, help='client threads (one connection each)')
+    ap.add_argument('--duration', type=float, default=10.0, help='seconds per mode')
+    ap.add_argument('--mix', type=parse_mix, default=parse_mix('home=5,team=3,driver=2'))
+    ap.add_argument('--browser-cache', action='store_true', help='fetch each URL once per view')
+    ap.add_argument('--url', help='test this running server (full mix) instead of starting one')
+    ap.add_argument('--seed', type=int, default=7)
+    ap.add_argument('--out', help='also write the results as JSON')
+    args = ap.parse_args(argv)
+
+    results = []
+    if args.url:
+        u = urlsplit(args.url)
+        results.append(run_mode('full', u.hostname, u.port or 80, args))
+    else:
+        for mode in args.modes.split(','):
+            if mode not in MODES:
+                ap.error(f'unknown mode {mode}')
+            ready = multiprocessing.Queue()
+            proc = multiprocessing.Process(target=serve, args=(mode, ready), daemon=True)
+            proc.start()
+            try:
+                port = ready.get(timeout=60)
+                results.append(run_mode(mode, '127.0.0.1', port, args))
+            finally:
+                proc.terminate()
+                proc.join()
+    report(results)
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2), encoding='utf8')
+    return 1 if any(r['errors'] for r in results) else 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+"""Shared file helpers for the data pipeline scripts.
+
+- `atomic_write_text` writes via a temp file in the same directory followed by
+  `os.replace`, so readers never see a half-written artifact.
+- `write_cache_stream` / `read_cached_json` store raw API payloads gzip
+  compressed (`<name>.json.gz`) and read either that or a legacy plain
+  `<name>.json` transparently.
+- `slug_of` turns an Ergast id from those payloads (`max_verstappen`) into
+  the slug used throughout `stats.json` (`max-verstappen`).
+- `Checkpoint` is an append-only journal of completed fetch units
+  (endpoint, season, page) that lets an interrupted crawl resume.
+"""
+import gzip
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+# read once: os.umask can only be queried by setting it, which is not thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+@contextmanager
+def atomic_open(path, mode='wb'):
+    """Open a temp file next to `path`; it replaces `path` only on success.
+
+    The result keeps the mode of the file it replaces, or gets the usual
+    `0o666 & ~umask` for a new file (`mkstemp` alone would leave it 0600).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        perm = path.stat().st_mode & 0o7777
+    except OSError:
+        perm = 0o666 & ~_UMASK
+    fd, tmp = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, mode, **({} if 'b' in mode else {'encoding': 'utf8'})) as f:
+            yield f
+            f.flush()
+            os.fchmod(f.fileno(), perm)
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def atomic_write_text(path, text, encoding='utf8'):
+    with atomic_open(path, 'wb') as f:
+        f.write(text.encode(encoding))
+
+def write_json(path, obj):
+    """Atomically write `obj` using the repo's usual JSON formatting."""
+    atomic_write_text(path, json.dumps(obj, indent=2, ensure_ascii=False))
+
+def cache_file(path):
+    """On-disk location of the compressed cache entry for logical `path`."""
+    path = Path(path)
+    return path if path.suffix == '.gz' else path.with_name(path.name + '.gz')
+
+def cache_exists(path):
+    path = Path(path)
+    return cache_file(path).exists() or path.exists()
+
+def write_cache_stream(path, chunks, compresslevel=6, collect=True):
+    """Gzip byte `chunks` into the cache entry for `path` in a single pass.
+
+    Returns the raw (uncompressed) body as the `bytearray` it was collected
+    in, so the caller can parse it once without re-reading the file or
+    copying it; with `collect=False` nothing is kept and None is returned.
+    The gzip header carries no mtime, so identical payloads produce
+    identical files.
+    """
+    body = bytearray() if collect else None
+    with atomic_open(cache_file(path), 'wb') as f:
+        with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=compresslevel, mtime=0) as gz:
+            for chunk in chunks:
+                if chunk:
+                    gz.write(chunk)
+                    if collect:
+                        body += chunk
+    return body
+
+def read_cached_json(path):
+    """Load a cached payload, preferring `<path>.gz` over a plain legacy file."""
+    path = Path(path)
+    gz = cache_file(path)
+    if gz.exists():
+        with gzip.open(gz, 'rb') as f:
+            return json.loads(f.read())
+    return json.loads(path.read_text(encoding='utf8'))
+
+def slug_of(ergast_id):
+    return ergast_id.replace('_', '-').lower() if ergast_id else None
+
+class Checkpoint:
+    """Journal of completed (endpoint, season, page) units.
+
+    Each completed unit is appended as one JSON line and fsynced, so after a
+    crash the journal holds exactly the units whose payloads are on disk. A
+    truncated trailing line (interrupted append) is ignored on load.
+    `mark` may be called from several fetch threads at once.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = Path(path)
+        self.done = set()
+        self.lock = threading.Lock()
+        if resume and self.path.exists():
+            for line in self.path.read_text(encoding='utf8').splitlines():
+                try:
+                    u = json.loads(line)
+                except ValueError:
+                    continue
+                self.done.add(self.key(u.get('endpoint'), u.get('season'), u.get('page', 0)))
+        elif self.path.exists():
+            self.path.unlink()
+
+    @staticmethod
+    def key(endpoint, season, page=0):
+        return (str(endpoint), None if season is None else str(season), int(page or 0))
+
+    def is_done(self, endpoint, season, page=0):
+        return self.key(endpoint, season, page) in self.done
+
+    def mark(self, endpoint, season, page=0):
+        k = self.key(endpoint, season, page)
+        with self.lock:
+            if k in self.done:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open('a', encoding='utf8') as f:
+                f.write(json.dumps({'endpoint': k[0], 'season': k[1], 'page': k[2]}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self.done.add(k)
+
+    def clear(self):
+        """Drop the journal once a run has completed."""
+        with self.lock:
+            self.done.clear()
+            if self.path.exists():
+                self.path.unlink()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Rescore every cached Grand Prix result under one points system.
+
+Usage:
+  python scripts/rescoring.py [--system f1-2010] [--custom NAME=25,18,15,12,10,8,6,4,2,1+1/10] [--top 20]
+
+`allTime.points` adds up whatever each season awarded (9 points for a win in
+1975, 25 today), which favors recent drivers. Rescoring applies the same
+table to every race instead. The rows of the cached season results
+(`data/ergast/ergast_{season}_results.json[.gz]`) are read once into flat
+typed arrays per kind (drivers, constructors), grouped by entity:
+
+  position   classified finishing position, 0 when not classified (`array('B')`)
+  fastest    1 for the race's fastest lap (`array('B')`)
+  offsets    entity `i` owns rows `offsets[i]:offsets[i + 1]`
+
+A points system compiles to one flat lookup table indexed by
+`position * 2 + fastest`, so rescoring is a `map` of that table over the row
+codes, a running sum (`itertools.accumulate`), and one subtraction per
+entity; both passes run in C and full history takes a few milliseconds.
+
+Built-in systems are in `SYSTEMS`; custom ones come from
+`data/points-systems.json` (`{"name": {"points": [...], "fastestLap": 1,
+"fastestLapTop": 10}}`) or `--custom`. Only Grand Prix rows are rescored:
+sprints, dropped scores and half points for shortened races are left out so
+every era is measured the same way. Ergast has fastest-lap ranks from 2004
+on, so fastest-lap points are only awarded from then.
+
+At build time (`run_fetch_and_merge.finalize`) every driver and team in
+`stats.json` that has results gets `allTimeNormalized` (points under
+`DEFAULT_SYSTEM`, races counted, points per race), and
+`data/leaderboards.json` holds the top drivers and constructors under every
+system.
+"""
+import argparse
+import json
+import time
+from array import array
+from itertools import accumulate
+from pathlib import Path
+
+from build_circuits import cached_seasons
+from pipeline_io import cache_exists, read_cached_json, slug_of, write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+ERGAST_DIR = DATA / 'ergast'
+CUSTOM_SYSTEMS = DATA / 'points-systems.json'
+LEADERBOARDS = DATA / 'leaderboards.json'
+
+# positions beyond this never score and share code 0 with unclassified rows
+MAX_POSITION = 63
+TOP = 20
+
+SYSTEMS = {
+    'f1-1950': {'label': '1950-1959', 'points': [8, 6, 4, 3, 2], 'fastestLap': 1},
+    'f1-1960': {'label': '1960', 'points': [8, 6, 4, 3, 2, 1]},
+    'f1-1961': {'label': '1961-1990', 'points': [9, 6, 4, 3, 2, 1]},
+    'f1-1991': {'label': '1991-2002', 'points': [10, 6, 4, 3, 2, 1]},
+    'f1-2003': {'label': '2003-2009', 'points': [10, 8, 6, 5, 4, 3, 2, 1]},
+    'f1-2010': {'label': '2010-2018, 2025-', 'points': [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]},
+    'f1-2019': {'label': '2019-2024', 'points': [25, 18, 15, 12, 10, 8, 6, 4, 2, 1],
+                'fastestLap': 1, 'fastestLapTop': 10},
+}
+DEFAULT_SYSTEM = 'f1-2010'
+
+def parse_system(spec):
+    """`'name=25,18,15+1/10'` -> `('name', {'points': [25, 18, 15], 'fastestLap': 1, 'fastestLapTop': 10})`."""
+    name, _, rest = spec.partition('=')
+    table, _, fl = rest.partition('+')
+    try:
+        system = {'points': [float(p) for p in table.split(',') if p.strip()]}
+        if fl:
+            bonus, _, top = fl.partition('/')
+            system['fastestLap'] = float(bonus)
+            if top:
+                system['fastestLapTop'] = int(top)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'not a points system: {spec!r}')
+    if not name or not system['points']:
+        raise argparse.ArgumentTypeError(f'not a points system: {spec!r}')
+    return name.strip(), system
+
+def systems(custom=(), path=CUSTOM_SYSTEMS):
+    """Built-in systems plus those in `path` and `custom` (`(name, system)` pairs)."""
+    out = dict(SYSTEMS)
+    if Path(path).exists():
+        out.update(json.loads(Path(path).read_text(encoding='utf8')))
+    out.update(custom)
+    return out
+
+def lookup_table(system):
+    """Points per row code (`position * 2 + fastest`)."""
+    table = [0.0] * ((MAX_POSITION + 1) * 2)
+    for i, p in enumerate(system['points'][:MAX_POSITION]):
+        table[(i + 1) * 2] = table[(i + 1) * 2 + 1] = float(p)
+    bonus = float(system.get('fastestLap') or 0)
+    if bonus:
+        for pos in range(1, min(system.get('fastestLapTop') or MAX_POSITION, MAX_POSITION) + 1):
+            table[pos * 2 + 1] += bonus
+    return table
+
+# -- result columns ---------------------------------------------------------------------
+
+class ResultColumns:
+    """Race rows of one kind, grouped by entity."""
+
+    def __init__(self, slugs, offsets, position, fastest):
+        self.slugs = slugs
+        self.offsets = offsets
+        self.position = position
+        self.fastest = fastest
+        self.codes = array('H', [p * 2 + f for p, f in zip(position, fastest)])
+
+    @classmethod
+    def from_rows(cls, rows):
+        """`rows`: slug -> list of `(position, fastest)` in race order."""
+        slugs = sorted(rows)
+        offsets = array('I', [0])
+        position, fastest = array('B'), array('B')
+        for slug in slugs:
+            for p, f in rows[slug]:
+                position.append(p)
+                fastest.append(f)
+            offsets.append(len(position))
+        return cls(slugs, offsets, position, fastest)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def races(self, i):
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def score(self, table):
+        """Total points per entity (in `slugs` order) under a compiled `lookup_table`."""
+        run = list(accumulate(map(table.__getitem__, self.codes), initial=0.0))
+        offsets = self.offsets
+        return [run[offsets[i + 1]] - run[offsets[i]] for i in range(len(self.slugs))]
+
+def _row(r):
+    pos_text = r.get('positionText') or r.get('position') or ''
+    pos = int(pos_text) if pos_text.isdigit() else 0
+    fastest = 1 if (r.get('FastestLap') or {}).get('rank') in ('1', 1) else 0
+    return (pos if pos <= MAX_POSITION else 0), fastest
+
+def load_results(seasons=None, ergast_dir=ERGAST_DIR):
+    """`(drivers, teams, races)`: `ResultColumns` per kind from the cached season results."""
+    drivers, teams = {}, {}
+    races = 0
+    for s in sorted(seasons) if seasons is not None else cached_seasons(ergast_dir):
+        path = ergast_dir / f'ergast_{s}_results.json'
+        if not cache_exists(path):
+            continue
+        payload = read_cached_json(path)
+        race_list = sorted(payload.get('MRData', {}).get('RaceTable', {}).get('Races', []),
+                           key=lambda race: int(race.get('round') or 0))
+        for race in race_list:
+            races += 1
+            for r in race.get('Results', []):
+                row = _row(r)
+                d = slug_of((r.get('Driver') or {}).get('driverId'))
+                c = slug_of((r.get('Constructor') or {}).get('constructorId'))
+                if d:
+                    drivers.setdefault(d, []).append(row)
+                if c:
+                    teams.setdefault(c, []).append(row)
+    return ResultColumns.from_rows(drivers), ResultColumns.from_rows(teams), races
+
+def rescore(columns, system):
+    """`{slug: (points, races)}` for every entity under `system`."""
+    totals = columns.score(lookup_table(system))
+    return {slug: (totals[i], columns.races(i)) for i, slug in enumerate(columns.slugs)}
+
+def _points(v):
+    return int(v) if float(v).is_integer() else round(v, 2)
+
+def leaderboard(scores, top=TOP):
+    ranked = sorted(scores.items(), key=lambda kv: (-kv[1][0], kv[0]))[:top]
+    return [{'slug': slug, 'points': _points(pts), 'races': n, 'perRace': round(pts / n, 3) if n else 0}
+            for slug, (pts, n) in ranked if pts]
+
+def normalized(scores, system_name):
+    return {slug: {'system': system_name, 'points': _points(pts), 'races': n,
+                   'perRace': round(pts / n, 3) if n else 0}
+            for slug, (pts, n) in scores.items()}
+
+def apply(entities, fields):
+    """Set `allTimeNormalized` on the entities that have it; returns how many changed."""
+    changed = 0
+    for slug, value in fields.items():
+        ent = entities.get(slug)
+        if ent is None:
+            continue
+        extra = ent.extra or {}
+        if extra.get('allTimeNormalized') != value:
+            ent.extra = {**extra, 'allTimeNormalized': value}
+            changed += 1
+    return changed
+
+def build(model=None, seasons=None, system=DEFAULT_SYSTEM, custom=(), top=TOP, out=LEADERBOARDS, ergast_dir=ERGAST_DIR):
+    """Write the leaderboards and, with a `StatsModel`, set `allTimeNormalized` on it.
+
+    Returns how many drivers and teams changed (`{}` without a model), or None
+    when no cached season results are available.
+    """
+    all_systems = systems(custom)
+    drivers, teams, races = load_results(seasons, ergast_dir)
+    if not races:
+        return None
+    t0 = time.perf_counter()
+    boards = {'drivers': {}, 'teams': {}}
+    scores = {}
+    for name, spec in all_systems.items():
+        for kind, columns in (('drivers', drivers), ('teams', teams)):
+            scores[kind, name] = rescore(columns, spec)
+            boards[kind][name] = leaderboard(scores[kind, name], top)
+    elapsed = time.perf_counter() - t0
+    write_json(out, {'default': system, 'races': races, 'systems': all_systems, **boards})
+    print(f'Rescored {races} races ({len(drivers)} driver rows) under {len(all_systems)} systems '
+          f'in {elapsed * 1000:.1f} ms -> {out}')
+    changed = {}
+    if model is not None:
+        changed = {'drivers': apply(model.drivers, normalized(scores['drivers', system], system)),
+                   'teams': apply(model.teams, normalized(scores['teams', system], system))}
+    return changed
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Rescore cached race results under one points system')
+    ap.add_argument('--system', default=DEFAULT_SYSTEM, help=f'system for allTimeNormalized (default {DEFAULT_SYSTEM})')
+    ap.add_argument('--custom', type=parse_system, action='append', default=[],
+                    help='extra system, e.g. wins-only=1 or my-2026=25,18,15,12,10,8,6,4,2,1+1/10')
+    ap.add_argument('--top', type=int, default=TOP, help=f'leaderboard length (default {TOP})')
+    ap.add_argument('--show', action='store_true', help='print the --system driver leaderboard')
+    args = ap.parse_args(argv)
+    if args.system not in systems(args.custom):
+        ap.error(f'unknown system {args.system}')
+    if build(system=args.system, custom=args.custom, top=args.top) is None:
+        print('No cached season results in', ERGAST_DIR)
+        return 1
+    if args.show:
+        board = json.loads(LEADERBOARDS.read_text(encoding='utf8'))['drivers'][args.system]
+        for i, row in enumerate(board, 1):
+            print(f"{i:3}. {row['slug']:28} {row['points']:>9} p  {row['races']:4} races  {row['perRace']:6.2f} p/race")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -12,6 +12,14 @@ import sys
 from pathlib import Path
 import json
 
+import rescoring
+import streaks
+import snapshot_store
+import stats_binary
+import stats_versions
+from derived_metrics import update_model
+from stats_model import StatsModel
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA = ROOT / 'data'
 WIKI_OUT = DATA / 'stats.wikipedia.json'
@@ -21,17 +29,38 @@ FINAL = DATA / 'stats.json'
 
 def run(cmd):
     print('RUN:', ' '.join(cmd))
-    r = subprocess.run(cmd, shell=False)
+    r = subprocess.run(cmd, shell=False, cwd=ROOT)
     if r.returncode != 0:
         raise SystemExit(f'Command failed: {cmd}')
 
+def finalize(src):
+    """Add derived championship/record metrics, streaks and era-normalized points, write the final
+    artifact once, version it and write the binary snapshot of the same model."""
+    model = StatsModel.from_dict(src)
+    changed = update_model(model)
+    print('Derived metrics updated for', len(changed['drivers']), 'drivers,', len(changed['teams']), 'teams')
+    records = streaks.compute(model.seasons or [])
+    if records:
+        model.extra['records'] = records
+    normalized = rescoring.build(model)
+    if normalized:
+        print('allTimeNormalized updated for', normalized['drivers'], 'drivers,', normalized['teams'], 'teams')
+    model.save(FINAL)
+    print('Wrote', FINAL)
+    model.extra['version'] = stats_versions.publish(FINAL)
+    size = stats_binary.write(model)
+    print('Wrote', stats_binary.BINARY, f'({size} bytes)')
+
 def merge_and_write():
+    # A fixed file older than the generated one predates the last fetch; refresh it first
+    if FIXED_OUT.exists() and ERGAST_OUT.exists() and FIXED_OUT.stat().st_mtime_ns < ERGAST_OUT.stat().st_mtime_ns:
+        print(FIXED_OUT.name, 'is older than', ERGAST_OUT.name, '- re-running the fixer')
+        run([sys.executable, 'scripts/fix_stats.py', '--input', str(ERGAST_OUT)])
     # If fixed exists, use it as final; otherwise try generated
     if FIXED_OUT.exists():
         print('Using', FIXED_OUT)
         src = json.loads(FIXED_OUT.read_text(encoding='utf8'))
-        FINAL.write_text(json.dumps(src, indent=2, ensure_ascii=False), encoding='utf8')
-        print('Wrote', FINAL)
+        finalize(src)
         return
 
     # fallback: try to merge Ergast + Wikipedia into stats.json (best-effort)
@@ -51,38 +80,72 @@ def merge_and_write():
             d['careerFromWiki'] = data
 
     if out:
-        FINAL.write_text(json.dumps(out, indent=2, ensure_ascii=False), encoding='utf8')
-        print('Wrote', FINAL)
+        finalize(out)
     else:
         print('No generated data to write')
 
-def main():
-    # run generators (Ergast only — Wikipedia disabled per user request)
-    try:
-        run([sys.executable, 'scripts/fetch_stats_ergast.py'])
-    except SystemExit as e:
-        print('Ergast fetch failed:', e)
+def post_process(source=None):
+    """Run the steps that follow a fetch: fix, validate, merge + derived metrics, pages and search index, then snapshot the run.
 
+    `source` is the stats file the fixer starts from (default `stats.json`);
+    pass `stats.generated.json` after a fetch so its data reaches the merge.
+    """
     # run fixer
     try:
-        run([sys.executable, 'scripts/fix_stats.py'])
+        run([sys.executable, 'scripts/fix_stats.py'] + (['--input', str(source)] if source else []))
     except SystemExit as e:
         print('Fixer failed:', e)
 
     # run validator
     try:
-        run([sys.executable, 'scripts/validate-stats.py'])
+        run([sys.executable, 'scripts/validate_stats.py'])
     except SystemExit as e:
         print('Validator failed:', e)
 
-    # merge/choose final file
+    # merge/choose final file; championships and records are derived in the same write
     merge_and_write()
 
-    # compute championships/titles based on careerSummary (if present)
+    # re-render team/driver pages whose inputs changed
     try:
-        run([sys.executable, 'scripts/compute_championships.py'])
+        run([sys.executable, 'scripts/build_pages.py'])
     except SystemExit as e:
-        print('Compute championships failed:', e)
+        print('Page build failed:', e)
+
+    try:
+        run([sys.executable, 'scripts/search_index.py'])
+    except SystemExit as e:
+        print('Search index build failed:', e)
+
+    try:
+        run([sys.executable, 'scripts/build_circuits.py'])
+    except SystemExit as e:
+        print('Circuit build failed:', e)
+
+    try:
+        run([sys.executable, 'scripts/build_progression.py'])
+    except SystemExit as e:
+        print('Progression build failed:', e)
+
+    # championship odds for the rounds still to come
+    try:
+        run([sys.executable, 'scripts/simulate_season.py', '--top', '0'])
+    except SystemExit as e:
+        print('Season simulation failed:', e)
+
+    # record raw payloads + artifacts of this run; unchanged files are deduplicated
+    snapshot_store.snapshot(label='run')
+    snapshot_store.gc()
+
+def main():
+    # run generators (Ergast only — Wikipedia disabled per user request)
+    try:
+        run([sys.executable, 'scripts/fetch_stats_ergast.py'])
+        source = ERGAST_OUT
+    except SystemExit as e:
+        print('Ergast fetch failed:', e)
+        source = None
+
+    post_process(source)
 
 if __name__ == '__main__':
     main()
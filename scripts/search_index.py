@@ -0,0 +1,233 @@
+"""Prefix-search index for drivers, teams and circuits (`data/search-index.json`).
+
+Usage:
+  python scripts/search_index.py [--k 8]
+
+Indexed terms, all accent-folded (`Hülkenberg` -> `hulkenberg`) and reduced
+to lowercase alphanumerics:
+
+- drivers: given name, family name, Ergast code and the full name
+- teams: entry name, slug words and `aliases`
+- circuits: circuit, city, country and race name from `calendar-2026.json`
+
+Every word of a name is a term, and so is the whole name with the spaces
+removed, so `max verst` (folded to `maxverst`) and `verst` both hit Max
+Verstappen.
+
+Items are stored once, ordered by weight (career points for drivers and
+teams), so a lower item id means a better rank. The terms form a radix trie
+(single-child chains merged into one edge) where every node keeps the ids of
+the best `k` items below it. A lookup walks the query's characters down the
+trie and returns that node's list: O(len(prefix)) plus the result size, with
+no scan over the items.
+
+On disk a node is a JSON object mapping edge labels to child nodes, with the
+top-k ids under the empty key; a leaf is just its ids. An id list is a string
+of fixed-width (`w` characters) base-64 numbers, so `"AAAH"` is `[0, 7]`:
+
+  {"labels": [...], "kinds": "ttdd...", "refs": [...], "k": 8, "w": 2,
+   "trie": {"": "AAAB...", "ver": {"": "AAAH", "stappen": "AA"}, ...}}
+
+Items are the parallel `labels` / `kinds` / `refs` entries. `kind` is `d`
+(driver), `t` (team) or `c` (circuit); `ref` is kept short and expanded by
+`href`: `team/driver` slugs for a driver page, the team slug for a team page,
+the round number for a calendar entry.
+"""
+import argparse
+import json
+import unicodedata
+from pathlib import Path
+
+from pipeline_io import atomic_write_text
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+STATS = DATA / 'stats.json'
+CALENDAR = DATA / 'calendar-2026.json'
+INDEX = DATA / 'search-index.json'
+DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_'
+
+def fold(s):
+    """Accent-folded lowercase alphanumerics."""
+    s = unicodedata.normalize('NFKD', str(s or ''))
+    return ''.join(c for c in s if c.isalnum() and not unicodedata.combining(c)).lower()
+
+def terms(*names):
+    """Search terms for display names: every word plus each whole name."""
+    out = set()
+    for name in names:
+        if not name:
+            continue
+        words = [fold(w) for w in str(name).replace('-', ' ').split()]
+        out.update(w for w in words if w)
+        if len(words) > 1:
+            out.add(''.join(words))
+    return out
+
+def _points(all_time):
+    v = (all_time or {}).get('points')
+    if v is None:
+        v = (all_time or {}).get('f1Points')
+    try:
+        return float(v or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+# -- collecting items ---------------------------------------------------------
+
+def collect(stats=STATS, calendar=CALENDAR):
+    """`[(weight, label, kind, ref, terms)]` for every searchable entity."""
+    from build_pages import ENTRIES, assign_drivers, driver_name, team_pages
+    from f1stats import StatsDB
+
+    db = StatsDB(stats, auto_refresh=False)
+    entries = json.loads(ENTRIES.read_text(encoding='utf8')) if ENTRIES.exists() else {}
+    teams = team_pages(db, entries)
+    home = assign_drivers(db, teams)
+    items = []
+    for slug, ent in db.model.drivers.items():
+        info = db.info.get(slug) or {}
+        name = driver_name(db, slug)
+        ref = f'{home[slug]}/{slug}' if slug in home else None
+        items.append((_points(ent.all_time), name, 'd', ref,
+                      terms(name, info.get('givenName'), info.get('familyName'), info.get('code'), slug)))
+    for slug, team in teams.items():
+        ent = db.model.teams.get(team['stats'])
+        aliases = (ent.extra or {}).get('aliases', []) if ent is not None else []
+        items.append((_points(ent.all_time if ent is not None else None), team['name'], 't',
+                      slug, terms(team['name'], slug, team['stats'], *aliases)))
+    try:
+        cal = json.loads(Path(calendar).read_text(encoding='utf8'))
+    except (OSError, ValueError):
+        cal = {}
+    for race in cal.get('races', []):
+        label = f"{race.get('circuit')} — {race.get('city')}"
+        items.append((0.0, label, 'c', race.get('round'),
+                      terms(race.get('circuit'), race.get('city'), race.get('country'), race.get('name'))))
+    return items
+
+# -- building -------------------------------------------------------------------
+
+def _insert(node, term, item):
+    """Insert `term` into a radix node (`{'ids': set, 'kids': {edge: node}}`)."""
+    node['ids'].add(item)
+    while term:
+        for edge in list(node['kids']):
+            common = 0
+            while common < min(len(edge), len(term)) and edge[common] == term[common]:
+                common += 1
+            if not common:
+                continue
+            child = node['kids'][edge]
+            if common < len(edge):
+                # split the edge at the shared prefix
+                mid = {'ids': set(child['ids']), 'kids': {edge[common:]: child}}
+                del node['kids'][edge]
+                node['kids'][edge[:common]] = mid
+                child = mid
+            node, term = child, term[common:]
+            node['ids'].add(item)
+            break
+        else:
+            node['kids'][term] = {'ids': {item}, 'kids': {}}
+            return
+
+def pack_ids(ids, width):
+    out = []
+    for i in ids:
+        out.append(''.join(DIGITS[(i >> (6 * p)) & 63] for p in range(width - 1, -1, -1)))
+    return ''.join(out)
+
+def unpack_ids(packed, width):
+    ids = []
+    for j in range(0, len(packed), width):
+        n = 0
+        for c in packed[j:j + width]:
+            n = n * 64 + DIGITS.index(c)
+        ids.append(n)
+    return ids
+
+def _encode(node, k, width):
+    ids = pack_ids(sorted(node['ids'])[:k], width)
+    if not node['kids']:
+        return ids
+    out = {'': ids}
+    for edge in sorted(node['kids']):
+        out[edge] = _encode(node['kids'][edge], k, width)
+    return out
+
+def build(items, k=8):
+    """Index dict for `collect()` output; items are ranked by weight, then label."""
+    ranked = sorted(items, key=lambda it: (-it[0], it[2], it[1]))
+    root = {'ids': set(), 'kids': {}}
+    for i, (_, _, _, _, words) in enumerate(ranked):
+        for w in words:
+            _insert(root, w, i)
+    width = 1
+    while 64 ** width < len(ranked):
+        width += 1
+    return {'labels': [it[1] for it in ranked], 'kinds': ''.join(it[2] for it in ranked),
+            'refs': [it[3] for it in ranked], 'k': k, 'w': width, 'trie': _encode(root, k, width)}
+
+# -- lookup ---------------------------------------------------------------------
+
+class SearchIndex:
+    def __init__(self, data):
+        self.items = list(zip(data['labels'], data['kinds'], data['refs']))
+        self.k = data['k']
+        self.width = data['w']
+        self.trie = data['trie']
+
+    @classmethod
+    def load(cls, path=INDEX):
+        return cls(json.loads(Path(path).read_text(encoding='utf8')))
+
+    def node_for(self, prefix):
+        """Trie node covering every term that starts with `prefix` (folded)."""
+        node, rest = self.trie, prefix
+        while rest:
+            if type(node) is str:
+                return None
+            for edge, child in node.items():
+                if edge and edge[0] == rest[0]:
+                    break
+            else:
+                return None
+            n = min(len(edge), len(rest))
+            if edge[:n] != rest[:n]:
+                return None
+            node, rest = child, rest[n:]
+        return node
+
+    def ids(self, query):
+        node = self.node_for(fold(query))
+        if node is None:
+            return []
+        return unpack_ids(node if type(node) is str else node[''], self.width)
+
+    def lookup(self, query, limit=None):
+        """Best-ranked items whose terms start with `query` (at most `k`)."""
+        return [self.items[i] for i in self.ids(query)[:limit]]
+
+    @staticmethod
+    def href(item):
+        _, kind, ref = item
+        if kind == 'd':
+            return f'teams/{ref.split("/")[0]}/drivers/{ref.split("/")[1]}.html' if ref else None
+        if kind == 't':
+            return f'teams/{ref}/index.html'
+        return 'index.html#calendar'
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Build the prefix search index')
+    ap.add_argument('--k', type=int, default=8, help='results kept per prefix')
+    ap.add_argument('--stats', default=str(STATS))
+    ap.add_argument('--out', default=str(INDEX))
+    args = ap.parse_args(argv)
+    index = build(collect(args.stats), k=args.k)
+    # compact separators: this file is shipped to the browser as-is
+    atomic_write_text(args.out, json.dumps(index, ensure_ascii=False, separators=(',', ':')))
+    print('Search index:', len(index['labels']), 'items,', Path(args.out).stat().st_size, 'bytes ->', args.out)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Read-only JSON API over `data/stats.json`, served from an in-memory index.
+
+Usage:
+  python scripts/serve_api.py [--port 8001] [--stats data/stats.json]
+
+Endpoints:
+  GET /api/drivers/{slug}
+  GET /api/teams/{slug}/seasons/{year}
+  GET /api/leaderboard?metric=wins&season=2023   (also: start, end, kind=teams, limit)
+
+The stats file is loaded once into an `f1stats.StatsDB`. When the pipeline's
+`stats.bin` snapshot next to it is at least as new, driver and team-season
+records are read from that memory-mapped file (`stats_binary.BinaryStats`)
+instead of being re-serialised from the model; the StatsDB indexes still
+answer rosters and leaderboards. Encoded responses
+are cached per dataset generation and carry a strong ETag, so repeat requests
+with `If-None-Match` get a bodiless 304. When the pipeline replaces
+`stats.json` (always via rename, see `pipeline_io`), the next request builds a
+fresh StatsDB and swaps it in together with an empty response cache in one
+assignment; requests already running keep the generation they started with.
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from f1stats import STATS, StatsDB, file_stamp
+from stats_binary import BinaryStats
+
+# responses kept per generation; arbitrary query strings must not grow it forever
+MAX_CACHED_RESPONSES = 4096
+
+class Generation:
+    """One loaded dataset plus the responses rendered from it."""
+    __slots__ = ('db', 'binary', 'responses')
+
+    def __init__(self, db, binary=None):
+        self.db = db
+        self.binary = binary
+        self.responses = {}
+
+def open_binary(stats_path, stamp):
+    """The `.bin` snapshot beside `stats_path` if it is no older than the loaded `stamp`, else None."""
+    path = Path(stats_path).with_suffix('.bin')
+    try:
+        if os.stat(path).st_mtime_ns < stamp[0]:
+            return None
+        return BinaryStats(path)
+    except (OSError, ValueError):
+        return None
+
+def load(stats_path):
+    db = StatsDB(stats_path, auto_refresh=False)
+    return Generation(db, open_binary(stats_path, db._stamp))
+
+class ApiServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr, path=STATS):
+        super().__init__(addr, ApiHandler)
+        self.stats_path = Path(path)
+        self.quiet = False
+        self._lock = threading.Lock()
+        self.generation = load(self.stats_path)
+
+    def current(self):
+        gen = self.generation
+        if not gen.db.is_stale():
+            return gen
+        with self._lock:
+            if self.generation.db.is_stale():
+                try:
+                    self.generation = load(self.stats_path)
+                    print('Reloaded', self.stats_path)
+                except Exception as e:
+                    # keep serving the previous generation until a good file lands
+                    print('Reload failed, keeping previous data:', e)
+                    self.generation.db._stamp = file_stamp(self.stats_path)
+            return self.generation
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def _int(qs, name, default=None):
+    v = qs.get(name, [None])[0]
+    if v is None or v == '':
+        return default
+    try:
+        return int(v)
+    except ValueError:
+        raise ApiError(400, f'{name} must be an integer')
+
+def driver(db, slug, binary=None):
+    if binary is not None:
+        ent = binary.driver(slug)
+    else:
+        ent = db.model.drivers.get(slug)
+        ent = ent.to_dict() if ent is not None else None
+    if ent is None:
+        raise ApiError(404, f'unknown driver {slug}')
+    out = {'slug': slug, 'info': db.info.get(slug)}
+    out.update(ent)
+    return out
+
+def team_season(db, slug, year, binary=None):
+    if binary is not None:
+        if not binary.has('teams', slug):
+            raise ApiError(404, f'unknown team {slug}')
+        stats = binary.season('teams', slug, year)
+        record = lambda dslug: binary.season('drivers', dslug, year)
+    else:
+        ent = db.model.teams.get(slug)
+        if ent is None:
+            raise ApiError(404, f'unknown team {slug}')
+        rec = ent.get(year)
+        stats = rec.to_dict() if rec else None
+        record = lambda dslug: db.model.drivers[dslug].get(year).to_dict()
+    drivers = []
+    for dslug in db.team_drivers(slug, year):
+        sd = record(dslug)
+        info = db.info.get(dslug) or {}
+        drivers.append({'slug': dslug, 'name': info.get('name'), 'teamSlug': info.get('teamSlug'), **sd})
+    drivers.sort(key=lambda d: -(d.get('points') or 0))
+    return {'team': slug, 'season': year, 'stats': stats, 'drivers': drivers}
+
+def leaderboard(db, qs):
+    metric = qs.get('metric', ['points'])[0]
+    kind = qs.get('kind', ['drivers'])[0]
+    if kind not in ('drivers', 'teams'):
+        raise ApiError(400, 'kind must be drivers or teams')
+    if metric not in ('points', 'wins', 'podiums', 'poles', 'fastestLaps'):
+        raise ApiError(400, f'unsupported metric {metric}')
+    season = _int(qs, 'season')
+    start = _int(qs, 'start', season)
+    end = _int(qs, 'end', season)
+    limit = _int(qs, 'limit', 10)
+    rows = db.rank(metric, start=start, end=end, limit=limit, kind=kind)
+    return {'metric': metric, 'kind': kind, 'start': start, 'end': end,
+            'rows': [{'slug': s, 'name': (db.info.get(s) or {}).get('name'), metric: v} for s, v in rows]}
+
+def route(db, path, qs, binary=None):
+    parts = [p for p in path.split('/') if p]
+    if parts[:1] != ['api']:
+        raise ApiError(404, 'not found')
+    parts = parts[1:]
+    if len(parts) == 2 and parts[0] == 'drivers':
+        return driver(db, parts[1], binary)
+    if len(parts) == 4 and parts[0] == 'teams' and parts[2] == 'seasons':
+        try:
+            year = int(parts[3])
+        except ValueError:
+            raise ApiError(400, 'season must be a year')
+        return team_season(db, parts[1], year, binary)
+    if parts == ['leaderboard']:
+        return leaderboard(db, qs)
+    raise ApiError(404, 'not found')
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = 'f1-stats-api/1.0'
+
+    def do_GET(self):
+        gen = self.server.current()
+        key = self.path
+        cached = gen.responses.get(key)
+        if cached is None:
+            url = urlsplit(self.path)
+            try:
+                body = json.dumps(route(gen.db, url.path, parse_qs(url.query), gen.binary), ensure_ascii=False).encode('utf8')
+                status = 200
+            except ApiError as e:
+                body = json.dumps({'error': str(e)}).encode('utf8')
+                status = e.status
+            except KeyError as e:
+                body = json.dumps({'error': f'not found: {e}'}).encode('utf8')
+                status = 404
+            etag = '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+            cached = (status, body, etag)
+            if status == 200 and len(gen.responses) < MAX_CACHED_RESPONSES:
+                gen.responses[key] = cached
+        status, body, etag = cached
+
+        if status == 200 and etag in (self.headers.get('If-None-Match') or ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args):
+        if not self.server.quiet:
+            super().log_message(fmt, *args)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Serve a read-only JSON API over stats.json')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8001)
+    ap.add_argument('--stats', default=str(STATS), help='stats file to serve (default data/stats.json)')
+    ap.add_argument('--quiet', action='store_true', help='do not log every request')
+    args = ap.parse_args(argv)
+
+    srv = ApiServer((args.host, args.port), args.stats)
+    srv.quiet = args.quiet
+    print(f'Serving {args.stats} on http://{args.host}:{args.port}/api/')
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+
+if __name__ == '__main__':
+    main()
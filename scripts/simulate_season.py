@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""Monte Carlo odds for the rest of the 2026 championship.
+
+Usage:
+  python scripts/simulate_season.py [--simulations 200000] [--seed 2026] [--jobs N]
+                                    [--form max-verstappen=1.2] [--dnf 0.08] [--after-round 18]
+
+Starts from the current `bySeason['2026']` points and wins in `stats.json`,
+plays every remaining round of `data/calendar-2026.json` many times (with a
+sprint on weekends flagged `"sprint": true` there or found in the cached
+`ergast_2026_sprint.json`) and writes title and final-position probabilities
+for every driver and constructor to `data/simulation-2026.json`.
+
+Form model: each driver in `data/entries-2026.json` gets a strength of
+`(points per round so far + prior) ** sharpness`, times an optional per-driver
+factor, and finishing orders are drawn Plackett-Luce style (exponential
+race times with those rates, sorted). Each car independently retires with
+probability `dnf` and scores nothing. Defaults can be overridden in
+`data/simulation-form.json`:
+
+    {"sharpness": 1.5, "prior": 2, "dnf": 0.08, "drivers": {"max-verstappen": 1.2}}
+
+or with `--form SLUG=FACTOR`, `--sharpness`, `--prior` and `--dnf`.
+
+Simulations run in chunks of `CHUNK`. A chunk first samples a pool of
+`POOL` race (and sprint) results, each packed into one int with a bit field
+per car, so a simulated season is one int as well and every round is a
+single big-int add for the whole field, done for all seasons of the chunk
+by one `map` over the picked pool rows. The fields are then split into a
+column per car with `map(mask.__and__, map(rshift, ...))` and the final
+standings ranked per season by plain int sorting, with the entity packed
+into the low bits of each key; the per-position histograms are `Counter`s
+over the columns of those sorted rows, so the only Python-level loop per
+season is one `sorted` call. Scores are
+kept as `points * 2 * WIN_SCALE + wins`, which ranks on points (half points
+included) with ties going to the driver with more wins, then to whoever
+is ahead now. Chunks are seeded from `--seed` and the chunk number, so the
+output only depends on the seed and the number of simulations, not on
+`--jobs`; chunks fan out over a process pool when `--jobs` > 1.
+
+`run_fetch_and_merge.post_process` reruns this after every update, so the
+odds follow each round.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from itertools import repeat
+from math import log
+from operator import add, lshift, rshift, sub, truediv
+from pathlib import Path
+
+from pipeline_io import cache_exists, read_cached_json, write_json
+from rescoring import DEFAULT_SYSTEM, SYSTEMS
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+SEASON = 2026
+STATS = DATA / 'stats.json'
+CALENDAR = DATA / f'calendar-{SEASON}.json'
+ENTRIES = DATA / f'entries-{SEASON}.json'
+FORM = DATA / 'simulation-form.json'
+OUT = DATA / f'simulation-{SEASON}.json'
+ERGAST_DIR = DATA / 'ergast'
+
+SIMULATIONS = 200_000
+CHUNK = 20_000
+POOL = 4_096
+RACE_POINTS = SYSTEMS[DEFAULT_SYSTEM]['points']
+SPRINT_POINTS = [8, 7, 6, 5, 4, 3, 2, 1]
+# a season has far fewer rounds than this, so wins never carry into the points part
+WIN_SCALE = 64
+DEFAULTS = {'sharpness': 1.5, 'prior': 2.0, 'dnf': 0.08}
+
+def _number(v):
+    return v if isinstance(v, (int, float)) and not isinstance(v, bool) else 0
+
+def score(points, wins):
+    return int(round(points * 2)) * WIN_SCALE + int(wins)
+
+def points_of(value):
+    pts = (value // WIN_SCALE) / 2
+    return int(pts) if pts.is_integer() else pts
+
+# -- inputs -------------------------------------------------------------------------------
+
+def rounds_run(races, after_round=None, ergast_dir=ERGAST_DIR, today=None):
+    """Rounds already raced: `after_round`, else the cached results, else the calendar dates."""
+    if after_round is not None:
+        return after_round
+    path = ergast_dir / f'ergast_{SEASON}_results.json'
+    if cache_exists(path):
+        cached = read_cached_json(path).get('MRData', {}).get('RaceTable', {}).get('Races', [])
+        if cached:
+            return max(int(r.get('round') or 0) for r in cached)
+    today = (today or date.today()).isoformat()
+    return max((int(r['round']) for r in races if r.get('date') and r['date'] < today), default=0)
+
+def sprint_rounds(races, ergast_dir=ERGAST_DIR):
+    """Sprint weekends: rounds flagged `sprint` in the calendar plus any with cached sprint results."""
+    out = {int(r['round']) for r in races if r.get('sprint')}
+    path = ergast_dir / f'ergast_{SEASON}_sprint.json'
+    if cache_exists(path):
+        cached = read_cached_json(path).get('MRData', {}).get('RaceTable', {}).get('Races', [])
+        out.update(int(r.get('round') or 0) for r in cached)
+    return out
+
+def load_field(stats_path=STATS, entries_path=ENTRIES):
+    """`(drivers, teams, racing)`.
+
+    `drivers` / `teams`: slug -> `{'points', 'wins'}` so far, for everyone on
+    the entry list or with 2026 points; `racing`: `(driver, team)` for the cars
+    still to race, from the entry list.
+    """
+    stats = json.loads(Path(stats_path).read_text(encoding='utf8'))
+    entries = json.loads(Path(entries_path).read_text(encoding='utf8'))
+    racing = [(d['slug'], t['slug']) for t in entries.get('teams', []) for d in t.get('drivers', [])]
+
+    def standings(section, slugs):
+        out = {}
+        for slug, ent in stats.get(section, {}).items():
+            row = (ent.get('bySeason') or {}).get(str(SEASON)) or {}
+            if slug in slugs or _number(row.get('points')):
+                out[slug] = {'points': _number(row.get('points')), 'wins': _number(row.get('wins'))}
+        for slug in slugs:
+            out.setdefault(slug, {'points': 0, 'wins': 0})
+        return out
+
+    drivers = standings('driverStats', {d for d, _ in racing})
+    teams = standings('teamStats', {t for _, t in racing})
+    return drivers, teams, racing
+
+def load_form(path=FORM):
+    form = dict(DEFAULTS, drivers={})
+    if Path(path).exists():
+        form.update(json.loads(Path(path).read_text(encoding='utf8')))
+    return form
+
+def strengths(racing, drivers, done, form):
+    """Plackett-Luce rate per racing driver."""
+    factors = form.get('drivers') or {}
+    out = []
+    for slug, _ in racing:
+        per_round = drivers[slug]['points'] / done if done else 0.0
+        rate = (per_round + form['prior']) ** form['sharpness'] * float(factors.get(slug, 1.0))
+        # a zero factor still has to sort somewhere: last, in practice
+        out.append(max(rate, 1e-9))
+    return out
+
+def parse_factor(spec):
+    slug, _, factor = spec.partition('=')
+    try:
+        return slug.strip(), float(factor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'expected SLUG=FACTOR, got {spec!r}')
+
+# -- simulation ---------------------------------------------------------------------------
+
+def field_bits(rounds):
+    """Bits per car in a packed total: enough for every remaining round at its maximum."""
+    top = {'race': score(RACE_POINTS[0], 0) + 1, 'sprint': score(SPRINT_POINTS[0], 0)}
+    return sum(top[kind] for kind in rounds).bit_length()
+
+def sample_pool(rng, rates, dnf, table, wins, size, bits):
+    """`size` sampled results, each one int packing every car's scored value (`bits` per car)."""
+    values = [score(p, 0) for p in table][:len(rates)]
+    shifts = [d * bits for d in range(len(rates))]
+    cars = range(len(rates))
+    ones = [1.0] * len(rates)
+    rand = rng.random
+    pool = []
+    for _ in range(size):
+        # exponential race times with the strengths as rates, as log(1 - u) / rate: larger is faster
+        keys = list(map(truediv, map(log, map(sub, ones, [rand() for _ in cars])), rates))
+        order = sorted(cars, key=keys.__getitem__, reverse=True)
+        finished = [rand() >= dnf for _ in cars]
+        row, pos = 0, 0
+        for d in order:
+            if pos == len(values):
+                break
+            # retired cars score nothing and the finishers behind them move up
+            if finished[d]:
+                row += values[pos] << shifts[d]
+                pos += 1
+        if wins and pos:
+            row += 1 << shifts[next(d for d in order if finished[d])]
+        pool.append(row)
+    return pool
+
+def simulate_chunk(task):
+    """Play `sims` seasons; returns position histograms and point sums for drivers and teams."""
+    seed, sims, spec = task
+    rng = random.Random(f'{seed}/{spec["chunk"]}')
+    rates, dnf, bits = spec['rates'], spec['dnf'], spec['bits']
+    pools = {}
+    for kind in sorted(set(spec['rounds'])):
+        table, wins = (RACE_POINTS, True) if kind == 'race' else (SPRINT_POINTS, False)
+        pools[kind] = sample_pool(rng, rates, dnf, table, wins, POOL, bits)
+    # one packed int per season: a round is a single big-int add for the whole field
+    totals = [0] * sims
+    rows = range(POOL)
+    for kind in spec['rounds']:
+        totals = list(map(add, totals, map(pools[kind].__getitem__, rng.choices(rows, k=sims))))
+    mask = (1 << bits) - 1
+    gained = [list(map(mask.__and__, map(rshift, totals, repeat(d * bits, sims)))) for d in range(len(rates))]
+    return (standings(spec['drivers'], spec['driver_cars'], gained, sims),
+            standings(spec['teams'], spec['team_cars'], gained, sims))
+
+def standings(base, cars, gained, sims):
+    """Final-position histogram and summed totals for one kind.
+
+    `base`: current score per entity, already in tie-break order; `cars`:
+    per entity the indexes of its racing drivers in `gained`. The histogram
+    is keyed by `(entity index, position)`.
+    """
+    n = len(base)
+    tag_bits = max(n - 1, 1).bit_length()
+    wins_part = (WIN_SCALE - 1).__and__
+    keys, sums = [], []
+    for i, (value, idx) in enumerate(zip(base, cars)):
+        col = gained[idx[0]] if idx else [0] * sims
+        for d in idx[1:]:
+            col = list(map(add, col, gained[d]))
+        # points only: the win counters sit in the low bits
+        sums.append(sum(col) - sum(map(wins_part, col)) + (value - wins_part(value)) * sims)
+        # final score in the high bits and the tag below it: plain int sorting ranks on score,
+        # and equal scores go to the entity that is ahead now
+        keys.append(list(map(add, map(lshift, col, repeat(tag_bits, sims)),
+                             repeat((value << tag_bits) + n - 1 - i, sims))))
+    tag = ((1 << tag_bits) - 1).__and__
+    ranked = [sorted(row, reverse=True) for row in zip(*keys)]
+    hist = Counter()
+    for pos, col in enumerate(zip(*ranked)):
+        for t, count in Counter(map(tag, col)).items():
+            hist[n - 1 - t, pos] = count
+    return hist, sums
+
+def tasks(spec, simulations, seed):
+    out = []
+    for chunk, start in enumerate(range(0, simulations, CHUNK)):
+        out.append((seed, min(CHUNK, simulations - start), dict(spec, chunk=chunk)))
+    return out
+
+def run(spec, simulations, seed, jobs=None):
+    """Merged `(driver, team)` results of every chunk."""
+    todo = tasks(spec, simulations, seed)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as pool:
+            parts = list(pool.map(simulate_chunk, todo))
+    else:
+        parts = [simulate_chunk(t) for t in todo]
+    merged = []
+    for kind in range(2):
+        hist, sums = Counter(), None
+        for part in parts:
+            hist.update(part[kind][0])
+            sums = part[kind][1] if sums is None else list(map(add, sums, part[kind][1]))
+        merged.append((hist, sums))
+    return merged
+
+# -- output -------------------------------------------------------------------------------
+
+def table(slugs, base, result, simulations, extra):
+    hist, sums = result
+    n = len(slugs)
+    rows = []
+    for i, slug in enumerate(slugs):
+        probs = [hist[i, p] / simulations for p in range(n)]
+        rows.append({'slug': slug, **extra(slug), 'points': points_of(base[i]),
+                     'expectedPoints': round(sums[i] / simulations / WIN_SCALE / 2, 2),
+                     'title': round(probs[0], 5), 'positions': [round(p, 5) for p in probs]})
+    rows.sort(key=lambda r: (-r['title'], -r['expectedPoints'], r['slug']))
+    return rows
+
+def simulate(simulations=SIMULATIONS, seed=SEASON, jobs=None, after_round=None, factors=(), overrides=None,
+             out=OUT, stats_path=STATS):
+    """Simulate the rest of the season and write `out`; returns the written document."""
+    cal = json.loads(CALENDAR.read_text(encoding='utf8'))
+    races = sorted(cal.get('races', []), key=lambda r: int(r.get('round', 0)))
+    done = rounds_run(races, after_round)
+    remaining = [r for r in races if int(r['round']) > done]
+    drivers, teams, racing = load_field(stats_path)
+    form = load_form()
+    form.update(overrides or {})
+    form['drivers'] = {**(form.get('drivers') or {}), **dict(factors)}
+
+    # current order first, so ties in the final totals go to whoever is ahead now
+    def ordered(entities):
+        return sorted(entities, key=lambda s: (-score(entities[s]['points'], entities[s]['wins']), s))
+    driver_slugs, team_slugs = ordered(drivers), ordered(teams)
+    car = {slug: i for i, (slug, _) in enumerate(racing)}
+    sprints = sprint_rounds(races)
+    rounds = []
+    for r in remaining:
+        rounds += ['sprint', 'race'] if int(r['round']) in sprints else ['race']
+    if not rounds:
+        # season over: the standings are final and one pass records them
+        simulations = 1
+    spec = {'rates': strengths(racing, drivers, done, form), 'dnf': form['dnf'], 'rounds': rounds,
+            'bits': field_bits(rounds),
+            'drivers': [score(drivers[s]['points'], drivers[s]['wins']) for s in driver_slugs],
+            'driver_cars': [[car[s]] if s in car else [] for s in driver_slugs],
+            'teams': [score(teams[s]['points'], teams[s]['wins']) for s in team_slugs],
+            'team_cars': [[i for i, (_, t) in enumerate(racing) if t == s] for s in team_slugs]}
+
+    t0 = time.perf_counter()
+    driver_result, team_result = run(spec, simulations, seed, jobs)
+    elapsed = time.perf_counter() - t0
+    team_of = dict(racing)
+    doc = {'season': SEASON, 'generated': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+           'afterRound': done, 'remainingRounds': [int(r['round']) for r in remaining],
+           'sprintRounds': [int(r['round']) for r in remaining if int(r['round']) in sprints],
+           'simulations': simulations, 'seed': seed,
+           'model': {'sharpness': form['sharpness'], 'prior': form['prior'], 'dnf': form['dnf'],
+                     'points': RACE_POINTS, 'sprintPoints': SPRINT_POINTS,
+                     'strength': {slug: round(w, 4) for (slug, _), w in zip(racing, spec['rates'])}},
+           'drivers': table(driver_slugs, spec['drivers'], driver_result, simulations,
+                            lambda s: {'team': team_of.get(s)}),
+           'teams': table(team_slugs, spec['teams'], team_result, simulations, lambda s: {})}
+    write_json(out, doc)
+    print(f'Simulated {simulations} seasons ({len(rounds)} rounds left after round {done}) '
+          f'in {elapsed:.2f}s -> {out}')
+    return doc
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Monte Carlo odds for the rest of the season')
+    ap.add_argument('--simulations', type=int, default=SIMULATIONS, help=f'seasons to play (default {SIMULATIONS})')
+    ap.add_argument('--seed', type=int, default=SEASON, help=f'random seed (default {SEASON})')
+    ap.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    ap.add_argument('--after-round', type=int, help='treat the season as raced up to this round')
+    ap.add_argument('--form', type=parse_factor, action='append', default=[], metavar='SLUG=FACTOR',
+                    help='scale one driver\'s strength, e.g. lando-norris=1.25')
+    ap.add_argument('--sharpness', type=float, help=f'exponent on points per round (default {DEFAULTS["sharpness"]})')
+    ap.add_argument('--prior', type=float, help=f'points per round everybody starts from (default {DEFAULTS["prior"]})')
+    ap.add_argument('--dnf', type=float, help=f'retirement probability per car and round (default {DEFAULTS["dnf"]})')
+    ap.add_argument('--top', type=int, default=10, help='drivers and teams to print')
+    args = ap.parse_args(argv)
+    overrides = {k: getattr(args, k) for k in DEFAULTS if getattr(args, k) is not None}
+    doc = simulate(args.simulations, args.seed, args.jobs, args.after_round, args.form, overrides)
+    for kind in ('drivers', 'teams'):
+        for row in doc[kind][:args.top]:
+            print(f"  {row['slug']:28} {row['points']:>6} p  -> {row['expectedPoints']:7.1f} p  title {row['title']:7.2%}")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+"""Content-addressed store for raw API payloads and built artifacts.
+
+Usage:
+  python scripts/snapshot_store.py snapshot [--label LABEL]
+  python scripts/snapshot_store.py list
+  python scripts/snapshot_store.py restore RUN_ID [PATH ...]
+  python scripts/snapshot_store.py gc [--keep-runs 30] [--keep-days 90]
+
+Layout under `data/store/`:
+
+  objects/ab/abcdef...gz   file contents keyed by their sha256, gzip-compressed
+  runs/{run_id}.json       manifest: {"id", "created", "label", "files": {path: sha256}}
+  HEAD                     id of the last full run snapshotted or restored
+
+A snapshot hashes every tracked file (`TRACKED`: the Ergast cache and the
+stats/page artifacts) and only writes objects it does not have yet, so an
+unchanged payload costs one manifest line per run and disk use stays flat
+across daily runs. Restoring a run writes its files back from the objects
+(no re-crawl); `gc` drops manifests outside the retention policy and then
+deletes objects no remaining manifest refers to.
+
+This replaces the old one-off `stats.json.bak*` copies.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pipeline_io import atomic_open, atomic_write_text, cache_exists, cache_file, write_cache_stream, write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+STORE = DATA / 'store'
+OBJECTS = STORE / 'objects'
+RUNS = STORE / 'runs'
+HEAD = STORE / 'HEAD'
+
+# repo-relative globs captured by a default snapshot
+TRACKED = (
+    'data/ergast/*.json.gz',
+    'data/stats.json',
+    'data/stats.generated.json',
+    'data/stats.fixed.json',
+    'data/stats-validation-report.json',
+    'data/stats-version.json',
+    'data/pages-manifest.json',
+    'data/search-index.json',
+    'data/circuits/*.json',
+    'data/leaderboards.json',
+    'data/progression/*',
+    'data/simulation-2026.json',
+)
+
+def object_path(digest):
+    return OBJECTS / digest[:2] / digest
+
+def has_object(digest):
+    return cache_exists(object_path(digest))
+
+def put_bytes(data):
+    """Store `data` once; returns its sha256 hex digest."""
+    digest = hashlib.sha256(data).hexdigest()
+    if not has_object(digest):
+        write_cache_stream(object_path(digest), [data], collect=False)
+    return digest
+
+def get_bytes(digest):
+    path = object_path(digest)
+    with gzip.open(cache_file(path), 'rb') as f:
+        return f.read()
+
+def tracked_files(patterns=TRACKED):
+    files = set()
+    for pattern in patterns:
+        files.update(p for p in ROOT.glob(pattern) if p.is_file())
+    return sorted(files)
+
+def snapshot(paths=None, label=None):
+    """Record the current contents of `paths` (default: `TRACKED`) as a new run.
+
+    Only a full snapshot (every tracked file, as `post_process` takes after
+    finalizing a build) moves HEAD; the partial backups the fix, fill and
+    fetch steps take before overwriting a file are recorded but leave HEAD on
+    the last complete run.
+    """
+    files = [Path(p) for p in paths] if paths is not None else tracked_files()
+    now = datetime.now(timezone.utc)
+    run_id = now.strftime('%Y%m%dT%H%M%S%fZ')
+    entries = {}
+    new = 0
+    for p in files:
+        if not p.exists():
+            continue
+        path = p.resolve()
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if not has_object(digest):
+            write_cache_stream(object_path(digest), [data], collect=False)
+            new += 1
+        entries[path.relative_to(ROOT).as_posix()] = digest
+    full = paths is None
+    manifest = {'id': run_id, 'created': now.isoformat(timespec='seconds'), 'label': label, 'full': full,
+                'files': entries}
+    write_json(RUNS / f'{run_id}.json', manifest)
+    if full:
+        atomic_write_text(HEAD, run_id)
+    print(f'Snapshot {run_id}: {len(entries)} files, {new} new objects')
+    return manifest
+
+def list_runs():
+    runs = []
+    for p in sorted(RUNS.glob('*.json')):
+        try:
+            runs.append(json.loads(p.read_text(encoding='utf8')))
+        except ValueError:
+            continue
+    return runs
+
+def load_run(run_id):
+    return json.loads((RUNS / f'{run_id}.json').read_text(encoding='utf8'))
+
+def restore(run_id, paths=None):
+    """Write the files of run `run_id` (or only `paths` from it) back into place."""
+    manifest = load_run(run_id)
+    wanted = manifest['files']
+    if paths:
+        rel = {Path(p).resolve().relative_to(ROOT).as_posix() for p in paths}
+        wanted = {k: v for k, v in wanted.items() if k in rel}
+    for rel, digest in wanted.items():
+        with atomic_open(ROOT / rel, 'wb') as f:
+            f.write(get_bytes(digest))
+    if not paths and manifest.get('full', True):
+        atomic_write_text(HEAD, run_id)
+    print(f'Restored {len(wanted)} files from {run_id}')
+    return wanted
+
+def gc(keep_runs=30, keep_days=90):
+    """Drop runs that are neither among the newest `keep_runs` nor younger than
+    `keep_days` (HEAD is always kept), then delete unreferenced objects."""
+    runs = list_runs()
+    head = HEAD.read_text(encoding='utf8').strip() if HEAD.exists() else None
+    cutoff = time.time() - keep_days * 86400
+    keep = {r['id'] for r in runs[-keep_runs:]} if keep_runs else set()
+    dropped = 0
+    for r in runs:
+        created = datetime.fromisoformat(r['created']).timestamp()
+        if r['id'] in keep or r['id'] == head or created >= cutoff:
+            continue
+        (RUNS / f"{r['id']}.json").unlink()
+        dropped += 1
+    live = {d for r in list_runs() for d in r['files'].values()}
+    freed = removed = 0
+    for obj in OBJECTS.glob('*/*.gz'):
+        if obj.name[:-3] not in live:
+            freed += obj.stat().st_size
+            obj.unlink()
+            removed += 1
+    print(f'GC: dropped {dropped} runs, removed {removed} objects ({freed / 1e6:.1f} MB)')
+    return dropped, removed
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Content-addressed snapshots of payloads and artifacts')
+    sub = ap.add_subparsers(dest='cmd', required=True)
+    sp = sub.add_parser('snapshot', help='record the tracked files as a new run')
+    sp.add_argument('--label')
+    sp.add_argument('paths', nargs='*')
+    sub.add_parser('list', help='show recorded runs')
+    rp = sub.add_parser('restore', help='write a run back into place')
+    rp.add_argument('run_id')
+    rp.add_argument('paths', nargs='*')
+    gp = sub.add_parser('gc', help='apply retention and delete unreferenced objects')
+    gp.add_argument('--keep-runs', type=int, default=30)
+    gp.add_argument('--keep-days', type=int, default=90)
+    args = ap.parse_args(argv)
+
+    if args.cmd == 'snapshot':
+        snapshot(args.paths or None, label=args.label)
+    elif args.cmd == 'list':
+        head = HEAD.read_text(encoding='utf8').strip() if HEAD.exists() else None
+        for r in list_runs():
+            mark = '*' if r['id'] == head else ' '
+            print(mark, r['id'], r.get('label') or '', len(r['files']), 'files', '' if r.get('full', True) else '(partial)')
+    elif args.cmd == 'restore':
+        restore(args.run_id, args.paths or None)
+    elif args.cmd == 'gc':
+        gc(args.keep_runs, args.keep_days)
+
+if __name__ == '__main__':
+    main()
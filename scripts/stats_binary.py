@@ -0,0 +1,352 @@
+"""Memory-mapped binary snapshot of `data/stats.json` (`data/stats.bin`).
+
+Usage:
+  python scripts/stats_binary.py [--stats data/stats.json] [--out data/stats.bin] [--check]
+
+Parsing `stats.json` costs a full `json.loads` however little of it a caller
+needs. The binary snapshot holds the same data laid out for random access:
+
+  header     magic, format version, counts and section offsets
+  strings    string table: `(offset, length)` pairs, then UTF-8 bytes; slugs
+             and team names are stored once and referred to by id
+  entities   fixed-width rows `(slug id, first record, record count, blob
+             offset, blob length)`: drivers, then teams, each sorted by slug
+  records    one fixed-width row per (entity, season), seasons ascending:
+             year, present/null bitmasks, team id, points, wins, podiums,
+             poles, fastest laps, races, position
+  blobs      per-entity JSON for the irregular parts (`allTime`, aliases,
+             feeder-series rows, anything that does not fit a record column)
+  meta       top-level JSON (`seasons`, `drivers`, `records`, `version`, ...)
+
+`BinaryStats` maps the file and only decodes what a query touches: a driver
+lookup is a binary search over the entity rows plus one `struct.unpack_from`
+per season, so it costs microseconds whatever the size of the dataset.
+`BinaryStats(path).to_dict()` equals `StatsModel.load(json_path).to_dict()`.
+"""
+import argparse
+import json
+import mmap
+import struct
+from array import array
+from pathlib import Path
+
+from pipeline_io import atomic_open
+from stats_model import FIELDS, StatsModel
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+STATS = DATA / 'stats.json'
+BINARY = DATA / 'stats.bin'
+
+MAGIC = b'F1SB'
+FORMAT = 1
+HEADER = struct.Struct('<4sHHIIII7Q')
+STRING = struct.Struct('<II')
+ENTITY = struct.Struct('<IIIQI')
+RECORD = struct.Struct('<HHHIdiiiiii')
+NO_STRING = 0xFFFFFFFF
+# record columns after year/present/nulls/team/points, in `FIELDS` order
+INT_FIELDS = FIELDS[2:]
+_BIT = {f: 1 << i for i, f in enumerate(FIELDS)}
+_BITS = tuple(_BIT[f] for f in FIELDS)
+FLOAT_POINTS = 1 << 15
+INT32 = (-2 ** 31, 2 ** 31 - 1)
+KINDS = ('drivers', 'teams')
+
+# -- writing ----------------------------------------------------------------------
+
+class _Strings:
+    def __init__(self):
+        self.ids = {}
+        self.items = []
+
+    def id(self, s):
+        i = self.ids.get(s)
+        if i is None:
+            i = self.ids[s] = len(self.items)
+            self.items.append(s.encode('utf8'))
+        return i
+
+def _record(rec, year, strings, overrides):
+    """Pack one `SeasonRecord`; values that do not fit a column go to `overrides`."""
+    nulls = 0
+    flags = 0
+    over = {}
+    team = NO_STRING
+    if rec.present & _BIT['team']:
+        if rec.team is None:
+            nulls |= _BIT['team']
+        elif type(rec.team) is str:
+            team = strings.id(rec.team)
+        else:
+            over['team'] = rec.team
+    points = 0.0
+    if rec.present & _BIT['points']:
+        v = rec.points
+        if v is None:
+            nulls |= _BIT['points']
+        elif type(v) is float:
+            points, flags = v, FLOAT_POINTS
+        elif type(v) is int and abs(v) < 2 ** 53:
+            points = float(v)
+        else:
+            over['points'] = v
+    ints = []
+    for f in INT_FIELDS:
+        v = getattr(rec, f)
+        if not rec.present & _BIT[f] or v is None:
+            if rec.present & _BIT[f]:
+                nulls |= _BIT[f]
+            ints.append(0)
+        elif type(v) is int and INT32[0] <= v <= INT32[1]:
+            ints.append(v)
+        else:
+            over[f] = v
+            ints.append(0)
+    if over:
+        overrides[str(year)] = over
+    return RECORD.pack(year, rec.present | flags, nulls, team, points, *ints)
+
+def encode(model):
+    """`StatsModel` -> snapshot bytes."""
+    strings = _Strings()
+    entities = []
+    records = bytearray()
+    blobs = bytearray()
+    n_records = 0
+    counts = []
+    for kind in KINDS:
+        group = getattr(model, kind)
+        slugs = sorted(group, key=lambda s: s.encode('utf8'))
+        counts.append(len(slugs))
+        for slug in slugs:
+            ent = group[slug]
+            first = n_records
+            overrides = {}
+            rec_extra = {}
+            for year, rec in ent.items():
+                records += _record(rec, year, strings, overrides)
+                if rec.extra:
+                    rec_extra[str(year)] = rec.extra
+                n_records += 1
+            blob = {}
+            if ent.extra:
+                blob['extra'] = ent.extra
+            if ent.all_time is not None:
+                blob['allTime'] = ent.all_time
+            if ent.other:
+                blob['other'] = ent.other
+            if not ent.has_by_season:
+                blob['hasBySeason'] = False
+            if rec_extra:
+                blob['recordExtra'] = rec_extra
+            if overrides:
+                blob['overrides'] = overrides
+            off = len(blobs)
+            if blob:
+                blobs += json.dumps(blob, ensure_ascii=False, separators=(',', ':')).encode('utf8')
+            entities.append(ENTITY.pack(strings.id(slug), first, n_records - first, off, len(blobs) - off))
+
+    meta = {'keys': list(model.keys), 'seasons': model.seasons, 'extra': model.extra}
+    meta = json.dumps(meta, ensure_ascii=False, separators=(',', ':')).encode('utf8')
+
+    str_index = bytearray()
+    str_data = bytearray()
+    for b in strings.items:
+        str_index += STRING.pack(len(str_data), len(b))
+        str_data += b
+    sections = [str_index, str_data, b''.join(entities), records, blobs, meta]
+    offsets = []
+    pos = HEADER.size
+    for s in sections:
+        offsets.append(pos)
+        pos += len(s)
+    header = HEADER.pack(MAGIC, FORMAT, len(FIELDS), len(strings.items), counts[0], counts[1], n_records,
+                         *offsets, len(meta))
+    return header + b''.join(sections)
+
+def write(model, path=BINARY):
+    data = encode(model)
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+# -- reading ----------------------------------------------------------------------
+
+class BinaryStats:
+    """Read-only, memory-mapped view of a snapshot written by `write`."""
+
+    def __init__(self, path=BINARY):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, fmt, nfields, self.n_strings, n_drivers, n_teams, self.n_records,
+         self.str_index, self.str_data, self.ent_off, self.rec_off, self.blob_off,
+         self.meta_off, self.meta_len) = HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC or fmt != FORMAT or nfields != len(FIELDS):
+            self.close()
+            raise ValueError(f'{self.path}: not a stats snapshot (format {FORMAT})')
+        self.ranges = {'drivers': (0, n_drivers), 'teams': (n_drivers, n_drivers + n_teams)}
+        self._meta = None
+
+    def close(self):
+        self.buf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _bytes(self, sid):
+        off, n = STRING.unpack_from(self.buf, self.str_index + sid * STRING.size)
+        start = self.str_data + off
+        return self.buf[start:start + n]
+
+    def string(self, sid):
+        return None if sid == NO_STRING else self._bytes(sid).decode('utf8')
+
+    def _entity(self, i):
+        return ENTITY.unpack_from(self.buf, self.ent_off + i * ENTITY.size)
+
+    def _find(self, kind, slug):
+        """Entity row for `slug` by binary search over the sorted slugs, or None."""
+        key = slug.encode('utf8')
+        lo, hi = self.ranges[kind]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = self._entity(mid)
+            cur = self._bytes(row[0])
+            if cur < key:
+                lo = mid + 1
+            elif cur > key:
+                hi = mid
+            else:
+                return row
+        return None
+
+    def _blob(self, row):
+        if not row[4]:
+            return {}
+        start = self.blob_off + row[3]
+        return json.loads(self.buf[start:start + row[4]])
+
+    def _record(self, i, overrides=None):
+        year, present, nulls, team, points, *ints = RECORD.unpack_from(self.buf, self.rec_off + i * RECORD.size)
+        values = (self.string(team), points if present & FLOAT_POINTS else int(points), *ints)
+        out = {f: None if nulls & bit else v for f, bit, v in zip(FIELDS, _BITS, values) if present & bit}
+        if overrides:
+            out.update(overrides.get(str(year), ()))
+        return year, out
+
+    def slugs(self, kind='drivers'):
+        lo, hi = self.ranges[kind]
+        for i in range(lo, hi):
+            yield self.string(self._entity(i)[0])
+
+    def season(self, kind, slug, year):
+        """One season record as a dict (or None); reads only that record."""
+        row = self._find(kind, slug)
+        if row is None:
+            return None
+        lo, hi = row[1], row[1] + row[2]
+        year = int(year)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            y = struct.unpack_from('<H', self.buf, self.rec_off + mid * RECORD.size)[0]
+            if y < year:
+                lo = mid + 1
+            elif y > year:
+                hi = mid
+            else:
+                blob = self._blob(row)
+                rec = self._record(mid, blob.get('overrides'))[1]
+                rec.update((blob.get('recordExtra') or {}).get(str(year), ()))
+                return rec
+        return None
+
+    def has(self, kind, slug):
+        return self._find(kind, slug) is not None
+
+    def entity(self, kind, slug):
+        """A driver or team in the `stats.json` shape (`bySeason`, `allTime`, ...), or None."""
+        row = self._find(kind, slug)
+        if row is None:
+            return None
+        return self._materialize(row)
+
+    def _materialize(self, row):
+        blob = self._blob(row)
+        out = dict(blob.get('extra') or {})
+        if blob.get('hasBySeason', True):
+            by_season = {}
+            rec_extra = blob.get('recordExtra') or {}
+            for i in range(row[1], row[1] + row[2]):
+                year, rec = self._record(i, blob.get('overrides'))
+                rec.update(rec_extra.get(str(year), ()))
+                by_season[str(year)] = rec
+            by_season.update(blob.get('other') or {})
+            out['bySeason'] = by_season
+        if 'allTime' in blob:
+            out['allTime'] = blob['allTime']
+        return out
+
+    def driver(self, slug):
+        return self.entity('drivers', slug)
+
+    def team(self, slug):
+        return self.entity('teams', slug)
+
+    def vector(self, kind, slug, metric, typecode='d'):
+        """`metric` over an entity's seasons as a typed array (None -> 0), like `EntityStats.vector`."""
+        row = self._find(kind, slug)
+        if row is None:
+            return None
+        overrides = self._blob(row).get('overrides') if row[4] else None
+        return array(typecode, [self._record(i, overrides)[1].get(metric) or 0
+                                for i in range(row[1], row[1] + row[2])])
+
+    def meta(self):
+        if self._meta is None:
+            start = self.meta_off
+            self._meta = json.loads(self.buf[start:start + self.meta_len])
+        return self._meta
+
+    def to_dict(self):
+        """Everything, in the same shape as `StatsModel.to_dict()`."""
+        meta = self.meta()
+        groups = {}
+        for kind in KINDS:
+            lo, hi = self.ranges[kind]
+            group = groups[kind] = {}
+            for i in range(lo, hi):
+                row = self._entity(i)
+                group[self.string(row[0])] = self._materialize(row)
+        out = {}
+        if 'seasons' in meta['keys'] or meta['seasons']:
+            out['seasons'] = meta['seasons']
+        if 'driverStats' in meta['keys'] or groups['drivers']:
+            out['driverStats'] = groups['drivers']
+        if 'teamStats' in meta['keys'] or groups['teams']:
+            out['teamStats'] = groups['teams']
+        out.update(meta['extra'])
+        return out
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Write the memory-mapped stats snapshot')
+    ap.add_argument('--stats', default=str(STATS))
+    ap.add_argument('--out', default=str(BINARY))
+    ap.add_argument('--check', action='store_true', help='verify the snapshot reproduces the JSON')
+    args = ap.parse_args(argv)
+    model = StatsModel.load(args.stats)
+    size = write(model, args.out)
+    print(f'Wrote {args.out}: {size} bytes')
+    if args.check:
+        with BinaryStats(args.out) as snap:
+            ok = snap.to_dict() == model.to_dict()
+        print('Round trip:', 'ok' if ok else 'MISMATCH')
+        return 0 if ok else 1
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,228 @@
+"""Compact typed in-memory model of `data/stats.json`.
+
+The JSON artifact is a dict of dicts with one small dict per driver-season.
+This module holds the same data as:
+
+- `SeasonRecord`: a `__slots__` record per (entity, season). Which fields were
+  present in the source is kept in a bitmask, so a missing key and an explicit
+  `null` stay distinguishable and `to_dict` gives back every key and value.
+  Unknown per-season keys are kept in `extra`.
+- `EntityStats`: one driver or team. Season years live in a sorted
+  `array('H')` aligned with the record list; `vector(metric)` returns a
+  metric as a typed array for hot loops. Non-year `bySeason` keys (feeder
+  rows such as `2024_f2`) are kept untouched in `other`.
+- `StatsModel`: the whole dataset (`seasons`, `driverStats`, `teamStats` and
+  any other top-level keys, kept as-is).
+
+Team names are interned, so the thousands of "Ferrari" strings in a full
+history share one object.
+
+Round trip: `StatsModel.from_dict(d).to_dict() == d` for any stats.json. The
+comparison is by value; key order is normalized on the way out: season fields
+in `FIELDS` order before unknown ones, entity extras before `bySeason` and
+`allTime`, years ascending with `other` keys after them, and top-level extras
+after `seasons`/`driverStats`/`teamStats`.
+"""
+import json
+import sys
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+# per-season fields, in the order they are written back out
+FIELDS = ('team', 'points', 'wins', 'podiums', 'poles', 'fastestLaps', 'races', 'position')
+_BIT = {f: 1 << i for i, f in enumerate(FIELDS)}
+ALL_FIELDS = (1 << len(FIELDS)) - 1
+
+def _intern(v):
+    return sys.intern(v) if type(v) is str else v
+
+class SeasonRecord:
+    __slots__ = FIELDS + ('present', 'extra')
+
+    def __init__(self, present=0, extra=None, **values):
+        for f in FIELDS:
+            object.__setattr__(self, f, None)
+        self.present = present
+        self.extra = extra
+        for k, v in values.items():
+            setattr(self, k, v)
+
+    def __setattr__(self, name, value):
+        bit = _BIT.get(name)
+        if bit is not None:
+            if name == 'team':
+                value = _intern(value)
+            object.__setattr__(self, 'present', self.present | bit)
+        object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        return f'SeasonRecord({self.to_dict()!r})'
+
+    @classmethod
+    def zero(cls, team=None):
+        """Empty driver season, matching the defaults the fixers fill in."""
+        return cls(team=team, points=0, wins=0, podiums=0, poles=0, fastestLaps=0, position=None)
+
+    @classmethod
+    def from_dict(cls, d):
+        rec = cls()
+        extra = None
+        for k, v in d.items():
+            if k in _BIT:
+                setattr(rec, k, v)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[k] = v
+        rec.extra = extra
+        return rec
+
+    def to_dict(self):
+        out = {f: getattr(self, f) for f in FIELDS if self.present & _BIT[f]}
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+    def has(self, field):
+        bit = _BIT.get(field)
+        if bit is None:
+            return bool(self.extra) and field in self.extra
+        return bool(self.present & bit)
+
+    def get(self, field, default=None):
+        if field in _BIT:
+            return getattr(self, field) if self.present & _BIT[field] else default
+        return (self.extra or {}).get(field, default)
+
+    def fill_missing(self, defaults):
+        """Set every field in `defaults` that the record does not have yet."""
+        for k, v in defaults.items():
+            if not self.has(k):
+                setattr(self, k, v)
+
+class EntityStats:
+    """All seasons of one driver or team plus its allTime block."""
+    __slots__ = ('years', 'records', 'other', 'all_time', 'has_by_season', 'extra')
+
+    def __init__(self, all_time=None, extra=None):
+        self.years = array('H')
+        self.records = []
+        self.other = None
+        self.all_time = all_time
+        self.has_by_season = True
+        self.extra = extra
+
+    @classmethod
+    def new(cls, all_time=None):
+        return cls(all_time=dict(all_time) if all_time is not None else None)
+
+    @classmethod
+    def from_dict(cls, d):
+        ent = cls()
+        by_season = d.get('bySeason')
+        ent.has_by_season = 'bySeason' in d
+        rows = []
+        for k, sd in (by_season or {}).items():
+            if k.isdigit() and str(int(k)) == k:
+                rows.append((int(k), sd))
+            else:
+                if ent.other is None:
+                    ent.other = {}
+                ent.other[k] = sd
+        for y, sd in sorted(rows, key=lambda r: r[0]):
+            ent.years.append(y)
+            ent.records.append(SeasonRecord.from_dict(sd))
+        ent.all_time = d.get('allTime')
+        extra = {k: v for k, v in d.items() if k not in ('bySeason', 'allTime')}
+        ent.extra = extra or None
+        return ent
+
+    def to_dict(self):
+        out = {}
+        if self.extra:
+            out.update(self.extra)
+        if self.has_by_season:
+            out['bySeason'] = {str(y): r.to_dict() for y, r in zip(self.years, self.records)}
+            if self.other:
+                out['bySeason'].update(self.other)
+        if self.all_time is not None:
+            out['allTime'] = self.all_time
+        return out
+
+    def __len__(self):
+        return len(self.records)
+
+    def items(self):
+        return zip(self.years, self.records)
+
+    def get(self, season):
+        season = int(season)
+        i = bisect_left(self.years, season)
+        if i < len(self.years) and self.years[i] == season:
+            return self.records[i]
+        return None
+
+    def __contains__(self, season):
+        return self.get(season) is not None
+
+    def set(self, season, rec):
+        season = int(season)
+        i = bisect_left(self.years, season)
+        if i < len(self.years) and self.years[i] == season:
+            self.records[i] = rec
+        else:
+            self.years.insert(i, season)
+            self.records.insert(i, rec)
+        self.has_by_season = True
+        return rec
+
+    def setdefault(self, season, factory=SeasonRecord.zero):
+        rec = self.get(season)
+        return rec if rec is not None else self.set(season, factory())
+
+    def vector(self, metric, typecode='d'):
+        """`metric` over all seasons (in year order) as a typed array; None -> 0."""
+        return array(typecode, [getattr(r, metric) or 0 for r in self.records])
+
+class StatsModel:
+    __slots__ = ('seasons', 'drivers', 'teams', 'extra', 'keys')
+
+    def __init__(self, seasons=None, drivers=None, teams=None, extra=None):
+        self.seasons = seasons if seasons is not None else []
+        self.drivers = drivers if drivers is not None else {}
+        self.teams = teams if teams is not None else {}
+        self.extra = extra or {}
+        # containers present in the source, so to_dict does not invent empty ones
+        self.keys = ('seasons', 'driverStats', 'teamStats')
+
+    @classmethod
+    def from_dict(cls, d):
+        m = cls(
+            seasons=d.get('seasons'),
+            drivers={k: EntityStats.from_dict(v) for k, v in (d.get('driverStats') or {}).items()},
+            teams={k: EntityStats.from_dict(v) for k, v in (d.get('teamStats') or {}).items()},
+            extra={k: v for k, v in d.items() if k not in ('seasons', 'driverStats', 'teamStats')},
+        )
+        m.keys = tuple(k for k in d if k in ('seasons', 'driverStats', 'teamStats'))
+        return m
+
+    def to_dict(self):
+        out = {}
+        if 'seasons' in self.keys or self.seasons:
+            out['seasons'] = self.seasons
+        if 'driverStats' in self.keys or self.drivers:
+            out['driverStats'] = {k: v.to_dict() for k, v in self.drivers.items()}
+        if 'teamStats' in self.keys or self.teams:
+            out['teamStats'] = {k: v.to_dict() for k, v in self.teams.items()}
+        out.update(self.extra)
+        return out
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_dict(json.loads(Path(path).read_text(encoding='utf8')))
+
+    def save(self, path):
+        # pipeline_io pulls in gzip and tempfile; readers such as `validate` never need them
+        from pipeline_io import write_json
+        write_json(path, self.to_dict())
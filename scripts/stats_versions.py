@@ -0,0 +1,145 @@
+"""Version stamps and delta patches for `data/stats.json`.
+
+Usage:
+  python scripts/stats_versions.py [--keep 5]
+
+Each published build gets an increasing integer `version` (stored in
+`stats.json` itself) unless its content is identical to the last one. For
+the previous `--keep` versions a JSON-Patch style list of operations
+(`add` / `remove` / `replace` with JSON Pointer paths) is written to
+`data/patches/{from}-{to}.json`, and `data/stats-version.json` tells clients
+which patches exist:
+
+  {"version": 12, "hash": "...", "patches": {"11": "data/patches/11-12.json", ...}}
+
+`js/app.js` keeps the last stats object in localStorage; with this manifest
+it fetches a patch of a few hundred bytes when its cached version is known,
+and only falls back to the full file for cold or too-old caches.
+
+Old full builds are kept gzip-compressed in `data/versions/` so the next
+build can be diffed against them; anything older than `--keep` is removed.
+"""
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from pipeline_io import atomic_write_text, cache_exists, cache_file, read_cached_json, write_cache_stream, write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+STATS = DATA / 'stats.json'
+MANIFEST = DATA / 'stats-version.json'
+PATCH_DIR = DATA / 'patches'
+VERSION_DIR = DATA / 'versions'
+KEEP = 5
+
+def _escape(key):
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+def _unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+def diff(a, b, path='', ops=None):
+    """Operations turning `a` into `b`, from one walk over both trees.
+
+    Dicts are compared key by key and lists of equal length element by
+    element; anything else that differs (including a change of type or of
+    list length) is a single `replace` of that node.
+    """
+    if ops is None:
+        ops = []
+    if type(a) is dict and type(b) is dict:
+        for k, v in a.items():
+            p = f'{path}/{_escape(k)}'
+            if k in b:
+                diff(v, b[k], p, ops)
+            else:
+                ops.append({'op': 'remove', 'path': p})
+        for k, v in b.items():
+            if k not in a:
+                ops.append({'op': 'add', 'path': f'{path}/{_escape(k)}', 'value': v})
+    elif type(a) is list and type(b) is list and len(a) == len(b):
+        for i, (x, y) in enumerate(zip(a, b)):
+            diff(x, y, f'{path}/{i}', ops)
+    elif type(a) is not type(b) or a != b:
+        ops.append({'op': 'replace', 'path': path, 'value': b})
+    return ops
+
+def apply_patch(doc, ops):
+    """Apply `diff` output to `doc` in place; returns the (possibly new) root."""
+    for op in ops:
+        tokens = [_unescape(t) for t in op['path'].split('/')[1:]]
+        if not tokens:
+            doc = op.get('value')
+            continue
+        parent = doc
+        for t in tokens[:-1]:
+            parent = parent[int(t)] if type(parent) is list else parent[t]
+        last = int(tokens[-1]) if type(parent) is list else tokens[-1]
+        if op['op'] == 'remove':
+            del parent[last]
+        else:
+            parent[last] = op['value']
+    return doc
+
+def content_hash(stats):
+    body = {k: v for k, v in stats.items() if k != 'version'}
+    return hashlib.sha256(json.dumps(body, sort_keys=True, ensure_ascii=False).encode('utf8')).hexdigest()[:16]
+
+def snapshot_path(version):
+    return VERSION_DIR / f'stats-{version}.json'
+
+def publish(stats_path=STATS, keep=KEEP):
+    """Stamp `stats_path` with a new version and write patches; returns the version."""
+    stats = json.loads(Path(stats_path).read_text(encoding='utf8'))
+    try:
+        manifest = json.loads(MANIFEST.read_text(encoding='utf8'))
+    except (OSError, ValueError):
+        manifest = {}
+    h = content_hash(stats)
+    current = manifest.get('version', 0)
+    if manifest.get('hash') == h:
+        if stats.get('version') != current:
+            stats['version'] = current
+            write_json(stats_path, stats)
+        print('Stats unchanged; still version', current)
+        return current
+
+    version = current + 1
+    stats['version'] = version
+    write_json(stats_path, stats)
+    write_cache_stream(snapshot_path(version), [json.dumps(stats, ensure_ascii=False).encode('utf8')], collect=False)
+
+    PATCH_DIR.mkdir(parents=True, exist_ok=True)
+    patches = {}
+    for old in range(max(1, version - keep), version):
+        if not cache_exists(snapshot_path(old)):
+            continue
+        ops = diff(read_cached_json(snapshot_path(old)), stats)
+        name = f'{old}-{version}.json'
+        atomic_write_text(PATCH_DIR / name, json.dumps(ops, ensure_ascii=False, separators=(',', ':')))
+        patches[str(old)] = f'data/patches/{name}'
+        print(f'Patch {old} -> {version}: {len(ops)} ops, {(PATCH_DIR / name).stat().st_size} bytes')
+
+    # drop snapshots and patches that no client can use any more
+    for p in VERSION_DIR.glob('stats-*.json.gz'):
+        if int(p.name.split('-')[1].split('.')[0]) <= version - keep:
+            p.unlink()
+    for p in PATCH_DIR.glob('*.json'):
+        if f'data/patches/{p.name}' not in patches.values():
+            p.unlink()
+
+    write_json(MANIFEST, {'version': version, 'hash': h, 'patches': patches})
+    print('Published stats version', version, '->', cache_file(snapshot_path(version)).name)
+    return version
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Version stats.json and write delta patches')
+    ap.add_argument('--keep', type=int, default=KEEP, help='previous versions to keep patches from')
+    ap.add_argument('--stats', default=str(STATS))
+    args = ap.parse_args(argv)
+    publish(args.stats, keep=args.keep)
+
+if __name__ == '__main__':
+    main()
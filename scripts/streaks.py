@@ -0,0 +1,234 @@
+"""Race-sequence streaks for drivers and constructors.
+
+Built from the per-race rows in the cached season results
+(`data/ergast/ergast_{season}_results.json[.gz]`, written by
+`fetch_stats_ergast.py`). Each entity's races are laid out chronologically as
+two compact arrays: race keys (`season * 100 + round`, `array('I')`) and one
+flag byte per race (`array('B')`) with a bit per streak type:
+
+  wins      won the race
+  podiums   finished in the top 3
+  points    scored points
+  finishes  was classified (no DNF); for a constructor: no car retired
+
+Full builds run-length encode each flag over the sequence, one linear pass
+per entity. The resulting `Streak` states (current run, best run and its
+bounds) are saved to `data/ergast/streaks.state.json`, so after a new round
+`update` only pushes that round's rows into the affected runs.
+"""
+import json
+from array import array
+from pathlib import Path
+
+from pipeline_io import cache_exists, read_cached_json, slug_of, write_json
+
+ROOT = Path(__file__).resolve().parents[1]
+ERGAST_DIR = ROOT / 'data' / 'ergast'
+STATE_FILE = ERGAST_DIR / 'streaks.state.json'
+
+STREAK_TYPES = ('wins', 'podiums', 'points', 'finishes')
+BITS = {t: 1 << i for i, t in enumerate(STREAK_TYPES)}
+
+def _classified(row):
+    status = row.get('status') or ''
+    return status == 'Finished' or status.startswith('+')
+
+def race_flags(row):
+    try:
+        pos = int(row.get('position') or 0)
+    except ValueError:
+        pos = 0
+    flags = 0
+    if pos == 1:
+        flags |= BITS['wins']
+    if 1 <= pos <= 3:
+        flags |= BITS['podiums']
+    if float(row.get('points') or 0) > 0:
+        flags |= BITS['points']
+    if _classified(row):
+        flags |= BITS['finishes']
+    return flags
+
+def season_races(payload):
+    """Yield `(race_key, driver_flags, team_flags)` for every race in a results payload.
+
+    Team flags OR the wins/podiums/points bits of their cars and keep
+    `finishes` only when every car was classified.
+    """
+    for race in payload.get('MRData', {}).get('RaceTable', {}).get('Races', []):
+        key = int(race.get('season')) * 100 + int(race.get('round'))
+        drivers, teams = {}, {}
+        for row in race.get('Results', []):
+            f = race_flags(row)
+            d = slug_of((row.get('Driver') or {}).get('driverId'))
+            c = slug_of((row.get('Constructor') or {}).get('constructorId'))
+            if d:
+                drivers[d] = f
+            if c:
+                prev = teams.get(c)
+                if prev is None:
+                    teams[c] = f
+                else:
+                    fin = prev & f & BITS['finishes']
+                    teams[c] = ((prev | f) & ~BITS['finishes']) | fin
+        yield key, drivers, teams
+
+class Streak:
+    """Current and best run of one flag for one entity."""
+    __slots__ = ('cur', 'cur_from', 'best', 'best_from', 'best_to', 'last')
+
+    def __init__(self, cur=0, cur_from=0, best=0, best_from=0, best_to=0, last=0):
+        self.cur, self.cur_from = cur, cur_from
+        self.best, self.best_from, self.best_to = best, best_from, best_to
+        self.last = last
+
+    def push(self, hit, key):
+        if hit:
+            if not self.cur:
+                self.cur_from = key
+            self.cur += 1
+            if self.cur > self.best:
+                self.best, self.best_from, self.best_to = self.cur, self.cur_from, key
+        else:
+            self.cur = self.cur_from = 0
+        self.last = key
+
+    def to_list(self):
+        return [self.cur, self.cur_from, self.best, self.best_from, self.best_to, self.last]
+
+    def to_record(self):
+        return {'current': self.cur, 'best': self.best,
+                'bestFrom': _race_label(self.best_from), 'bestTo': _race_label(self.best_to)}
+
+def _race_label(key):
+    return f'{key // 100}-{key % 100}' if key else None
+
+def runs(keys, flags, bit):
+    """Run-length encode one flag bit: list of `(hit, length, first_key, last_key)`."""
+    out = []
+    for k, f in zip(keys, flags):
+        hit = bool(f & bit)
+        if out and out[-1][0] == hit:
+            h, n, first, _ = out[-1]
+            out[-1] = (h, n + 1, first, k)
+        else:
+            out.append((hit, 1, k, k))
+    return out
+
+def streaks_from_sequence(keys, flags):
+    """Streak state per type from one entity's chronological race arrays."""
+    result = {}
+    for t in STREAK_TYPES:
+        s = Streak(last=keys[-1] if keys else 0)
+        enc = runs(keys, flags, BITS[t])
+        for hit, n, first, last in enc:
+            if hit and n > s.best:
+                s.best, s.best_from, s.best_to = n, first, last
+        if enc and enc[-1][0]:
+            s.cur, s.cur_from = enc[-1][1], enc[-1][2]
+        result[t] = s
+    return result
+
+def load_payloads(seasons, ergast_dir=ERGAST_DIR):
+    for s in seasons:
+        path = ergast_dir / f'ergast_{s}_results.json'
+        if cache_exists(path):
+            yield read_cached_json(path)
+
+def sequences(payloads):
+    """Chronological `(keys, flags)` arrays per driver and per team."""
+    drivers, teams = {}, {}
+    races = []
+    for payload in payloads:
+        races.extend(season_races(payload))
+    races.sort(key=lambda r: r[0])
+    for key, dflags, tflags in races:
+        for target, src in ((drivers, dflags), (teams, tflags)):
+            for slug, f in src.items():
+                seq = target.get(slug)
+                if seq is None:
+                    seq = target[slug] = (array('I'), array('B'))
+                seq[0].append(key)
+                seq[1].append(f)
+    return drivers, teams
+
+class StreakBook:
+    """Streak states for all drivers and teams plus the last race folded in."""
+
+    def __init__(self):
+        self.drivers = {}
+        self.teams = {}
+        self.last_race = 0
+
+    @classmethod
+    def build(cls, payloads):
+        """Full rebuild: RLE over every entity's race sequence."""
+        book = cls()
+        drivers, teams = sequences(payloads)
+        for target, seqs in ((book.drivers, drivers), (book.teams, teams)):
+            for slug, (keys, flags) in seqs.items():
+                target[slug] = streaks_from_sequence(keys, flags)
+                book.last_race = max(book.last_race, keys[-1])
+        return book
+
+    def update(self, payloads):
+        """Fold in only races newer than `last_race`; returns how many were added."""
+        added = 0
+        new = sorted((r for p in payloads for r in season_races(p) if r[0] > self.last_race), key=lambda r: r[0])
+        for key, dflags, tflags in new:
+            for target, src in ((self.drivers, dflags), (self.teams, tflags)):
+                for slug, f in src.items():
+                    st = target.get(slug)
+                    if st is None:
+                        st = target[slug] = {t: Streak() for t in STREAK_TYPES}
+                    for t in STREAK_TYPES:
+                        st[t].push(f & BITS[t], key)
+            self.last_race = key
+            added += 1
+        return added
+
+    def records(self, top=10):
+        """The `records` section: per-entity streaks plus best-streak leaderboards."""
+        out = {'lastRace': _race_label(self.last_race), 'drivers': {}, 'teams': {}, 'leaders': {}}
+        for kind in ('drivers', 'teams'):
+            entities = getattr(self, kind)
+            out[kind] = {slug: {t: st[t].to_record() for t in STREAK_TYPES} for slug, st in entities.items()}
+            leaders = out['leaders'][kind] = {}
+            for t in STREAK_TYPES:
+                ranked = sorted(entities.items(), key=lambda kv: (-kv[1][t].best, kv[0]))[:top]
+                leaders[t] = [{'slug': slug, **st[t].to_record()} for slug, st in ranked if st[t].best]
+        return out
+
+    def to_dict(self):
+        return {'lastRace': self.last_race,
+                'drivers': {k: {t: s.to_list() for t, s in v.items()} for k, v in self.drivers.items()},
+                'teams': {k: {t: s.to_list() for t, s in v.items()} for k, v in self.teams.items()}}
+
+    @classmethod
+    def from_dict(cls, d):
+        book = cls()
+        book.last_race = d.get('lastRace', 0)
+        book.drivers = {k: {t: Streak(*s) for t, s in v.items()} for k, v in d.get('drivers', {}).items()}
+        book.teams = {k: {t: Streak(*s) for t, s in v.items()} for k, v in d.get('teams', {}).items()}
+        return book
+
+def compute(seasons, full=False, state_file=STATE_FILE, ergast_dir=ERGAST_DIR):
+    """Streak records for `seasons`, incremental from the saved state when possible.
+
+    Returns None when no cached season results are available.
+    """
+    seasons = sorted(int(s) for s in seasons)
+    book = None
+    if not full and Path(state_file).exists():
+        book = StreakBook.from_dict(json.loads(Path(state_file).read_text(encoding='utf8')))
+        # only seasons at or after the last folded-in race can hold new rounds
+        recent = [s for s in seasons if s >= book.last_race // 100]
+        added = book.update(load_payloads(recent, ergast_dir))
+        print('Streaks: folded in', added, 'new races')
+    if book is None:
+        book = StreakBook.build(load_payloads(seasons, ergast_dir))
+        print('Streaks: rebuilt from', len(seasons), 'seasons')
+    if not book.last_race:
+        return None
+    write_json(state_file, book.to_dict())
+    return book.records()
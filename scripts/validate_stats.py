@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Check `data/stats.json` against the 2026 entry list.
+
+Usage: python scripts/validate_stats.py
+
+Writes `data/stats-validation-report.json`: entry drivers missing from the
+stats, stats drivers not on the entry list, and drivers whose `allTime`,
+`bySeason` or per-season `points` / `team` fields are missing.
+"""
+import json
+from pathlib import Path
+
+from stats_model import StatsModel
+
+root = Path(__file__).resolve().parent.parent
+entries_path = root / 'data' / 'entries-2026.json'
+stats_path = root / 'data' / 'stats.json'
+out_path = root / 'data' / 'stats-validation-report.json'
+
+def slugify(name):
+    return ''.join(c.lower() if c.isalnum() else '-' for c in (name or '')).strip('-')
+
+def load(p):
+    try:
+        return json.loads(p.read_text(encoding='utf8'))
+    except Exception as e:
+        print('Failed to read', p, e)
+        raise
+
+def validate(entries, stats):
+    """Report dict for an entry list and a `StatsModel`."""
+    report = {'missingInStats':[], 'missingInEntries':[], 'driversWithMissingFields':[], 'summary':{'entriesDrivers':0,'statsDrivers':0}}
+
+    entry_drivers = []
+    for team in entries.get('teams',[]):
+        for d in team.get('drivers',[]):
+            s = d.get('slug') or slugify(d.get('name'))
+            t = team.get('slug') or slugify(team.get('name'))
+            entry_drivers.append({'name': d.get('name'), 'slug': s, 'team': t})
+
+    report['summary']['entriesDrivers'] = len(entry_drivers)
+
+    stats_drivers = list(stats.drivers.keys())
+    report['summary']['statsDrivers'] = len(stats_drivers)
+
+    for ed in entry_drivers:
+        if ed['slug'] not in stats.drivers:
+            report['missingInStats'].append(ed)
+
+    entry_slugs = {ed['slug'] for ed in entry_drivers}
+    for sd in stats_drivers:
+        if sd not in entry_slugs:
+            report['missingInEntries'].append({'slug': sd})
+
+    for slug, d in stats.drivers.items():
+        missing = []
+        if d.all_time is None:
+            missing.append('allTime')
+        if not d.has_by_season:
+            missing.append('bySeason')
+        seasons_missing = []
+        for y, sd in d.items():
+            miss = []
+            if sd.points is None:
+                miss.append('points')
+            if sd.team is None:
+                miss.append('team')
+            if miss:
+                seasons_missing.append({'season': str(y), 'missing': miss})
+        for s, sd in (d.other or {}).items():
+            miss = [f for f in ('points', 'team') if sd.get(f) is None]
+            if miss:
+                seasons_missing.append({'season': s, 'missing': miss})
+        if missing or seasons_missing:
+            report['driversWithMissingFields'].append({'slug': slug, 'missing': missing, 'seasonsMissing': seasons_missing})
+    return report
+
+def main():
+    report = validate(load(entries_path), StatsModel.from_dict(load(stats_path)))
+    out_path.write_text(json.dumps(report, indent=2), encoding='utf8')
+    print('Validation complete. Report written to', out_path)
+    return report
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Race-weekend watcher: refresh stats only after a race has results.
+
+Reads `data/calendar-2026.json`, sleeps until each race day is over and then
+polls the season's `last/results` endpoint with conditional requests
+(ETag / Last-Modified) until the new round shows up. Only that season is then
+re-aggregated (`fetch_stats_ergast.update_seasons`) and the usual fix,
+validate and merge steps run on the regenerated file. A round only counts
+as processed once the season results the refresh aggregated reach the round
+that `last/results` reported; the last processed round is kept in
+`data/watch-state.json` so a restarted watcher picks up where it left off.
+
+Usage:
+  python scripts/watch_race_weekends.py [--once] [--interval 300]
+
+Requires: requests
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from ergast_source import default_source
+from fetch_stats_ergast import ERGAST_DIR, STATS_OUT, safe_get, update_seasons
+from pipeline_io import atomic_open, cache_exists, read_cached_json
+from run_fetch_and_merge import post_process
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = ROOT / 'data'
+CALENDAR = DATA / 'calendar-2026.json'
+STATE = DATA / 'watch-state.json'
+
+def load_calendar():
+    cal = json.loads(CALENDAR.read_text(encoding='utf8'))
+    races = sorted(cal.get('races', []), key=lambda r: int(r.get('round', 0)))
+    return int(cal.get('season')), races
+
+def load_state(season):
+    if STATE.exists():
+        st = json.loads(STATE.read_text(encoding='utf8'))
+        if st.get('season') == season:
+            return st
+    return {'season': season, 'round': 0, 'missed': []}
+
+def save_state(st):
+    with atomic_open(STATE, 'w') as f:
+        json.dump(st, f, indent=2)
+
+def fetched_round(season, ergast_dir=ERGAST_DIR):
+    """Highest Ergast round in the cached `season` results the refresh aggregated (0 if none).
+
+    Compared with the round `last/results` reported, so a cancelled round or
+    one that some drivers missed cannot keep a round pending.
+    """
+    path = Path(ergast_dir) / f'ergast_{season}_results.json'
+    if not cache_exists(path):
+        return 0
+    races = safe_get(read_cached_json(path), 'MRData', 'RaceTable', 'Races', default=[]) or []
+    return max((int(r.get('round') or 0) for r in races), default=0)
+
+def ready_at(race, after_hours):
+    """Moment (UTC) from which results for `race` are worth polling for."""
+    day = datetime.strptime(race['date'], '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    return day + timedelta(hours=after_hours)
+
+def next_target(races, st, now, after_hours):
+    """Pick the race to wait for next.
+
+    The most recent race that is already over wins, since refreshing its
+    season also covers any earlier rounds we slept through; otherwise the next
+    upcoming race.
+    """
+    pending = [r for r in races if int(r['round']) > st.get('round', 0)]
+    if not pending:
+        return None
+    past = [r for r in pending if ready_at(r, after_hours) <= now]
+    return past[-1] if past else pending[0]
+
+def poll_round(season, rnd, interval, deadline, date=None):
+    """Poll `{season}/last/results` until round `rnd` (or later) is published.
+
+    With `date` (the calendar race date) a race held on or after that day also
+    counts, so a calendar whose numbering differs from Ergast's after a
+    cancellation does not stall the watcher.
+
+    Uses conditional requests so unchanged responses cost a 304 and no body.
+    Validators are kept per mirror, since ETags differ between hosts.
+    Returns the Ergast round reported once it is `rnd` or later, None when
+    `deadline` passes.
+    """
+    path = f'{season}/last/results.json'
+    source = default_source()
+    validators = {}
+    while datetime.now(timezone.utc) < deadline:
+        try:
+            # validators go only to the mirror that issued them, and are stored under
+            # the mirror that answered (hedging may pick another one than best())
+            mirror, status, resp_headers, body = source.request(path, per_mirror=validators)
+            if status == 304:
+                print('No change for', path, 'on', mirror.base)
+            else:
+                headers = validators.setdefault(mirror.base, {})
+                if resp_headers.get('ETag'):
+                    headers['If-None-Match'] = resp_headers['ETag']
+                if resp_headers.get('Last-Modified'):
+                    headers['If-Modified-Since'] = resp_headers['Last-Modified']
+                table = safe_get(json.loads(body), 'MRData', 'RaceTable', default={}) or {}
+                latest = table.get('round')
+                held = max((r.get('date') or '' for r in table.get('Races') or []), default='')
+                print('Latest round with results:', latest)
+                if latest and (int(latest) >= rnd or (date and held >= date)):
+                    return int(latest)
+        except Exception as e:
+            print('Poll failed for', path, e)
+        time.sleep(interval)
+    return None
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--interval', type=int, default=300, help='seconds between polls (default 300)')
+    ap.add_argument('--after-hours', type=int, default=18, help='hours after race-day midnight UTC before polling starts (default 18)')
+    ap.add_argument('--max-wait-hours', type=int, default=72, help='give up on a round after this many hours of polling (default 72)')
+    ap.add_argument('--once', action='store_true', help='handle a single race and exit')
+    args = ap.parse_args(argv)
+
+    season, races = load_calendar()
+    st = load_state(season)
+
+    while True:
+        now = datetime.now(timezone.utc)
+        race = next_target(races, st, now, args.after_hours)
+        if race is None:
+            print('No remaining races in', CALENDAR.name)
+            return
+        rnd = int(race['round'])
+        start = ready_at(race, args.after_hours)
+        if start > now:
+            print(f'Sleeping until {start.isoformat()} for round {rnd} ({race.get("name")})')
+            time.sleep((start - now).total_seconds())
+
+        deadline = start + timedelta(hours=args.max_wait_hours)
+        latest = poll_round(season, rnd, args.interval, deadline, race.get('date'))
+        if latest is not None:
+            update_seasons([season])
+            if fetched_round(season) < latest:
+                # keep the round pending; the next pass polls again until the deadline
+                print('Refreshed results stop before round', latest, '- retrying')
+                time.sleep(args.interval)
+                continue
+            post_process(STATS_OUT)
+            st['round'] = rnd
+            print('Published results for round', rnd)
+        else:
+            print('Giving up on round', rnd, 'after', args.max_wait_hours, 'hours')
+            st['round'] = rnd
+            st.setdefault('missed', []).append(rnd)
+        save_state(st)
+
+        if args.once:
+            return
+
+if __name__ == '__main__':
+    main()
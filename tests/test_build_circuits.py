@@ -0,0 +1,65 @@
+import json
+
+import build_circuits
+from pipeline_io import write_json
+
+CIRCUITS = {
+    'red_bull_ring': ('Red Bull Ring', 'Spielberg', 'Austria'),
+    'losail': ('Losail International Circuit', 'Al Daayen', 'Qatar'),
+    'monza': ('Autodromo Nazionale di Monza', 'Monza', 'Italy'),
+}
+
+def race(season, rnd, cid, key, rows):
+    name, locality, country = CIRCUITS[cid]
+    return {'season': str(season), 'round': str(rnd), 'raceName': f'{country} Grand Prix', 'date': f'{season}-07-01',
+            'Circuit': {'circuitId': cid, 'circuitName': name, 'Location': {'locality': locality, 'country': country}},
+            key: [{'position': str(i + 1), 'positionText': text, 'points': str(points),
+                   'Driver': {'driverId': d}, 'Constructor': {'constructorId': c}}
+                  for i, (d, c, text, points) in enumerate(rows)]}
+
+def cache(ergast_dir, season, name, races):
+    write_json(ergast_dir / f'ergast_{season}_{name}.json', {'MRData': {'RaceTable': {'Races': races}}})
+
+CALENDAR = {'season': 2026, 'races': [
+    {'round': 1, 'name': 'Austrian Grand Prix', 'circuit': 'Red Bull Ring', 'city': 'Spielberg', 'country': 'Austria'},
+    # no shared words: only the country ties Lusail to Ergast's Losail
+    {'round': 2, 'name': 'Qatar Grand Prix', 'circuit': 'Lusail International Circuit', 'city': 'Lusail',
+     'country': 'Qatar'},
+    {'round': 3, 'name': 'Italian Grand Prix', 'circuit': 'Monza Circuit', 'city': 'Milan', 'country': 'Italy',
+     'circuitId': 'monza'},
+    {'round': 4, 'name': 'Spanish Grand Prix', 'circuit': 'Madring', 'city': 'Madrid', 'country': 'Spain'},
+]}
+
+def test_calendar_join_and_circuit_history(tmp_path):
+    ergast, out = tmp_path / 'ergast', tmp_path / 'circuits'
+    cache(ergast, 2024, 'results', [
+        race(2024, 11, 'red_bull_ring', 'Results', [('russell', 'mercedes', '1', 25), ('piastri', 'mclaren', '2', 18),
+                                                     ('sainz', 'ferrari', '3', 15), ('max_verstappen', 'red_bull', 'R', 0)]),
+        race(2024, 23, 'losail', 'Results', [('max_verstappen', 'red_bull', '1', 25), ('leclerc', 'ferrari', '2', 18)])])
+    cache(ergast, 2024, 'qualifying', [race(2024, 11, 'red_bull_ring', 'QualifyingResults',
+                                            [('max_verstappen', 'red_bull', '1', 0)])])
+    cache(ergast, 2025, 'results', [
+        race(2025, 11, 'red_bull_ring', 'Results', [('max_verstappen', 'red_bull', '1', 25),
+                                                     ('russell', 'mercedes', '2', 18)])])
+    calendar = tmp_path / 'calendar.json'
+    calendar.write_text(json.dumps(CALENDAR), encoding='utf8')
+
+    index = build_circuits.build(calendar=calendar, out_dir=out, ergast_dir=ergast)
+    assert [(r['round'], r['id'], r['matched']) for r in index['rounds']] == [
+        (1, 'red-bull-ring', True), (2, 'losail', True), (3, 'monza', False), (4, 'madring', False)]
+
+    ring = json.loads((out / 'red-bull-ring.json').read_text(encoding='utf8'))
+    assert ring['calendarRounds'] == [1]
+    assert [(r['season'], r['winner'], r['pole']) for r in ring['races']] == [(2024, 'russell', 'max-verstappen'),
+                                                                             (2025, 'max-verstappen', None)]
+    # a retirement is a start but not a finish
+    assert ring['drivers']['max-verstappen'] == {'starts': 2, 'wins': 1, 'podiums': 1, 'poles': 1,
+                                                 'points': 25, 'bestFinish': 1}
+    assert ring['drivers']['russell']['points'] == 43
+    assert [r['slug'] for r in ring['topDrivers']] == ['russell', 'max-verstappen', 'piastri', 'sainz']
+    assert ring['constructors']['red-bull'] == {'starts': 2, 'wins': 1, 'podiums': 1, 'poles': 1}
+
+    # a new venue still gets a shard, with empty history
+    madring = json.loads((out / 'madring.json').read_text(encoding='utf8'))
+    assert madring['calendarRounds'] == [4] and madring['races'] == [] and madring['circuit'] == {}
+    assert json.loads((out / 'losail.json').read_text(encoding='utf8'))['calendarRounds'] == [2]
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+import build_pages
+import f1stats
+
+STATS = {
+    'seasons': [2025, 2026],
+    'driverStats': {
+        'ann-smith': {'bySeason': {'2025': {'team': 'Haas F1 Team', 'points': 12, 'wins': 0, 'position': 8},
+                                   '2026': {'team': 'Haas F1 Team', 'points': 30, 'wins': 1, 'position': 3}}},
+        'old-timer': {'bySeason': {'2025': {'team': 'Haas F1 Team', 'points': 2, 'position': 18}}},
+    },
+    'teamStats': {'haas': {'bySeason': {'2025': {'points': 14}, '2026': {'points': 30, 'wins': 1}},
+                           'allTime': {'points': 44, 'wins': 1}}},
+}
+ENTRIES = {'teams': [{'name': 'Haas <F1>', 'slug': 'haas', 'country': 'USA',
+                      'drivers': [{'name': 'Ann Smith', 'slug': 'ann-smith', 'number': 7}]}]}
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    entries = tmp_path / 'entries.json'
+    entries.write_text(json.dumps(ENTRIES), encoding='utf8')
+    monkeypatch.setattr(build_pages, 'ROOT', tmp_path)
+    monkeypatch.setattr(build_pages, 'ENTRIES', entries)
+    monkeypatch.setattr(f1stats, 'ENTRIES', entries)
+    stats = tmp_path / 'stats.json'
+    stats.write_text(json.dumps(STATS), encoding='utf8')
+    return tmp_path
+
+def build(site, **kw):
+    return build_pages.build(jobs=1, stats=site / 'stats.json', manifest=site / 'manifest.json', **kw)
+
+def test_pages_are_prerendered(site):
+    assert build(site) == (3, 0)
+    team = (site / 'teams/haas/index.html').read_text(encoding='utf8')
+    assert 'Haas &lt;F1&gt;' in team
+    assert 'href="teams/haas/drivers/ann-smith.html"' in team
+    assert 'F1 2026 — 30 punten, 1 overwinningen' in team
+    # the retired driver gets a page under the team of their last season
+    driver = (site / 'teams/haas/drivers/old-timer.html').read_text(encoding='utf8')
+    assert '<td>2025</td><td>Haas F1 Team</td><td>18</td><td>2</td>' in driver
+    assert 'Nummer: 7' in (site / 'teams/haas/drivers/ann-smith.html').read_text(encoding='utf8')
+
+def test_only_pages_with_changed_inputs_are_rendered(site, monkeypatch):
+    build(site)
+    assert build(site) == (0, 3)
+    changed = json.loads(json.dumps(STATS))
+    changed['driverStats']['old-timer']['bySeason']['2025']['points'] = 3
+    (site / 'stats.json').write_text(json.dumps(changed), encoding='utf8')
+    # the driver's own page plus the team page listing the season
+    assert build(site) == (2, 1)
+    (site / 'teams/haas/index.html').unlink()
+    assert build(site) == (1, 2)
+    assert build(site, force=True) == (3, 0)
+    monkeypatch.setattr(build_pages, 'RENDER_VERSION', build_pages.RENDER_VERSION + 1)
+    assert build(site) == (3, 0)
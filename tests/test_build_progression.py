@@ -0,0 +1,61 @@
+import json
+
+import build_progression
+from build_progression import Progression
+from pipeline_io import write_json
+
+def race(rnd, order, points=(25, 18, 15)):
+    return {'round': str(rnd), 'raceName': f'Round {rnd}', 'Results': [
+        {'position': str(i + 1), 'positionText': str(i + 1), 'points': str(points[i] if i < len(points) else 0),
+         'Driver': {'driverId': d}, 'Constructor': {'constructorId': t}}
+        for i, (d, t) in enumerate(order)]}
+
+def cache(ergast_dir, year, races, sprints=()):
+    write_json(ergast_dir / f'ergast_{year}_results.json', {'MRData': {'RaceTable': {'Races': races}}})
+    if sprints:
+        write_json(ergast_dir / f'ergast_{year}_sprint.json', {'MRData': {'RaceTable': {'Races': list(sprints)}}})
+
+A, B, C = ('alpha', 'red'), ('bravo', 'blue'), ('charlie', 'red')
+
+def test_ties_on_points_go_to_countback(tmp_path):
+    # alpha and bravo both end on 40; alpha's win beats bravo's two 2nd places
+    cache(tmp_path, 2024, [race(1, [A, B, C], (25, 15, 0)), race(2, [C, B, A], (0, 25, 15))])
+    build_progression.build([2024], out_dir=tmp_path / 'out', ergast_dir=tmp_path)
+    prog = Progression.load(2024, tmp_path / 'out')
+    assert prog.standings('driver', 0) == [(1, 'alpha', 25), (2, 'bravo', 15), (3, 'charlie', 0)]
+    assert prog.standings('driver') == [(1, 'alpha', 40), (2, 'bravo', 40), (3, 'charlie', 0)]
+    # both teams on 40 too: red has the two wins
+    assert prog.series('team', 'red') == ([25, 40], [1, 1])
+    assert prog.series('team', 'blue') == ([15, 40], [2, 2])
+
+def test_countback_compares_lower_places(tmp_path):
+    # equal points and wins; bravo has the better 2nd-place count
+    cache(tmp_path, 2024, [race(1, [A, B, C], (10, 5, 5)), race(2, [B, C, A], (10, 5, 0)),
+                           race(3, [C, B, A], (0, 0, 5))])
+    build_progression.build([2024], out_dir=tmp_path / 'out', ergast_dir=tmp_path)
+    final = Progression.load(2024, tmp_path / 'out').standings('driver')
+    assert [slug for _, slug, _ in final] == ['bravo', 'alpha', 'charlie']
+
+def test_sprint_points_count_in_their_round(tmp_path):
+    sprint = {'round': '1', 'SprintResults': [
+        {'position': '1', 'points': '8', 'Driver': {'driverId': 'charlie'}, 'Constructor': {'constructorId': 'red'}}]}
+    cache(tmp_path, 2024, [race(1, [A, B, C])], [sprint])
+    build_progression.build([2024], out_dir=tmp_path / 'out', ergast_dir=tmp_path)
+    prog = Progression.load(2024, tmp_path / 'out')
+    assert prog.header['rounds'][0]['sprint']
+    assert prog.series('driver', 'charlie') == ([23], [2])
+
+def test_format_bump_rebuilds_unchanged_seasons(tmp_path, monkeypatch):
+    cache(tmp_path, 2024, [race(1, [A, B, C])])
+    out = tmp_path / 'out'
+    build_progression.build([2024], out_dir=out, ergast_dir=tmp_path)
+    shard = out / '2024.bin'
+    shard.write_bytes(b'stale')
+    build_progression.build([2024], out_dir=out, ergast_dir=tmp_path)
+    assert shard.read_bytes() == b'stale'
+
+    monkeypatch.setattr(build_progression, 'FORMAT', build_progression.FORMAT + 1)
+    index = build_progression.build([2024], out_dir=out, ergast_dir=tmp_path)
+    assert index['format'] == build_progression.FORMAT
+    assert json.loads((out / 'index.json').read_text(encoding='utf8'))['format'] == build_progression.FORMAT
+    assert Progression.load(2024, out).rounds == [1]
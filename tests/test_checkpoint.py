@@ -0,0 +1,119 @@
+import json
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import fetch_stats_ergast as fse
+import pipeline_io
+from pipeline_io import Checkpoint, atomic_write_text, cache_exists
+
+ROWS = [(1, 'a'), (1, 'b'), (1, 'c'), (2, 'a'), (2, 'b')]
+
+class PagedSource:
+    """Serves ROWS as a paged 2026 results endpoint; `fail_at` offsets raise."""
+
+    def __init__(self, fail_at=()):
+        self.fail_at = set(fail_at)
+        self.offsets = []
+
+    def get_chunks(self, path):
+        q = parse_qs(urlsplit(path).query)
+        limit, offset = int(q['limit'][0]), int(q['offset'][0])
+        self.offsets.append(offset)
+        if offset in self.fail_at:
+            raise OSError('connection reset')
+        races = []
+        for rnd, driver in ROWS[offset:offset + limit]:
+            if not races or races[-1]['round'] != str(rnd):
+                races.append({'season': '2026', 'round': str(rnd), 'Results': []})
+            races[-1]['Results'].append({'Driver': {'driverId': driver}})
+        payload = {'MRData': {'total': str(len(ROWS)), 'limit': str(limit), 'offset': str(offset),
+                              'RaceTable': {'season': '2026', 'Races': races}}}
+        return [json.dumps(payload).encode('utf8')]
+
+@pytest.fixture
+def ergast(tmp_path, monkeypatch):
+    monkeypatch.setattr(fse, 'PAGES_DIR', tmp_path / 'pages')
+    monkeypatch.setattr(fse, 'PAGE_SIZE', 2)
+    monkeypatch.setattr(fse, 'OFFLINE', False)
+    monkeypatch.setattr(fse.time, 'sleep', lambda s: None)
+
+    def start(source, resume):
+        monkeypatch.setattr(fse, 'default_source', lambda: source)
+        monkeypatch.setattr(fse, 'CHECKPOINT', Checkpoint(tmp_path / '.checkpoint.jsonl', resume=resume))
+        return fse.CHECKPOINT
+    return start
+
+def test_journal_survives_torn_append(tmp_path):
+    path = tmp_path / '.checkpoint.jsonl'
+    cp = Checkpoint(path)
+    cp.mark('results', 2026, 0)
+    cp.mark('results', 2026, 0)
+    cp.mark('drivers', None)
+    with path.open('a', encoding='utf8') as f:
+        f.write('{"endpoint": "results", "sea')
+    assert len(path.read_text(encoding='utf8').splitlines()) == 3
+
+    resumed = Checkpoint(path, resume=True)
+    assert resumed.is_done('results', '2026', 0)
+    assert resumed.is_done('drivers', None)
+    assert not resumed.is_done('results', 2026, 1)
+
+    Checkpoint(path)
+    assert not path.exists()
+
+def test_concurrent_marks_are_journaled_once(tmp_path):
+    path = tmp_path / '.checkpoint.jsonl'
+    cp = Checkpoint(path)
+    units = [('results', 2000 + i % 25, i % 4) for i in range(400)]
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda u: cp.mark(*u), units))
+    lines = path.read_text(encoding='utf8').splitlines()
+    assert len(lines) == len(set(units)) == len(Checkpoint(path, resume=True).done)
+
+def test_atomic_writes_keep_readable_modes(tmp_path):
+    fresh = tmp_path / 'search-index.json'
+    atomic_write_text(fresh, '{}')
+    assert stat.S_IMODE(fresh.stat().st_mode) == 0o666 & ~pipeline_io._UMASK
+    kept = tmp_path / 'stats.json'
+    kept.write_text('{}')
+    kept.chmod(0o640)
+    atomic_write_text(kept, '[]')
+    assert stat.S_IMODE(kept.stat().st_mode) == 0o640 and kept.read_text() == '[]'
+
+def test_resume_refetches_only_missing_pages(tmp_path, ergast):
+    save = tmp_path / 'ergast_2026_results.json'
+    first = PagedSource(fail_at={4})
+    ergast(first, resume=False)
+    with pytest.raises(OSError):
+        fse.fetch_pages('2026/results.json', save, ('results', 2026))
+    assert first.offsets == [0, 2, 4, 4, 4]
+    assert not cache_exists(save)
+
+    second = PagedSource()
+    cp = ergast(second, resume=True)
+    assert cp.is_done('results', 2026, 0) and cp.is_done('results', 2026, 1)
+    payload = fse.fetch_pages('2026/results.json', save, ('results', 2026))
+    assert second.offsets == [4]
+    assert fse.count_rows(payload) == len(ROWS)
+    races = payload['MRData']['RaceTable']['Races']
+    assert [[r['Driver']['driverId'] for r in race['Results']] for race in races] == [['a', 'b', 'c'], ['a', 'b']]
+    assert cache_exists(save) and not any((tmp_path / 'pages').iterdir())
+
+    # a completed unit is served from the cache on the next resumed run
+    third = PagedSource()
+    ergast(third, resume=True)
+    assert fse.fetch_pages('2026/results.json', save, ('results', 2026)) == payload
+    assert third.offsets == []
+
+def test_short_pages_raise(tmp_path, ergast):
+    class Capped(PagedSource):
+        def get_chunks(self, path):
+            payload = json.loads(super().get_chunks(path)[0])
+            payload['MRData']['total'] = str(len(ROWS) + 1)
+            return [json.dumps(payload).encode('utf8')]
+    ergast(Capped(), resume=False)
+    with pytest.raises(fse.IncompletePayload):
+        fse.fetch_pages('2026/results.json', tmp_path / 'ergast_2026_results.json', ('results', 2026))
@@ -0,0 +1,20 @@
+from derived_metrics import derive
+from stats_model import EntityStats
+
+def entity(**seasons):
+    return EntityStats.from_dict({'bySeason': {y[1:]: rec for y, rec in seasons.items()}})
+
+def test_season_in_progress_counts_for_nothing_but_rates():
+    drivers = {'leader': entity(y2024={'position': 3, 'wins': 1, 'races': 24},
+                                y2025={'position': 2, 'races': 24},
+                                y2026={'position': 1, 'wins': 5, 'races': 10})}
+    d = derive(drivers, exclude={2026})['leader']
+    assert (d['championships'], d['runnerUps'], d['titleYears'], d['bestFinish']) == (0, 1, [], 2)
+    assert d['winRate'] == round(6 / 58, 4)
+
+    d = derive(drivers)['leader']
+    assert (d['championships'], d['titleYears'], d['bestFinish']) == (1, [2026], 1)
+
+def test_no_positions_and_no_starts():
+    d = derive({'tester': entity(y2025={'points': 0})})['tester']
+    assert d == {'championships': 0, 'runnerUps': 0, 'titleYears': [], 'bestFinish': None}
@@ -0,0 +1,104 @@
+import pytest
+
+from ergast_source import ErgastSource
+
+A, B = 'http://a.invalid/api/f1', 'http://b.invalid/api/f1'
+
+def transport_with(down=(), seen=None):
+    def transport(url, timeout, headers):
+        if seen is not None:
+            seen.append((url, dict(headers)))
+        if url.startswith(tuple(down)):
+            raise OSError(f'{url}: connection refused')
+        return 200, {}, b'{}'
+    return transport
+
+def test_failed_mirror_ranks_last():
+    src = ErgastSource([A, B], transport=transport_with(down=[A]), hedge=False, bench_after=99)
+    with pytest.raises(OSError):
+        src.request('2026.json')
+    assert [m.base for m in src.ranked()] == [B, A]
+
+    mirror, status, _, body = src.request('2026.json')
+    assert (mirror.base, status, body) == (B, 200, b'{}')
+    assert [m.base for m in src.ranked()] == [B, A]
+    assert src.mirrors[0].score() > src.mirrors[1].score() > 0
+
+def test_benched_mirror_is_skipped():
+    src = ErgastSource([A, B], transport=transport_with(down=[A]), hedge=False, bench_after=1, cooldown=60)
+    with pytest.raises(OSError):
+        src.request('2026.json')
+    assert [m.base for m in src.ranked()] == [B]
+
+def test_hedge_returns_the_mirror_that_answered():
+    src = ErgastSource([A, B], transport=transport_with(down=[A]), hedge_floor=0.01)
+    mirror, status, _, _ = src.request('2026.json')
+    assert (mirror.base, status) == (B, 200)
+
+def test_validators_go_only_to_their_mirror():
+    seen = []
+    src = ErgastSource([A, B], transport=transport_with(down=[A], seen=seen), hedge_floor=0.01)
+    src.request('current/last/results.json', per_mirror={A: {'If-None-Match': '"a1"'}, B: {'If-None-Match': '"b7"'}})
+    sent = {url.split('/api')[0]: h.get('If-None-Match') for url, h in seen}
+    assert sent == {'http://a.invalid': '"a1"', 'http://b.invalid': '"b7"'}
+
+class Body:
+    """Chunk iterator that can fail after `fail_after` chunks and records whether it was closed."""
+
+    def __init__(self, chunks, fail_after=None):
+        self.chunks, self.fail_after = chunks, fail_after
+        self.closed = False
+
+    def __iter__(self):
+        for i, c in enumerate(self.chunks):
+            if i == self.fail_after:
+                raise OSError('connection reset mid-body')
+            yield c
+
+    def close(self):
+        self.closed = True
+
+def test_failure_mid_body_is_charged_to_the_mirror():
+    src = ErgastSource([A, B], transport=lambda url, t, h: (200, {}, Body([b'{', b'}'], fail_after=1)),
+                       hedge=False, bench_after=2)
+    for _ in range(2):
+        body = src.get_chunks('2026/results.json')
+        with pytest.raises(OSError):
+            b''.join(body)
+    # the first failure already ranks A behind the untried B
+    assert [list(m.outcomes) for m in src.mirrors] == [[False], [False]]
+    body = src.get_chunks('2026/results.json')
+    with pytest.raises(OSError):
+        b''.join(body)
+    assert src.mirrors[0].consecutive_errors == 2
+    assert [m.base for m in src.ranked()] == [B]
+
+def test_drained_body_records_one_success():
+    bodies = []
+
+    def transport(url, timeout, headers):
+        bodies.append(Body([b'{', b'}']))
+        return 200, {}, bodies[-1]
+    src = ErgastSource([A], transport=transport)
+    assert b''.join(src.get_chunks('2026.json')) == b'{}'
+    assert src.get_bytes('2026.json') == b'{}'
+    assert list(src.mirrors[0].outcomes) == [True, True]
+    assert bodies[0].closed
+
+def test_hedge_loser_body_is_closed():
+    import threading
+    release = threading.Event()
+    bodies = {}
+
+    def transport(url, timeout, headers):
+        if url.startswith(A):
+            release.wait(5)
+        bodies[url[:10]] = Body([b'{}'])
+        return 200, {}, bodies[url[:10]]
+    src = ErgastSource([A, B], transport=transport, hedge_floor=0.01, default_hedge_after=0.01)
+    mirror, _, _, body = src.request('2026.json', stream=True)
+    assert mirror.base == B
+    release.set()
+    src._pool.shutdown(wait=True)
+    assert bodies[A[:10]].closed
+    assert b''.join(body) == b'{}' and bodies[B[:10]].closed
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+import f1data
+import run_fetch_and_merge as rfm
+
+def test_parse_years():
+    assert f1data.parse_years('2023-2021, 2019') == [2019, 2021, 2022, 2023]
+
+@pytest.mark.parametrize('argv', [
+    ['validate', '--years', '2020'],
+    ['fix', '--jobs', '4'],
+    ['serve', '--offline'],
+    ['build', 'search', '--jobs', '2'],
+    ['build', 'pages', '--since', '2024'],
+    ['build', 'stats', '--offline'],
+])
+def test_unused_shared_flags_are_rejected(argv):
+    with pytest.raises(SystemExit):
+        f1data.main(argv)
+
+def test_build_passes_flags_to_targets_that_use_them(monkeypatch):
+    import build_progression
+    calls = []
+    monkeypatch.setattr(build_progression, 'build', lambda seasons, force: calls.append((seasons, force)))
+    f1data.main(['build', 'progression', '--years', '2024-2025'])
+    assert calls == [([2024, 2025], False)]
+
+def test_stale_fixed_stats_are_regenerated(tmp_path, monkeypatch):
+    fixed, generated = tmp_path / 'stats.fixed.json', tmp_path / 'stats.generated.json'
+    fixed.write_text('{"old": true}', encoding='utf8')
+    generated.write_text('{"new": true}', encoding='utf8')
+    os.utime(fixed, ns=(1, 1))
+    monkeypatch.setattr(rfm, 'FIXED_OUT', fixed)
+    monkeypatch.setattr(rfm, 'ERGAST_OUT', generated)
+    ran, finalized = [], []
+
+    def run(cmd):
+        ran.append(cmd[1:])
+        fixed.write_text('{"new": true}', encoding='utf8')
+    monkeypatch.setattr(rfm, 'run', run)
+    monkeypatch.setattr(rfm, 'finalize', finalized.append)
+
+    rfm.merge_and_write()
+    assert ran == [['scripts/fix_stats.py', '--input', str(generated)]]
+    assert finalized == [{'new': True}]
+
+    rfm.merge_and_write()  # now up to date: no second fixer run
+    assert len(ran) == 1 and len(finalized) == 2
@@ -0,0 +1,72 @@
+import json
+import threading
+
+import pytest
+
+import f1stats
+
+def zero():
+    return {'team': None, 'points': 0, 'wins': 0, 'podiums': 0, 'poles': 0, 'fastestLaps': 0, 'position': None}
+
+def stats(**points):
+    return {
+        'seasons': [2024, 2025],
+        'driverStats': {
+            'rookie': {'bySeason': {'2024': zero(), '2025': {'team': 'Haas', 'points': 0, 'races': 3, 'position': 20}}},
+            'vet': {'bySeason': {'2024': {'team': 'Haas', 'points': points.get('vet', 10), 'wins': 1, 'position': 5},
+                                 '2025': {'team': 'Haas', 'points': 4, 'position': 12}}},
+            'mate': {'bySeason': {'2024': {'team': 'Haas', 'points': 10, 'position': 5},
+                                  '2025': {'team': 'Haas', 'points': 8, 'position': 9}}},
+            'reserve': {'bySeason': {'2024': zero(), '2025': zero()}},
+        },
+        'teamStats': {'haas': {'bySeason': {'2024': {'points': 20}, '2025': {'points': 12}}},
+                      'new-team': {'bySeason': {'2024': {'points': 0, 'wins': 0}}}},
+    }
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(f1stats, 'ENTRIES', tmp_path / 'missing.json')
+    path = tmp_path / 'stats.json'
+    path.write_text(json.dumps(stats()), encoding='utf8')
+    return f1stats.StatsDB(path)
+
+def test_filled_zero_seasons_are_not_participation(db):
+    assert db.debuts(2024) == ('mate', 'vet')
+    assert db.debuts(2025) == ('rookie',)
+    assert [slug for slug, _ in db.season_table(2024)] == ['mate', 'vet']
+    assert 'reserve' not in dict(db.rank('points', limit=0))
+    assert db.rank('points', kind='teams', limit=0) == (('haas', 32),)
+
+def test_rank_rejects_unknown_metric(db):
+    with pytest.raises(ValueError):
+        db.rank('titles')
+
+def test_head_to_head_ties_count_for_neither(db):
+    h2h = db.head_to_head('vet', 'mate')
+    assert h2h['aheadInStandings'] == {'vet': 0, 'mate': 1}
+    assert len(h2h['seasons']) == 2
+
+def test_reload_swaps_model_and_indexes_together(db):
+    stop = threading.Event()
+    seen = []
+
+    def reader():
+        while not stop.is_set():
+            view = db._view
+            seen.append(all(slug in view.model.drivers for slugs in view.by_season.values() for slug in slugs))
+
+    t = threading.Thread(target=reader)
+    t.start()
+    try:
+        for i in range(20):
+            data = stats(vet=i)
+            if i % 2:
+                del data['driverStats']['mate']
+            db.path.write_text(json.dumps(data), encoding='utf8')
+            db._stamp = None
+            db.refresh()
+            assert ('mate' in dict(db.rank('points', limit=0))) == (not i % 2)
+    finally:
+        stop.set()
+        t.join()
+    assert seen and all(seen)
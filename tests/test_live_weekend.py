@@ -0,0 +1,111 @@
+import asyncio
+import json
+import time
+from functools import partial
+
+import pytest
+
+import live_weekend as live_mod
+from ergast_source import ErgastSource, urllib_transport
+
+SEASON = '2026'
+
+@pytest.fixture
+def replay():
+    races, sprints, quals = live_mod.synthetic_season(SEASON, seed=3)
+    feed = live_mod.ReplayFeed(SEASON, races[:3], sprints, quals[:3])
+    base = feed.start(step=3600)
+    # round 1 is revealed straight away, then the replay sleeps; later rounds are revealed by hand
+    while feed.revealed < 1:
+        time.sleep(0.01)
+    entries = json.loads(live_mod.ENTRIES.read_text(encoding='utf8'))
+    live = live_mod.LiveSeason(SEASON, {}, live_mod.SlugMap({}, entries))
+    source = ErgastSource([base], transport=urllib_transport, hedge=False)
+    return feed, live, live_mod.ConditionalFeed(source)
+
+def apply(state, delta):
+    for kind in live_mod.KINDS:
+        for slug, diff in delta.get(kind, {}).items():
+            row = state.setdefault(kind, {}).setdefault(slug, {'season': {}, 'allTime': {}})
+            for part in ('season', 'allTime'):
+                row[part].update(diff.get(part, {}))
+    state['round'] = delta['round']
+
+def test_deltas_replay_to_the_published_state(replay):
+    feed, live, conditional = replay
+    assert live_mod.poll(live, conditional)
+    state = {}
+    apply(state, live.changes())
+    assert state['round'] == 1
+
+    requests, not_modified = conditional.requests, conditional.not_modified
+    assert not live_mod.poll(live, conditional)
+    assert conditional.not_modified - not_modified == conditional.requests - requests == 5
+    assert live.changes() is None
+
+    feed.revealed = 2
+    assert live_mod.poll(live, conditional)
+    delta = live.changes()
+    assert delta['round'] == 2
+    # only changed fields go out: nobody changed team, so no row resends it
+    assert all('team' not in d.get('season', {}) for d in delta['drivers'].values())
+    apply(state, delta)
+    assert state == {'round': 2, **{k: v for k, v in live.state().items() if k in live_mod.KINDS}}
+
+    table = feed.standings(2, 'drivers')['MRData']['StandingsTable']['StandingsLists'][0]['DriverStandings']
+    for row in table:
+        slug = live.slugs.driver(row['Driver']['driverId'].replace('_', '-'))
+        assert state['drivers'][slug]['season']['points'] == float(row['points'])
+        assert state['drivers'][slug]['season']['position'] == int(row['position'])
+
+async def read_frame(reader):
+    block = (await asyncio.wait_for(reader.readuntil(b'\n\n'), 5)).decode()
+    fields = dict(line.split(': ', 1) for line in block.strip().split('\n') if ': ' in line)
+    return fields.get('id'), fields.get('event'), json.loads(fields['data']) if 'data' in fields else None
+
+async def connect(port, last_id=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    head = 'GET /live HTTP/1.1\r\nHost: x\r\n' + (f'Last-Event-ID: {last_id}\r\n' if last_id is not None else '')
+    writer.write((head + '\r\n').encode())
+    await reader.readuntil(b'\r\n\r\n')
+    assert await reader.readuntil(b'\n\n') == b'retry: 5000\n\n'
+    return reader, writer
+
+def test_reconnect_catches_up_from_last_event_id(replay):
+    feed, live, conditional = replay
+
+    async def run():
+        hub = live_mod.Hub(backlog=2)
+        server = await asyncio.start_server(partial(live_mod.handle, hub, live, conditional), '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            live_mod.poll(live, conditional)
+            hub.publish('delta', live.changes())
+            reader, writer = await connect(port)
+            assert await read_frame(reader) == ('1', 'state', live.state())
+
+            for rnd in (2, 3):
+                feed.revealed = rnd
+                live_mod.poll(live, conditional)
+                hub.publish('delta', live.changes())
+            seq, event, data = await read_frame(reader)
+            assert (seq, event, data['round']) == ('2', 'delta', 2)
+            writer.close()
+
+            # missed only event 3, which is still kept: just that delta
+            reader, writer = await connect(port, 2)
+            seq, event, data = await read_frame(reader)
+            assert (seq, event, data['round']) == ('3', 'delta', 3)
+            writer.close()
+
+            # event 1 fell out of the two-event backlog, so a client that saw none gets a fresh state
+            reader, writer = await connect(port, 0)
+            assert await read_frame(reader) == ('3', 'state', live.state())
+            writer.close()
+
+            # an id from before a server restart is ahead of this hub: fresh state too
+            reader, writer = await connect(port, 99)
+            assert (await read_frame(reader))[1] == 'state'
+            writer.close()
+
+    asyncio.run(run())
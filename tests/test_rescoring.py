@@ -0,0 +1,86 @@
+import argparse
+import json
+import random
+
+import pytest
+
+import rescoring
+from pipeline_io import write_json
+from stats_model import StatsModel
+
+DRIVERS = {'max_verstappen': 'red_bull', 'perez': 'red_bull', 'hamilton': 'mercedes', 'russell': 'mercedes',
+           'leclerc': 'ferrari', 'sainz': 'ferrari', 'norris': 'mclaren', 'piastri': 'mclaren',
+           'alonso': 'aston_martin', 'stroll': 'aston_martin', 'gasly': 'alpine', 'ocon': 'alpine'}
+
+def cache(ergast_dir, seed=3):
+    rng = random.Random(seed)
+    rows = []
+    for year in (2003, 2010, 2023):
+        races = []
+        for rnd in range(1, 9):
+            order = sorted(DRIVERS, key=lambda d: rng.random())
+            fastest = rng.randrange(len(order))
+            results = []
+            for i, d in enumerate(order):
+                text = str(i + 1) if rng.random() > 0.15 else rng.choice(['R', 'D', 'W'])
+                row = {'position': str(i + 1), 'positionText': text, 'points': '0',
+                       'Driver': {'driverId': d}, 'Constructor': {'constructorId': DRIVERS[d]}}
+                if i == fastest:
+                    row['FastestLap'] = {'rank': '1'}
+                results.append(row)
+                rows.append((d, DRIVERS[d], int(text) if text.isdigit() else 0, i == fastest))
+            races.append({'season': str(year), 'round': str(rnd), 'Results': results})
+        write_json(ergast_dir / f'ergast_{year}_results.json', {'MRData': {'RaceTable': {'Races': races}}})
+    return rows
+
+def brute_force(rows, system, kind):
+    points = system['points']
+    bonus, top = system.get('fastestLap') or 0, system.get('fastestLapTop')
+    out = {}
+    for d, c, pos, fastest in rows:
+        slug = (d if kind == 'drivers' else c).replace('_', '-')
+        pts = points[pos - 1] if 0 < pos <= len(points) else 0
+        if fastest and pos and (top is None or pos <= top):
+            pts += bonus
+        total, races = out.get(slug, (0.0, 0))
+        out[slug] = (total + pts, races + 1)
+    return out
+
+def test_rescore_matches_row_by_row_sums(tmp_path):
+    rows = cache(tmp_path)
+    drivers, teams, races = rescoring.load_results(ergast_dir=tmp_path)
+    assert races == 24
+    custom = dict([rescoring.parse_system('top3-fl=5,3,1+2/3'), rescoring.parse_system('wins-only=1')])
+    for system in {**rescoring.SYSTEMS, **custom}.values():
+        for kind, columns in (('drivers', drivers), ('teams', teams)):
+            got = rescoring.rescore(columns, system)
+            want = brute_force(rows, system, kind)
+            assert got.keys() == want.keys()
+            for slug, (pts, n) in want.items():
+                assert got[slug] == (pytest.approx(pts), n)
+
+def test_parse_system():
+    assert rescoring.parse_system('mine=25,18,15+1/10') == (
+        'mine', {'points': [25.0, 18.0, 15.0], 'fastestLap': 1.0, 'fastestLapTop': 10})
+    for bad in ('=25,18', 'mine=', 'mine=a,b', 'mine=25+x'):
+        with pytest.raises(argparse.ArgumentTypeError):
+            rescoring.parse_system(bad)
+
+def test_build_writes_leaderboards_and_normalized_totals(tmp_path):
+    rows = cache(tmp_path)
+    model = StatsModel.from_dict({'driverStats': {'hamilton': {'bySeason': {}}, 'retired': {'bySeason': {}}},
+                                  'teamStats': {'mercedes': {'bySeason': {}}}})
+    out = tmp_path / 'leaderboards.json'
+    changed = rescoring.build(model, out=out, ergast_dir=tmp_path, top=5)
+    assert changed == {'drivers': 1, 'teams': 1}
+    boards = json.loads(out.read_text(encoding='utf8'))
+    want = brute_force(rows, rescoring.SYSTEMS['f1-2010'], 'drivers')
+    leader = min(want, key=lambda s: (-want[s][0], s))
+    assert boards['races'] == 24 and len(boards['drivers']['f1-2010']) == 5
+    assert boards['drivers']['f1-2010'][0]['slug'] == leader
+    pts, n = want['hamilton']
+    assert model.drivers['hamilton'].extra['allTimeNormalized'] == {
+        'system': 'f1-2010', 'points': rescoring._points(pts), 'races': n, 'perRace': round(pts / n, 3)}
+    assert not (model.drivers['retired'].extra or {}).get('allTimeNormalized')
+    # a second build over the same results changes nothing
+    assert rescoring.build(model, out=out, ergast_dir=tmp_path) == {'drivers': 0, 'teams': 0}
@@ -0,0 +1,47 @@
+import json
+import random
+
+import search_index
+from search_index import SearchIndex, fold
+
+def items(n=300, seed=5):
+    rng = random.Random(seed)
+    syllables = ['ver', 'sta', 'ppen', 'ham', 'il', 'ton', 'le', 'clerc', 'no', 'rris', 'al', 'on', 'so']
+    out = []
+    for i in range(n):
+        name = ' '.join(''.join(rng.choice(syllables) for _ in range(rng.randint(1, 3))).capitalize()
+                        for _ in range(rng.randint(1, 2)))
+        out.append((float(rng.randint(0, 50)), f'{name} {i}', rng.choice('dtc'), str(i), search_index.terms(name)))
+    return out
+
+def brute_force(ranked, prefix, k):
+    return [i for i, it in enumerate(ranked) if any(t.startswith(prefix) for t in it[4])][:k]
+
+def test_lookups_match_brute_force():
+    raw = items()
+    data = json.loads(json.dumps(search_index.build(raw, k=5)))
+    assert data['w'] == 2
+    index = SearchIndex(data)
+    ranked = sorted(raw, key=lambda it: (-it[0], it[2], it[1]))
+    prefixes = {t[:n] for it in raw for t in it[4] for n in range(1, len(t) + 1)}
+    prefixes |= {'x', 'verx', 'hamiltonx', 'zz'}
+    for p in sorted(prefixes):
+        expected = brute_force(ranked, p, 5)
+        assert index.ids(p) == expected, p
+        assert index.lookup(p) == [(it[1], it[2], it[3]) for it in (ranked[i] for i in expected)]
+
+def test_queries_are_folded_and_names_match_across_words():
+    index = SearchIndex(search_index.build([
+        (100.0, 'Nico Hülkenberg', 'd', 'haas/nico-hulkenberg', search_index.terms('Nico Hülkenberg')),
+        (300.0, 'Max Verstappen', 'd', 'red-bull/max-verstappen', search_index.terms('Max Verstappen')),
+        (0.0, 'Circuit Zandvoort — Zandvoort', 'c', 14, search_index.terms('Circuit Zandvoort')),
+    ]))
+    assert fold('Hülk') == 'hulk'
+    assert [label for label, _, _ in index.lookup('HÜLK')] == ['Nico Hülkenberg']
+    assert [label for label, _, _ in index.lookup('max verst')] == ['Max Verstappen']
+    assert [label for label, _, _ in index.lookup('verst')] == ['Max Verstappen']
+    # ranked by weight: Verstappen before Hülkenberg before the circuit
+    assert [label for label, _, _ in index.lookup('')] == ['Max Verstappen', 'Nico Hülkenberg',
+                                                           'Circuit Zandvoort — Zandvoort']
+    assert index.lookup('maxh') == []
+    assert SearchIndex.href(index.lookup('max')[0]) == 'teams/red-bull/drivers/max-verstappen.html'
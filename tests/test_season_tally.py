@@ -0,0 +1,29 @@
+import fetch_stats_ergast as fse
+
+def row(driver, ctor, pos, points, fastest=False):
+    r = {'position': str(pos), 'points': str(points), 'status': 'Finished',
+         'Driver': {'driverId': driver}, 'Constructor': {'constructorId': ctor, 'name': ctor.title()}}
+    if fastest:
+        r['FastestLap'] = {'rank': '1'}
+    return r
+
+RACES = [
+    {'season': '2025', 'round': '1', 'Results': [row('norris', 'mclaren', 1, 25, fastest=True), row('piastri', 'mclaren', 2, 18)]},
+    {'season': '2025', 'round': '2', 'Results': [row('piastri', 'mclaren', 1, 25), row('max_verstappen', 'red_bull', 2, 18, fastest=True)]},
+]
+SPRINTS = [{'season': '2025', 'round': '2', 'SprintResults': [row('max_verstappen', 'red_bull', 1, 8)]}]
+
+def test_season_rows_reach_merged_stats():
+    per_driver, per_team = fse.season_rows()
+    driver_rows, team_rows = fse.tally_results('2025', [(False, RACES, 'Results'), (True, SPRINTS, 'SprintResults')],
+                                               per_driver, per_team, {}, {})
+    assert driver_rows['max-verstappen'] == [18.0, 8.0]
+    assert team_rows['mclaren'] == [68.0, 0.0]
+
+    drivers, teams = {}, {}
+    fse.merge_season(drivers, teams, '2025', per_driver, per_team)
+    assert teams['mclaren']['bySeason']['2025']['fastestLaps'] == 1
+    assert teams['red-bull']['bySeason']['2025']['fastestLaps'] == 1
+    ver = drivers['max-verstappen']['bySeason']['2025']
+    assert (ver['wins'], ver['races'], ver['fastestLaps']) == (0, 1, 1)
+    assert drivers['piastri']['bySeason']['2025']['wins'] == 1
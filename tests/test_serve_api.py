@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+import f1stats
+import serve_api
+import stats_binary
+from stats_model import StatsModel
+
+STATS = {
+    'seasons': [2024, 2025],
+    'driverStats': {
+        'vet': {'bySeason': {'2024': {'team': 'Haas', 'points': 10, 'wins': 1, 'position': 5},
+                             '2025': {'team': 'Haas', 'points': 4.5, 'position': 12}},
+                'allTime': {'points': 14.5}},
+        'mate': {'bySeason': {'2024': {'team': 'Haas', 'points': 12, 'position': 4},
+                              '2025': {'team': 'Haas', 'points': 8, 'position': 9}}},
+    },
+    'teamStats': {'haas': {'bySeason': {'2024': {'points': 22, 'wins': 1}, '2025': {'points': 12.5}}}},
+}
+
+@pytest.fixture
+def stats_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(f1stats, 'ENTRIES', tmp_path / 'missing.json')
+    path = tmp_path / 'stats.json'
+    path.write_text(json.dumps(STATS), encoding='utf8')
+    return path
+
+def _snapshot(stats_path):
+    bin_path = stats_path.with_suffix('.bin')
+    stats_binary.write(StatsModel.load(stats_path), bin_path)
+    return bin_path
+
+def test_binary_snapshot_answers_like_the_model(stats_path):
+    _snapshot(stats_path)
+    gen = serve_api.load(stats_path)
+    assert gen.binary is not None
+    for path in ('/api/drivers/vet', '/api/drivers/mate', '/api/teams/haas/seasons/2024',
+                 '/api/teams/haas/seasons/2025', '/api/teams/haas/seasons/1999'):
+        assert serve_api.route(gen.db, path, {}, gen.binary) == serve_api.route(gen.db, path, {})
+    for path in ('/api/drivers/nobody', '/api/teams/nobody/seasons/2024'):
+        with pytest.raises(serve_api.ApiError) as e:
+            serve_api.route(gen.db, path, {}, gen.binary)
+        assert e.value.status == 404
+
+def test_stale_or_missing_snapshot_is_ignored(stats_path):
+    assert serve_api.load(stats_path).binary is None
+    bin_path = _snapshot(stats_path)
+    st = os.stat(stats_path)
+    os.utime(bin_path, ns=(st.st_atime_ns, st.st_mtime_ns - 10 ** 9))
+    assert serve_api.load(stats_path).binary is None
+
+@pytest.fixture
+def server(stats_path):
+    srv = serve_api.ApiServer(('127.0.0.1', 0), stats_path)
+    srv.quiet = True
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+def get(srv, path, etag=None):
+    req = urllib.request.Request(f'http://127.0.0.1:{srv.server_address[1]}{path}',
+                                 headers={'If-None-Match': etag} if etag else {})
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, resp.headers.get('ETag'), resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get('ETag'), e.read()
+
+def test_routes(server):
+    status, _, body = get(server, '/api/drivers/vet')
+    assert status == 200
+    assert json.loads(body)['bySeason']['2024']['wins'] == 1
+    doc = json.loads(get(server, '/api/teams/haas/seasons/2025')[2])
+    assert [d['slug'] for d in doc['drivers']] == ['mate', 'vet']
+    assert doc['stats'] == {'points': 12.5}
+    doc = json.loads(get(server, '/api/leaderboard?metric=points&start=2024&end=2025')[2])
+    assert [(r['slug'], r['points']) for r in doc['rows']] == [('mate', 20), ('vet', 14.5)]
+    assert get(server, '/api/drivers/nobody')[0] == 404
+    assert get(server, '/api/leaderboard?metric=titles')[0] == 400
+    assert get(server, '/api/teams/haas/seasons/latest')[0] == 400
+
+def test_etag_gives_304(server):
+    status, etag, body = get(server, '/api/drivers/mate')
+    assert status == 200 and etag and body
+    assert get(server, '/api/drivers/mate', etag)[:2] == (304, etag)
+    assert get(server, '/api/drivers/vet', etag)[0] == 200
+
+def test_replaced_stats_file_is_served_on_next_request(server, stats_path):
+    status, etag, _ = get(server, '/api/drivers/mate')
+    changed = json.loads(json.dumps(STATS))
+    changed['driverStats']['mate']['bySeason']['2025']['points'] = 30
+    tmp = stats_path.with_name('stats.json.tmp')
+    tmp.write_text(json.dumps(changed), encoding='utf8')
+    os.replace(tmp, stats_path)
+    status, new_etag, body = get(server, '/api/drivers/mate', etag)
+    assert status == 200 and new_etag != etag
+    assert json.loads(body)['bySeason']['2025']['points'] == 30
+
+def test_broken_replacement_keeps_previous_data(server, stats_path):
+    stats_path.write_text('{', encoding='utf8')
+    status, _, body = get(server, '/api/drivers/vet')
+    assert status == 200
+    assert json.loads(body)['bySeason']['2025']['points'] == 4.5
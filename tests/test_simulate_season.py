@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+import simulate_season
+
+def _run(tmp_path, jobs, seed=11):
+    doc = simulate_season.simulate(3_000, seed=seed, jobs=jobs, after_round=10,
+                                   out=tmp_path / f'simulation-{jobs}-{seed}.json')
+    doc.pop('generated')
+    return doc
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # several chunks, so jobs > 1 really fans out over the process pool
+    monkeypatch.setattr(simulate_season, 'CHUNK', 1_000)
+
+def test_output_independent_of_jobs(tmp_path, small_chunks):
+    serial = _run(tmp_path, 1)
+    assert serial == _run(tmp_path, 2) == _run(tmp_path, 3)
+    assert serial['remainingRounds'] and serial['afterRound'] == 10
+
+def test_seed_changes_output(tmp_path, small_chunks):
+    assert _run(tmp_path, 1)['drivers'] != _run(tmp_path, 1, seed=12)['drivers']
+
+def test_probabilities_are_distributions(tmp_path, small_chunks):
+    doc = _run(tmp_path, 1)
+    for kind in ('drivers', 'teams'):
+        rows = doc[kind]
+        assert sum(r['title'] for r in rows) == pytest.approx(1, abs=1e-3)
+        for r in rows:
+            assert sum(r['positions']) == pytest.approx(1, abs=1e-3)
+
+def test_sprint_weekends_are_simulated(tmp_path, small_chunks, monkeypatch):
+    cal = json.loads(simulate_season.CALENDAR.read_text(encoding='utf8'))
+    assert {r['round'] for r in cal['races'] if r.get('sprint')} >= {18}
+    monkeypatch.setattr(simulate_season, 'ERGAST_DIR', tmp_path)
+
+    def expected(path):
+        monkeypatch.setattr(simulate_season, 'CALENDAR', path)
+        doc = simulate_season.simulate(2_000, seed=11, jobs=1, after_round=17, out=tmp_path / 'out.json')
+        return doc, sum(r['expectedPoints'] for r in doc['drivers'])
+
+    with_sprints, total = expected(simulate_season.CALENDAR)
+    assert with_sprints['sprintRounds'] == [18]
+    plain = tmp_path / 'calendar.json'
+    plain.write_text(json.dumps({'races': [{k: v for k, v in r.items() if k != 'sprint'} for r in cal['races']]}),
+                     encoding='utf8')
+    without, total_without = expected(plain)
+    assert without['sprintRounds'] == []
+    assert total > total_without
@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import stats_binary
+from stats_binary import BinaryStats
+from stats_model import StatsModel
+
+STATS = Path(__file__).resolve().parents[1] / 'data' / 'stats.json'
+
+def _snapshot(tmp_path):
+    raw = json.loads(STATS.read_text(encoding='utf8'))
+    path = tmp_path / 'stats.bin'
+    stats_binary.write(StatsModel.from_dict(raw), path)
+    return raw, path
+
+def test_to_dict_matches_stats_json(tmp_path):
+    raw, path = _snapshot(tmp_path)
+    with BinaryStats(path) as snap:
+        assert snap.to_dict() == raw
+
+def test_lookups_match_model(tmp_path):
+    raw, path = _snapshot(tmp_path)
+    model = StatsModel.from_dict(raw)
+    with BinaryStats(path) as snap:
+        for kind, group in (('drivers', raw['driverStats']), ('teams', raw['teamStats'])):
+            assert sorted(snap.slugs(kind)) == sorted(group)
+            for slug, ent in group.items():
+                assert snap.entity(kind, slug) == ent
+                for year, rec in (ent.get('bySeason') or {}).items():
+                    if year.isdigit() and isinstance(rec, dict):
+                        assert snap.season(kind, slug, year) == rec
+        slug = next(iter(model.drivers))
+        assert snap.vector('drivers', slug, 'points') == model.drivers[slug].vector('points')
+        assert snap.driver('no-such-driver') is None
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'stats.bin'
+    path.write_bytes(b'\0' * 256)
+    with pytest.raises(ValueError):
+        BinaryStats(path)
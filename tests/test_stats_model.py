@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+
+from stats_model import StatsModel
+
+STATS = Path(__file__).resolve().parents[1] / 'data' / 'stats.json'
+
+def test_round_trip_matches_stats_json():
+    raw = json.loads(STATS.read_text(encoding='utf8'))
+    assert StatsModel.from_dict(raw).to_dict() == raw
+
+def test_save_and_load(tmp_path):
+    raw = json.loads(STATS.read_text(encoding='utf8'))
+    out = tmp_path / 'stats.json'
+    StatsModel.from_dict(raw).save(out)
+    assert json.loads(out.read_text(encoding='utf8')) == raw
+    assert StatsModel.load(out).to_dict() == raw
+
+def test_key_order_is_normalized():
+    d = {'teamStats': {}, 'drivers': {'x': {}}, 'seasons': [2024],
+         'driverStats': {'a': {'bySeason': {'2024_f2': {}, '2024': {'note': 1, 'points': 2}, '2023': {}},
+                               'name': 'A'}}}
+    out = StatsModel.from_dict(d).to_dict()
+    assert out == d
+    assert list(out) == ['seasons', 'driverStats', 'teamStats', 'drivers']
+    assert list(out['driverStats']['a']) == ['name', 'bySeason']
+    assert list(out['driverStats']['a']['bySeason']) == ['2023', '2024', '2024_f2']
+    assert list(out['driverStats']['a']['bySeason']['2024']) == ['points', 'note']
+
+def test_fix_keeps_top_level_extras(tmp_path, monkeypatch):
+    import fix_stats
+    src = json.loads(STATS.read_text(encoding='utf8'))
+    src['drivers'] = {'max-verstappen': {'givenName': 'Max', 'familyName': 'Verstappen', 'code': 'VER'}}
+    inp = tmp_path / 'stats.generated.json'
+    inp.write_text(json.dumps(src), encoding='utf8')
+    monkeypatch.setattr(fix_stats, 'OUT', tmp_path / 'stats.fixed.json')
+    monkeypatch.setattr(fix_stats, 'snapshot', lambda *a, **k: None)
+    fix_stats.main(['--input', str(inp)])
+    out = json.loads((tmp_path / 'stats.fixed.json').read_text(encoding='utf8'))
+    assert out['drivers'] == src['drivers']
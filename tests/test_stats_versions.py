@@ -0,0 +1,49 @@
+import copy
+import json
+from pathlib import Path
+
+import stats_versions
+from pipeline_io import read_cached_json
+from stats_versions import apply_patch, diff
+
+STATS = Path(__file__).resolve().parents[1] / 'data' / 'stats.json'
+
+def _edited(doc):
+    new = copy.deepcopy(doc)
+    slug, driver = next(iter(new['driverStats'].items()))
+    year = next(iter(driver['bySeason']))
+    driver['bySeason'][year]['points'] = 999
+    del new['driverStats'][next(reversed(new['driverStats']))]
+    new['teamStats']['a/b~c'] = {'bySeason': {}}
+    new['seasons'] = new['seasons'][:-1]
+    return new
+
+def test_diff_apply_round_trip():
+    old = json.loads(STATS.read_text(encoding='utf8'))
+    new = _edited(old)
+    ops = diff(old, new)
+    assert ops
+    assert apply_patch(copy.deepcopy(old), ops) == new
+    assert diff(old, copy.deepcopy(old)) == []
+
+def test_root_replace():
+    assert apply_patch({'a': 1}, diff({'a': 1}, [1])) == [1]
+
+def test_publish_patches_apply_to_old_versions(tmp_path, monkeypatch):
+    monkeypatch.setattr(stats_versions, 'MANIFEST', tmp_path / 'stats-version.json')
+    monkeypatch.setattr(stats_versions, 'PATCH_DIR', tmp_path / 'patches')
+    monkeypatch.setattr(stats_versions, 'VERSION_DIR', tmp_path / 'versions')
+    stats = tmp_path / 'stats.json'
+    original = json.loads(STATS.read_text(encoding='utf8'))
+    stats.write_text(json.dumps(original), encoding='utf8')
+
+    assert stats_versions.publish(stats) == 1
+    assert stats_versions.publish(stats) == 1  # unchanged content keeps its version
+    stats.write_text(json.dumps(_edited(original)), encoding='utf8')
+    assert stats_versions.publish(stats) == 2
+
+    manifest = json.loads((tmp_path / 'stats-version.json').read_text(encoding='utf8'))
+    assert manifest['version'] == 2 and list(manifest['patches']) == ['1']
+    ops = json.loads((tmp_path / 'patches' / Path(manifest['patches']['1']).name).read_text(encoding='utf8'))
+    v1 = read_cached_json(stats_versions.snapshot_path(1))
+    assert apply_patch(v1, ops) == json.loads(stats.read_text(encoding='utf8'))
@@ -0,0 +1,63 @@
+import json
+import random
+
+import streaks
+from pipeline_io import write_json
+
+DRIVERS = {'max_verstappen': 'red_bull', 'perez': 'red_bull', 'hamilton': 'mercedes',
+           'russell': 'mercedes', 'leclerc': 'ferrari', 'sainz': 'ferrari'}
+POINTS = [25, 18, 15, 12, 10, 8]
+
+def season(year, rounds, rng):
+    races = []
+    for rnd in range(1, rounds + 1):
+        order = sorted(DRIVERS, key=lambda d: rng.random())
+        races.append({'season': str(year), 'round': str(rnd), 'Results': [
+            {'position': str(i + 1), 'points': str(POINTS[i]),
+             'status': rng.choice(['Finished', 'Finished', '+1 Lap', 'Engine']),
+             'Driver': {'driverId': d}, 'Constructor': {'constructorId': DRIVERS[d]}}
+            for i, d in enumerate(order)]})
+    return {'MRData': {'RaceTable': {'season': str(year), 'Races': races}}}
+
+def payloads():
+    rng = random.Random(7)
+    return {year: season(year, 12, rng) for year in (2023, 2024, 2025)}
+
+def cache(ergast_dir, year, payload):
+    write_json(ergast_dir / f'ergast_{year}_results.json', payload)
+
+def test_incremental_matches_full_build(tmp_path):
+    seasons = payloads()
+    full_dir, inc_dir = tmp_path / 'full', tmp_path / 'inc'
+    for year, payload in seasons.items():
+        cache(full_dir, year, payload)
+    full = streaks.compute(seasons, full=True, state_file=full_dir / 'state.json', ergast_dir=full_dir)
+
+    # the incremental run starts mid-2024 and folds in the rest round by round
+    cache(inc_dir, 2023, seasons[2023])
+    races = seasons[2024]['MRData']['RaceTable']['Races']
+    cache(inc_dir, 2024, {'MRData': {'RaceTable': {'Races': races[:5]}}})
+    state = inc_dir / 'state.json'
+    streaks.compute([2023, 2024], state_file=state, ergast_dir=inc_dir)
+    for n in (6, 12):
+        cache(inc_dir, 2024, {'MRData': {'RaceTable': {'Races': races[:n]}}})
+        streaks.compute(seasons, state_file=state, ergast_dir=inc_dir)
+    cache(inc_dir, 2025, seasons[2025])
+    incremental = streaks.compute(seasons, state_file=state, ergast_dir=inc_dir)
+
+    assert incremental == full
+    assert full['lastRace'] == '2025-12'
+    assert json.loads(state.read_text(encoding='utf8')) == json.loads((full_dir / 'state.json').read_text(encoding='utf8'))
+
+def test_streak_bounds():
+    keys = [202401, 202402, 202403, 202404, 202405]
+    flags = [streaks.BITS['wins'], streaks.BITS['wins'], 0, streaks.BITS['wins'], streaks.BITS['wins']]
+    full = streaks.streaks_from_sequence(keys, flags)['wins']
+    pushed = streaks.Streak()
+    for k, f in zip(keys, flags):
+        pushed.push(f, k)
+    assert full.to_list() == pushed.to_list() == [2, 202404, 2, 202401, 202402, 202405]
+    assert full.to_record() == {'current': 2, 'best': 2, 'bestFrom': '2024-1', 'bestTo': '2024-2'}
+
+def test_no_cached_results(tmp_path):
+    assert streaks.compute([2024], state_file=tmp_path / 'state.json', ergast_dir=tmp_path) is None
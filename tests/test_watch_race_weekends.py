@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import watch_race_weekends as watch
+from pipeline_io import write_cache_stream
+
+def cache_rounds(ergast_dir, season, rounds):
+    payload = {'MRData': {'RaceTable': {'season': str(season),
+                                        'Races': [{'season': str(season), 'round': str(r)} for r in rounds]}}}
+    write_cache_stream(ergast_dir / f'ergast_{season}_results.json', [json.dumps(payload).encode('utf8')], collect=False)
+
+def test_fetched_round(tmp_path):
+    assert watch.fetched_round(2026, tmp_path) == 0
+    cache_rounds(tmp_path, 2026, [1, 2, 4])
+    assert watch.fetched_round(2026, tmp_path) == 4
+
+def test_round_is_published_once_without_rerunning_post_process(tmp_path, monkeypatch):
+    yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime('%Y-%m-%d')
+    calendar = tmp_path / 'calendar.json'
+    calendar.write_text(json.dumps({'season': 2026, 'races': [
+        {'round': 1, 'date': '2026-03-08'}, {'round': 2, 'date': yesterday}]}), encoding='utf8')
+    monkeypatch.setattr(watch, 'CALENDAR', calendar)
+    monkeypatch.setattr(watch, 'STATE', tmp_path / 'watch-state.json')
+    monkeypatch.setattr(watch.time, 'sleep', lambda s: None)
+    fetched_round = watch.fetched_round
+    monkeypatch.setattr(watch, 'fetched_round', lambda season: fetched_round(season, tmp_path))
+
+    # the calendar's first round was cancelled, so Ergast reports its round 2 as round 1;
+    # the first refresh hits a mirror that has not caught up yet
+    refreshes, processed = [], []
+
+    def update_seasons(seasons):
+        refreshes.append(seasons)
+        cache_rounds(tmp_path, 2026, [1] if len(refreshes) > 1 else [])
+    monkeypatch.setattr(watch, 'poll_round', lambda season, rnd, interval, deadline, date: 1)
+    monkeypatch.setattr(watch, 'update_seasons', update_seasons)
+    monkeypatch.setattr(watch, 'post_process', processed.append)
+
+    watch.main(['--once', '--after-hours', '0'])
+    assert len(refreshes) == 2 and len(processed) == 1
+    assert json.loads((tmp_path / 'watch-state.json').read_text(encoding='utf8'))['round'] == 2
+
+def test_poll_accepts_a_renumbered_round(monkeypatch):
+    class Source:
+        def request(self, path, per_mirror=None):
+            body = {'MRData': {'RaceTable': {'season': '2026', 'round': '4',
+                                             'Races': [{'round': '4', 'date': '2026-05-03'}]}}}
+            return type('M', (), {'base': 'http://a'})(), 200, {'ETag': '"x"'}, json.dumps(body).encode()
+    monkeypatch.setattr(watch, 'default_source', Source)
+    deadline = datetime.now(timezone.utc) + timedelta(seconds=5)
+    assert watch.poll_round(2026, 5, 0, deadline, date='2026-05-03') == 4